@@ -0,0 +1,37 @@
+"""Minimal Django configuration shared by the benchmark scripts.
+
+Run the scripts from the repository root, e.g.:
+
+    python benchmarks/select_widget.py
+"""
+
+import os
+import sys
+import timeit
+
+import django
+from django.conf import settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def setup(**extra):
+    if not settings.configured:
+        options = dict(
+            SECRET_KEY="benchmarks",
+            INSTALLED_APPS=["django_enumfield", "django_enumfield.tests"],
+            DATABASES={
+                "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+            },
+            USE_I18N=True,
+        )
+        options.update(extra)
+        settings.configure(**options)
+    django.setup()
+
+
+def bench(label, func, number=10, repeat=5):
+    """Print the best time of repeat runs of calling func number times."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print("{:<48} {:>10.3f} ms".format(label, best * 1000))
+    return best
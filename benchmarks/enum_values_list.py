@@ -0,0 +1,65 @@
+"""Compare fetching the EnumField values of many rows with enum_values_list(),
+values_list() and model instances.
+"""
+
+import _setup
+
+_setup.setup()
+
+from django.core.management import call_command  # noqa: E402
+
+from django_enumfield.tests.models import Job, JobStatus  # noqa: E402
+
+ROWS = 50000
+CHUNK_SIZE = 2000
+FIELDS = ("pk", "status", "result", "previous")
+
+
+def fill():
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    members = list(JobStatus)
+    Job.objects.bulk_create(
+        [
+            Job(
+                status=members[i % 4],
+                result=members[i % 3],
+                previous=members[i % 2],
+            )
+            for i in range(ROWS)
+        ],
+        batch_size=5000,
+    )
+
+
+if __name__ == "__main__":
+    fill()
+    queryset = Job.objects.order_by("pk")
+    results = {}
+    for label, fetch in (
+        (
+            "model instances",
+            lambda: [
+                (job.pk, job.status, job.result, job.previous)
+                for job in queryset.only(*FIELDS).iterator(chunk_size=CHUNK_SIZE)
+            ],
+        ),
+        (
+            "values_list()",
+            lambda: list(queryset.values_list(*FIELDS).iterator(chunk_size=CHUNK_SIZE)),
+        ),
+        (
+            "enum_values_list()",
+            lambda: list(
+                queryset.enum_values_list(*FIELDS).iterator(chunk_size=CHUNK_SIZE)
+            ),
+        ),
+    ):
+        results[label] = _setup.bench(
+            "{}, {} rows".format(label, ROWS), fetch, number=3
+        )
+    print(
+        "enum_values_list(): {:.0%} of values_list(), {:.0%} of instances".format(
+            results["enum_values_list()"] / results["values_list()"],
+            results["enum_values_list()"] / results["model instances"],
+        )
+    )
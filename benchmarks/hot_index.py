@@ -0,0 +1,91 @@
+"""Compare a partial index of the hot members of an EnumField with a full
+index of the column, in size and lookup time, on SQLite.
+"""
+
+import random
+
+import _setup
+
+_setup.setup()
+
+from django.db import connection, models  # noqa: E402
+
+from django_enumfield.db.fields import EnumField, hot_index  # noqa: E402
+from django_enumfield.tests.models import JobStatus  # noqa: E402
+
+ROWS = 200000
+# 95% of the rows in terminal states
+WEIGHTS = {
+    JobStatus.PENDING: 3,
+    JobStatus.PROCESSING: 2,
+    JobStatus.DONE: 90,
+    JobStatus.FAILED: 5,
+}
+
+
+class UnindexedJob(models.Model):
+    status = EnumField(JobStatus, hot=())
+
+    class Meta:
+        app_label = "tests"
+
+
+class FullIndexJob(models.Model):
+    status = EnumField(JobStatus, hot=(), db_index=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+class HotIndexJob(models.Model):
+    status = EnumField(JobStatus)
+
+    class Meta:
+        app_label = "tests"
+        indexes = [hot_index("status", JobStatus, "hotindexjob_status_hot")]
+
+
+def page_count():
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA page_count")
+        return cursor.fetchone()[0]
+
+
+def fill(model):
+    """Create and fill the table of model, returning the pages it added."""
+    random.seed(0)
+    statuses = random.choices(list(WEIGHTS), weights=list(WEIGHTS.values()), k=ROWS)
+    pages = page_count()
+    with connection.schema_editor() as editor:
+        editor.create_model(model)
+    model.objects.bulk_create(
+        [model(status=status) for status in statuses], batch_size=5000
+    )
+    return page_count() - pages
+
+
+if __name__ == "__main__":
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA page_size")
+        page_size = cursor.fetchone()[0]
+    table_pages = fill(UnindexedJob)
+    results = {}
+    for label, model, lookup in (
+        ("full index", FullIndexJob, {"status": JobStatus.PENDING}),
+        ("hot index", HotIndexJob, {"status__hot": True, "status": JobStatus.PENDING}),
+    ):
+        index_size = (fill(model) - table_pages) * page_size
+        print("{:<48} {:>7.0f} KiB".format(label + " size", index_size / 1024))
+        queryset = model.objects.filter(**lookup).values_list("pk", flat=True)
+        results[label] = (
+            index_size,
+            _setup.bench(
+                "{} lookup of PENDING rows".format(label), lambda: list(queryset.all())
+            ),
+        )
+    full, hot = results["full index"], results["hot index"]
+    print(
+        "hot index size: {:.0%} of full, lookup time: {:.0%} of full".format(
+            hot[0] / full[0], hot[1] / full[1]
+        )
+    )
@@ -0,0 +1,80 @@
+"""Measure startup cost of projects with many Enum classes and EnumFields.
+
+Generates an app with N enums and N / 2 models with two EnumFields each, then
+times django.setup() importing it in a fresh interpreter, with and without the
+system checks that iterate the choices.
+
+    python benchmarks/import_time.py [N]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MEMBERS = 20
+
+CHILD = textwrap.dedent("""
+    import sys, time
+    start = time.perf_counter()
+    import django
+    from django.conf import settings
+    settings.configure(
+        INSTALLED_APPS=["django_enumfield", "bench_app"],
+        DATABASES={{"default": {{"ENGINE": "django.db.backends.sqlite3"}}}},
+    )
+    django.setup()
+    setup = time.perf_counter()
+    if {checks}:
+        from django.core import checks
+        checks.run_checks()
+    done = time.perf_counter()
+    print(setup - start, done - setup)
+    """)
+
+
+def write_app(directory, count):
+    app = os.path.join(directory, "bench_app")
+    os.mkdir(app)
+    open(os.path.join(app, "__init__.py"), "w").close()
+    lines = [
+        "from django.db import models",
+        "from django_enumfield import enum",
+        "",
+    ]
+    for i in range(count):
+        lines.append("class Enum{}(enum.Enum):".format(i))
+        lines.extend("    M{} = {}".format(m, m) for m in range(MEMBERS))
+        lines.append("    __default__ = 0")
+        lines.append("")
+    for i in range(count // 2):
+        lines.append("class Model{}(models.Model):".format(i))
+        lines.append("    a = enum.EnumField(Enum{})".format(2 * i))
+        lines.append("    b = enum.EnumField(Enum{})".format(2 * i + 1))
+        lines.append("")
+    with open(os.path.join(app, "models.py"), "w") as f:
+        f.write("\n".join(lines))
+
+
+def run(directory, checks, repeat=5):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, ROOT]))
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", CHILD.format(checks=checks)], env=env
+        )
+        timings.append([float(value) for value in output.split()])
+    return min(timings)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    with tempfile.TemporaryDirectory() as directory:
+        write_app(directory, count)
+        setup, _ = run(directory, checks=False)
+        _, checks = run(directory, checks=True)
+    print("{} enums, {} models with EnumFields".format(count, count // 2))
+    print("{:<48} {:>10.1f} ms".format("import + django.setup()", setup * 1000))
+    print("{:<48} {:>10.1f} ms".format("system checks", checks * 1000))
@@ -0,0 +1,81 @@
+"""Compare pickles of model instances with five EnumFields, with and without
+EnumPickleMixin.
+"""
+
+import pickle
+
+import _setup
+
+_setup.setup()
+
+from django.db import models  # noqa: E402
+
+from django_enumfield.db.fields import EnumField  # noqa: E402
+from django_enumfield.db.mixins import EnumPickleMixin  # noqa: E402
+from django_enumfield.tests.models import (  # noqa: E402
+    BeerState,
+    BeerStyle,
+    LabelBeer,
+    LampState,
+    PersonStatus,
+)
+
+INSTANCES = 1000
+
+
+class Fields(models.Model):
+    status = EnumField(PersonStatus)
+    style = EnumField(BeerStyle)
+    state = EnumField(BeerState)
+    label = EnumField(LabelBeer)
+    lamp = EnumField(LampState)
+
+    class Meta:
+        abstract = True
+
+
+class PlainOrder(Fields):
+    class Meta:
+        app_label = "tests"
+
+
+class CompactOrder(EnumPickleMixin, Fields):
+    class Meta:
+        app_label = "tests"
+
+
+def make(model):
+    return [
+        model(
+            pk=i,
+            status=PersonStatus.DEAD,
+            style=BeerStyle.STOUT,
+            state=BeerState.EMPTY,
+            label=LabelBeer.TYSKIE,
+            lamp=LampState.ON,
+        )
+        for i in range(INSTANCES)
+    ]
+
+
+if __name__ == "__main__":
+    results = {}
+    for model in (PlainOrder, CompactOrder):
+        instances = make(model)
+        # One pickle per instance, as when caching instances one by one.
+        payloads = [pickle.dumps(i, pickle.HIGHEST_PROTOCOL) for i in instances]
+        size = sum(map(len, payloads)) / INSTANCES
+        print("{:<48} {:>7.0f} bytes/instance".format(model.__name__, size))
+        results[model] = (
+            size,
+            _setup.bench(
+                "{} loads, {} instances".format(model.__name__, INSTANCES),
+                lambda: [pickle.loads(payload) for payload in payloads],
+            ),
+        )
+    plain, compact = results[PlainOrder], results[CompactOrder]
+    print(
+        "size: {:.0%} of plain, load time: {:.0%} of plain".format(
+            compact[0] / plain[0], compact[1] / plain[1]
+        )
+    )
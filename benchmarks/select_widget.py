@@ -0,0 +1,36 @@
+"""Render a 200 row formset of a 200 member enum with forms.Select and with
+the cached EnumSelect widget.
+"""
+
+import _setup
+
+_setup.setup(ENUMFIELD_FAST_SELECT=True)
+
+from django import forms  # noqa: E402
+
+from django_enumfield.enum import Enum  # noqa: E402
+from django_enumfield.forms.fields import EnumChoiceField  # noqa: E402
+from django_enumfield.forms.widgets import EnumSelect  # noqa: E402
+
+Country = Enum("Country", [("COUNTRY_%d" % i, i) for i in range(200)])
+ROWS = 200
+
+
+def make_formset(widget):
+    class RowForm(forms.Form):
+        country = EnumChoiceField(Country, widget=widget)
+
+    formset_class = forms.formset_factory(RowForm, extra=0)
+    return formset_class(initial=[{"country": i % 200} for i in range(ROWS)])
+
+
+def render(widget):
+    formset = make_formset(widget)
+    return lambda: [str(form["country"]) for form in formset]
+
+
+if __name__ == "__main__":
+    assert render(forms.Select)() == render(EnumSelect)()
+    select = _setup.bench("forms.Select, 200 rows", render(forms.Select), number=3)
+    enum_select = _setup.bench("EnumSelect, 200 rows", render(EnumSelect), number=3)
+    print("speedup: {:.1f}x".format(select / enum_select))
@@ -0,0 +1,64 @@
+"""Compare assigning an EnumField several times before saving, as import
+code often does, with each validation mode.
+"""
+
+import _setup
+
+_setup.setup()
+
+from django.db import models  # noqa: E402
+
+from django_enumfield.db.fields import EnumField  # noqa: E402
+from django_enumfield.tests.models import PersonStatus  # noqa: E402
+
+INSTANCES = 1000
+# Valid step by step and as a whole, from the UNBORN default.
+ASSIGNMENTS = (PersonStatus.ALIVE, PersonStatus.DEAD, 2, PersonStatus.DEAD)
+
+
+class StrictRecord(models.Model):
+    status = EnumField(PersonStatus, default=PersonStatus.UNBORN)
+
+    class Meta:
+        app_label = "tests"
+
+
+class DeferredRecord(models.Model):
+    status = EnumField(PersonStatus, default=PersonStatus.UNBORN, validation="deferred")
+
+    class Meta:
+        app_label = "tests"
+
+
+class UnvalidatedRecord(models.Model):
+    status = EnumField(PersonStatus, default=PersonStatus.UNBORN, validation="off")
+
+    class Meta:
+        app_label = "tests"
+
+
+def assign(model):
+    def run():
+        for _ in range(INSTANCES):
+            instance = model()
+            for value in ASSIGNMENTS:
+                instance.status = value
+            # Sent by save(), validates the transition in deferred mode.
+            models.signals.pre_save.send(sender=model, instance=instance)
+
+    return run
+
+
+if __name__ == "__main__":
+    results = {}
+    for model in (StrictRecord, DeferredRecord, UnvalidatedRecord):
+        mode = model._meta.get_field("status").validation
+        results[mode] = _setup.bench(
+            "{}, {} x {} assignments".format(mode, INSTANCES, len(ASSIGNMENTS)),
+            assign(model),
+        )
+    print(
+        "deferred: {:.0%} of strict, off: {:.0%} of strict".format(
+            results["deferred"] / results["strict"], results["off"] / results["strict"]
+        )
+    )
@@ -0,0 +1,116 @@
+"""Admin integration, see EnumFieldListFilter."""
+
+import hashlib
+from typing import Any, Dict, Optional  # noqa: F401
+
+import django
+from django.contrib import admin
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db.models import Count
+from django.utils.encoding import force_str
+from django.utils.translation import gettext_lazy as _
+
+__all__ = ("EnumFieldListFilter",)
+
+
+class EnumFieldListFilter(admin.ChoicesFieldListFilter):
+    """List filter of an EnumField showing the number of rows of every member.
+
+    The counts are fetched with one GROUP BY query over the changelist
+    queryset, without the selection of this filter, and labels come from the
+    per language Enum.label_map(). Set count_cache_timeout on a subclass to
+    cache the counts for that many seconds. Usage:
+
+        class OrderAdmin(admin.ModelAdmin):
+            list_filter = [("status", EnumFieldListFilter)]
+    """
+
+    count_cache_timeout = None  # type: Optional[int]
+    count_cache_alias = DEFAULT_CACHE_ALIAS
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super(EnumFieldListFilter, self).__init__(
+            field, request, params, model, model_admin, field_path
+        )
+        self.request = request
+        self.empty_value_display = model_admin.get_empty_value_display()
+
+    def get_count_queryset(self, changelist):
+        if django.VERSION >= (5, 0):
+            return changelist.get_queryset(
+                self.request, exclude_parameters=self.expected_parameters()
+            )
+        if self.lookup_val is None and self.lookup_val_isnull is None:
+            return changelist.queryset
+        # Filter again without the parameters of this filter.
+        params = changelist.params
+        changelist.params = {
+            key: value
+            for key, value in params.items()
+            if key not in self.expected_parameters()
+        }
+        try:
+            return changelist.get_queryset(self.request)
+        finally:
+            changelist.params = params
+
+    def get_counts(self, changelist):
+        # type: (Any) -> Dict[Optional[int], int]
+        """:return: Number of rows per value, None for NULL"""
+        queryset = (
+            self.get_count_queryset(changelist)
+            .order_by()
+            .values_list(self.field_path)
+            .annotate(count=Count("*"))
+        )
+        key = None
+        if self.count_cache_timeout:
+            sql, params = queryset.query.sql_with_params()
+            key = "enumfield:admin_counts:{}".format(
+                hashlib.sha256(repr((sql, params)).encode("utf-8")).hexdigest()
+            )
+            counts = caches[self.count_cache_alias].get(key)
+            if counts is not None:
+                return counts
+        counts = {
+            None if value is None else int(value): count for value, count in queryset
+        }
+        if key is not None:
+            caches[self.count_cache_alias].set(key, counts, self.count_cache_timeout)
+        return counts
+
+    def is_selected(self, value):
+        if self.lookup_val is None:
+            return False
+        if django.VERSION >= (5, 0):
+            # Every value of the parameter since Django 5.0
+            return str(value) in self.lookup_val
+        return str(value) == self.lookup_val
+
+    def choices(self, changelist):
+        counts = self.get_counts(changelist)
+        yield {
+            "selected": self.lookup_val is None and not self.lookup_val_isnull,
+            "query_string": changelist.get_query_string(
+                remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]
+            ),
+            "display": _("All"),
+        }
+        for value, label in sorted(self.field.enum.label_map().items()):
+            yield {
+                "selected": self.is_selected(value),
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg: value}, [self.lookup_kwarg_isnull]
+                ),
+                "display": "{} ({})".format(force_str(label), counts.get(value, 0)),
+            }
+        if self.field.null:
+            yield {
+                "selected": bool(self.lookup_val_isnull),
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg_isnull: "True"}, [self.lookup_kwarg]
+                ),
+                "display": "{} ({})".format(
+                    force_str(self.empty_value_display), counts.get(None, 0)
+                ),
+            }
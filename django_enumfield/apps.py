@@ -0,0 +1,28 @@
+from django.apps import AppConfig
+from django.conf import settings
+from django.core import checks
+
+
+class EnumFieldConfig(AppConfig):
+    name = "django_enumfield"
+    verbose_name = "Enum field"
+
+    def ready(self):
+        from django_enumfield import instrumentation
+        from django_enumfield.checks import (
+            check_counted_fields,
+            check_entered_at_indexes,
+            check_hot_indexes,
+            check_packed_layouts,
+            check_transition_triggers,
+        )
+
+        # Loads migrations and queries the databases, only run by migrate and
+        # check --database.
+        checks.register(check_transition_triggers, checks.Tags.database)
+        checks.register(check_packed_layouts, checks.Tags.database)
+        checks.register(check_hot_indexes, checks.Tags.models)
+        checks.register(check_entered_at_indexes, checks.Tags.models)
+        checks.register(check_counted_fields, checks.Tags.models)
+
+        instrumentation.configure(getattr(settings, "ENUMFIELD_INSTRUMENTATION", None))
@@ -0,0 +1,266 @@
+from django.core import checks
+from django.db import connections
+
+
+def get_enforced_transitions():
+    """:return: {(app label, model name, field name): transitions} of the last
+    EnforceTransitions operation of every field in migrations
+    """
+    from django.db.migrations.loader import MigrationLoader
+
+    from django_enumfield.db.operations import EnforceTransitions
+
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    # One plan over all leaves, the plan of a later app may include older
+    # migrations of an app.
+    plan = []
+    planned = set()
+    for leaf in loader.graph.leaf_nodes():
+        for key in loader.graph.forwards_plan(leaf):
+            if key not in planned:
+                planned.add(key)
+                plan.append(key)
+    enforced = {}
+    for key in plan:
+        migration = loader.graph.nodes[key]
+        for operation in migration.operations:
+            if isinstance(operation, EnforceTransitions):
+                enforced[
+                    (migration.app_label, operation.model_name, operation.name)
+                ] = operation.transitions
+    return enforced
+
+
+def check_transition_triggers(app_configs=None, databases=None, **kwargs):
+    """Warn when the transitions enforced by the last EnforceTransitions
+    migration operation of an EnumField differ from those of its enum, or
+    when its trigger is missing from one of databases, e.g. after SQLite
+    remade the table. Registered as a database check, since it loads the
+    migrations and queries the databases.
+    """
+    from django.apps import apps
+
+    from django_enumfield.db.operations import EnforceTransitions, normalize_transitions
+
+    app_labels = None
+    if app_configs is not None:
+        app_labels = {app_config.label for app_config in app_configs}
+    errors = []
+    for (app_label, model_name, field_name), transitions in sorted(
+        get_enforced_transitions().items(), key=lambda item: item[0]
+    ):
+        if app_labels is not None and app_label not in app_labels:
+            continue
+        try:
+            model = apps.get_model(app_label, model_name)
+            field = model._meta.get_field(field_name)
+        except LookupError:
+            continue
+        current = normalize_transitions(field.enum.__transitions__)
+        hint = "Add a migration with the operation {!r}.".format(
+            "EnforceTransitions({!r}, {!r}, {!r})".format(
+                model._meta.model_name, field_name, current
+            )
+        )
+        if current != transitions:
+            errors.append(
+                checks.Warning(
+                    "The database trigger of {}.{} enforces outdated transitions "
+                    "of {}.".format(model._meta.label, field_name, field.enum.__name__),
+                    hint=hint,
+                    obj=field,
+                    id="django_enumfield.W001",
+                )
+            )
+        if not transitions:
+            continue
+        operation = EnforceTransitions(model_name, field_name, transitions)
+        for alias in _get_trigger_databases(model, databases):
+            exists = operation.trigger_exists(
+                connections[alias], model._meta.db_table, field.column
+            )
+            if exists is False:
+                errors.append(
+                    checks.Warning(
+                        "The database trigger of {}.{} is missing from database "
+                        "{!r}.".format(model._meta.label, field_name, alias),
+                        hint=hint,
+                        obj=field,
+                        id="django_enumfield.W003",
+                    )
+                )
+    return errors
+
+
+def _get_trigger_databases(model, databases):
+    from django.db import router
+
+    return [
+        alias for alias in databases or () if router.allow_migrate_model(alias, model)
+    ]
+
+
+def check_packed_layouts(app_configs=None, **kwargs):
+    """Fail when the layout of a PackedEnumField differs from the one recorded
+    by its migrations, e.g. after a member was added past the width of its
+    enum, since the stored values would be read with the new layout.
+    Registered as a database check, since it loads the migrations.
+    """
+    from django.apps import apps
+    from django.db.migrations.loader import MigrationLoader
+
+    from django_enumfield.db.packed import PackedEnumField
+
+    if app_configs is None:
+        app_configs = apps.get_app_configs()
+    fields = [
+        field
+        for app_config in app_configs
+        for model in app_config.get_models()
+        for field in model._meta.local_fields
+        if isinstance(field, PackedEnumField)
+    ]
+    if not fields:
+        return []
+    state = MigrationLoader(None, ignore_no_migrations=True).project_state()
+    errors = []
+    for field in fields:
+        opts = field.model._meta
+        model_state = state.models.get((opts.app_label, opts.model_name))
+        migrated = model_state and dict(model_state.fields).get(field.name)
+        if not isinstance(migrated, PackedEnumField):
+            continue
+        if migrated.get_layout() != field.get_layout():
+            errors.append(
+                checks.Error(
+                    "The layout of {}.{} differs from its migrations.".format(
+                        opts.label, field.name
+                    ),
+                    hint="Pin the width of every enum to the migrated layout "
+                    "{!r}, or add a migration altering the field and repacking "
+                    "the stored values.".format(migrated.get_layout()),
+                    obj=field,
+                    id="django_enumfield.E002",
+                )
+            )
+    return errors
+
+
+def _get_local_enum_fields(model):
+    # Fields inherited from a multi-table parent are indexed on its table.
+    from django_enumfield.db.fields import EnumField
+
+    return [
+        field
+        for field in model._meta.local_concrete_fields
+        if isinstance(field, EnumField)
+    ]
+
+
+def check_hot_indexes(app_configs=None, **kwargs):
+    """Warn about EnumFields with hot members but no matching partial index
+    in Meta.indexes, e.g. after Enum.__hot__ changed.
+    """
+    from django.apps import apps
+    from django.core.exceptions import ImproperlyConfigured
+
+    if app_configs is None:
+        models = apps.get_models()
+    else:
+        models = [model for config in app_configs for model in config.get_models()]
+
+    errors = []
+    for model in models:
+        if model._meta.proxy:
+            continue
+        for field in _get_local_enum_fields(model):
+            try:
+                index = field.hot_index(model)
+            except ImproperlyConfigured as error:
+                errors.append(
+                    checks.Error(str(error), obj=field, id="django_enumfield.E001")
+                )
+                continue
+            if index is None or any(
+                existing.fields == index.fields
+                and existing.condition == index.condition
+                for existing in model._meta.indexes
+            ):
+                continue
+            errors.append(
+                checks.Warning(
+                    "{}.{} has hot members {} without a partial index of "
+                    "them.".format(model._meta.label, field.name, field.hot_values),
+                    hint="Add hot_index({!r}, {!r}, {!r}) to Meta.indexes and "
+                    "remove outdated hot indexes.".format(
+                        field.name, field.hot_values, index.name
+                    ),
+                    obj=field,
+                    id="django_enumfield.W002",
+                )
+            )
+    return errors
+
+
+def check_entered_at_indexes(app_configs=None, **kwargs):
+    """Warn about EnumFields declared with track_entered_at=True without an
+    index of (field, <name>_entered_at) in Meta.indexes.
+    """
+    from django.apps import apps
+
+    if app_configs is None:
+        models = apps.get_models()
+    else:
+        models = [model for config in app_configs for model in config.get_models()]
+
+    errors = []
+    for model in models:
+        if model._meta.proxy:
+            continue
+        for field in _get_local_enum_fields(model):
+            index = field.entered_at_index(model)
+            if index is None or any(
+                existing.fields == index.fields for existing in model._meta.indexes
+            ):
+                continue
+            errors.append(
+                checks.Warning(
+                    "{}.{} tracks the time entered without an index of it.".format(
+                        model._meta.label, field.name
+                    ),
+                    hint="Add entered_at_index({!r}, {!r}) to Meta.indexes.".format(
+                        field.name, index.name
+                    ),
+                    obj=field,
+                    id="django_enumfield.W004",
+                )
+            )
+    return errors
+
+
+def check_counted_fields(app_configs=None, **kwargs):
+    """Fail when EnumFields are declared with counted=True but the app
+    keeping the counts is not installed.
+    """
+    from django.apps import apps
+
+    from django_enumfield.db.utils import get_enum_fields
+
+    if apps.is_installed("django_enumfield.contrib.counters"):
+        return []
+    if app_configs is None:
+        models = apps.get_models()
+    else:
+        models = [model for config in app_configs for model in config.get_models()]
+    return [
+        checks.Error(
+            "{}.{} is counted but django_enumfield.contrib.counters is not "
+            "installed.".format(model._meta.label, field.name),
+            hint="Add django_enumfield.contrib.counters to INSTALLED_APPS.",
+            obj=field,
+            id="django_enumfield.E003",
+        )
+        for model in models
+        for field in get_enum_fields(model)
+        if field.counted and field.model is model
+    ]
@@ -0,0 +1,86 @@
+from collections.abc import Sequence
+from typing import Any, FrozenSet, Tuple  # noqa: F401
+
+
+class EnumChoices(Sequence):
+    """A read-only view of the choices of an Enum.
+
+    The choices are built from Enum.choices() on first access and cached on the
+    enum class, so every field sharing an enum shares a single tuple of
+    choices instead of holding a copy each. Copying an EnumChoices returns
+    itself.
+
+    With from_value, only from_value and the members it can make a transition
+    to are choices.
+    """
+
+    def __init__(self, enum, blank=False, from_value=None):
+        # type: (Any, bool, Any) -> None
+        self.enum = enum
+        self.blank = blank
+        self.from_value = None if from_value is None else enum.get(from_value)
+
+    def _build_choices(self):
+        choices = self.enum.choices(blank=self.blank)
+        if self.from_value is None:
+            return tuple(choices)
+        members = {self.from_value}
+        members.update(self.enum.transition_targets(self.from_value))
+        return tuple(
+            (value, member)
+            for value, member in choices
+            if member in members or not isinstance(member, self.enum)
+        )
+
+    @property
+    def choices(self):
+        # type: () -> Tuple[Tuple[Any, Any], ...]
+        return self.enum._cached(
+            ("choices", self.blank, self.from_value), self._build_choices
+        )
+
+    @property
+    def choice_index(self):
+        # type: () -> FrozenSet[str]
+        """The choice values as strings, as submitted by forms."""
+        return self.enum._cached(
+            ("choice_index", self.blank, self.from_value),
+            lambda: frozenset(str(value) for value, _ in self.choices),
+        )
+
+    def __getitem__(self, index):
+        return self.choices[index]
+
+    def __len__(self):
+        return len(self.choices)
+
+    def __iter__(self):
+        return iter(self.choices)
+
+    def __eq__(self, other):
+        if isinstance(other, EnumChoices):
+            return (self.enum, self.blank, self.from_value) == (
+                other.enum,
+                other.blank,
+                other.from_value,
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self.choices) == list(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.enum, self.blank, self.from_value))
+
+    def __repr__(self):
+        return "<{} of {}{}{}>".format(
+            self.__class__.__name__,
+            self.enum.__name__,
+            " from {}".format(self.from_value.name) if self.from_value else "",
+            " (blank)" if self.blank else "",
+        )
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
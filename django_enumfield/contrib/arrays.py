@@ -0,0 +1,179 @@
+"""Vectorized conversion of enum values for analytics exports.
+
+NumPy and pandas are optional. Without them every helper falls back to plain
+Python lists built from the same cached lookup tables.
+"""
+
+from typing import Any, Iterable, List, Optional  # noqa: F401
+
+from django.utils import translation
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+__all__ = ("to_names", "to_labels", "valid_mask", "to_categorical")
+
+# Values are looked up by indexing a dense array while the span between the
+# smallest and largest value stays below this factor of the member count,
+# sparse enums use a binary search over the sorted values instead.
+DENSE_FACTOR = 8
+
+
+def _get_enum(enum_or_field):
+    # Accept an EnumField (or DRF/form field) as well as the Enum itself
+    return getattr(enum_or_field, "enum", enum_or_field)
+
+
+class LookupArrays(object):
+    def __init__(self, enum, labels):
+        values = sorted(labels)
+        self.values = numpy.array(values, dtype=numpy.int64)
+        self.offset = values[0] if values else 0
+        span = values[-1] - self.offset + 1 if values else 0
+        self.dense = span <= max(len(values) * DENSE_FACTOR, 64)
+        if self.dense:
+            self.positions = numpy.full(span, -1, dtype=numpy.int64)
+            self.positions[self.values - self.offset] = numpy.arange(len(values))
+        self.names = numpy.array([enum.name_map()[v] for v in values] + [None])
+        self.labels = numpy.array([labels[v] for v in values] + [None])
+
+    def codes(self, values):
+        """Position of each value among the sorted enum values, -1 if invalid
+        or missing (None, NaN).
+        """
+        values = numpy.asarray(values)
+        if values.dtype.kind in "iub":
+            return self._codes(values.astype(numpy.int64))
+        # Nullable columns give None, or NaN once in a float array.
+        if values.dtype.kind == "O":
+            missing = _isna(values)
+            values = numpy.where(missing, numpy.nan, values)
+        floats = values.astype(numpy.float64)
+        with numpy.errstate(invalid="ignore"):
+            valid = (
+                numpy.isfinite(floats)
+                & (floats == numpy.round(floats))
+                & (numpy.abs(floats) < 2**62)
+            )
+        codes = self._codes(numpy.where(valid, floats, 0).astype(numpy.int64))
+        return numpy.where(valid, codes, -1)
+
+    def _codes(self, values):
+        if not len(self.values):
+            return numpy.full(values.shape, -1, dtype=numpy.int64)
+        if self.dense:
+            index = values - self.offset
+            in_range = (index >= 0) & (index < len(self.positions))
+            codes = self.positions[numpy.where(in_range, index, 0)]
+            return numpy.where(in_range, codes, -1)
+        index = numpy.searchsorted(self.values, values)
+        index = numpy.minimum(index, len(self.values) - 1)
+        return numpy.where(self.values[index] == values, index, -1)
+
+
+def _isna(values):
+    if pandas is not None:
+        # Also pandas.NA of nullable integer arrays
+        return numpy.asarray(pandas.isna(values), dtype=bool)
+    return numpy.frompyfunc(lambda value: value is None or value != value, 1, 1)(
+        values
+    ).astype(bool)
+
+
+def _lookup_arrays(enum, language=None):
+    if language is None:
+        language = translation.get_language()
+    labels = enum.label_map(language)
+    return enum._cached(("lookup_arrays", language), lambda: LookupArrays(enum, labels))
+
+
+def to_names(enum, values):
+    # type: (Any, Iterable[int]) -> Any
+    """Map enum values to member names, None for values outside of the enum
+    and missing values (None, NaN).
+
+    :param enum: Enum class or EnumField
+    :param values: NumPy array or iterable of ints
+    :return: Object array of names, or a list without NumPy
+    """
+    enum = _get_enum(enum)
+    if numpy is None:
+        names = enum.name_map()
+        return [names.get(value) for value in values]
+    lookup = _lookup_arrays(enum)
+    return lookup.names[lookup.codes(values)]
+
+
+def to_labels(enum, values, language=None):
+    # type: (Any, Iterable[int], Optional[str]) -> Any
+    """Map enum values to member labels, None for values outside of the enum.
+
+    :param enum: Enum class or EnumField
+    :param values: NumPy array or iterable of ints
+    :param language: Language of the labels, defaults to the active language
+    :return: Object array of labels, or a list without NumPy
+    """
+    enum = _get_enum(enum)
+    if numpy is None:
+        labels = enum.label_map(language)
+        return [labels.get(value) for value in values]
+    lookup = _lookup_arrays(enum, language)
+    return lookup.labels[lookup.codes(values)]
+
+
+def valid_mask(enum, values):
+    # type: (Any, Iterable[int]) -> Any
+    """
+    :param enum: Enum class or EnumField
+    :param values: NumPy array or iterable of ints
+    :return: Boolean array telling which values are members of enum, or a
+        list without NumPy
+    """
+    enum = _get_enum(enum)
+    if numpy is None:
+        names = enum.name_map()
+        return [value in names for value in values]
+    return _lookup_arrays(enum).codes(values) >= 0
+
+
+def to_categorical(enum, values, categories="name", language=None):
+    # type: (Any, Iterable[int], str, Optional[str]) -> Any
+    """Turn a column of enum values into a pandas Categorical having every
+    member of the enum as category, ordered by value. Values outside of the
+    enum become missing.
+
+    :param enum: Enum class or EnumField
+    :param values: NumPy array or iterable of ints
+    :param categories: Render categories as "value", "name" or "label"
+    :param language: Language of the labels when categories="label"
+    :return: pandas.Categorical, or a list of rendered values without pandas
+    """
+    if categories not in ("value", "name", "label"):
+        raise ValueError(
+            'categories must be "value", "name" or "label", not {!r}'.format(categories)
+        )
+    enum = _get_enum(enum)
+    if pandas is None:
+        if categories == "value":
+            return [value if value in enum.name_map() else None for value in values]
+        if categories == "name":
+            return to_names(enum, values)
+        return to_labels(enum, values, language)
+
+    lookup = _lookup_arrays(enum, language)
+    if categories == "value":
+        category_values = lookup.values
+    elif categories == "name":
+        category_values = lookup.names[:-1]
+    else:
+        category_values = lookup.labels[:-1]
+    return pandas.Categorical.from_codes(
+        lookup.codes(values), categories=category_values, ordered=True
+    )
@@ -0,0 +1,211 @@
+"""Per member row counts of EnumFields declared with counted=True, an app of
+its own: add django_enumfield.contrib.counters to INSTALLED_APPS.
+
+Counts are kept in EnumCounter and changed when instances are created,
+saved with a new value or deleted. The changes of a transaction, or of a
+savepoint, are summed and applied with one F() update per member once it
+commits. Writes that skip model signals, e.g. QuerySet.update(),
+bulk_create() or raw SQL, are not counted, run the rebuild_enum_counters
+command to reconcile the counts.
+"""
+
+import threading
+import weakref
+from collections import Counter
+from functools import partial
+from typing import Any, Dict, List  # noqa: F401
+
+import django
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F, signals
+
+if django.VERSION < (3, 2):
+    default_app_config = "django_enumfield.contrib.counters.apps.CountersConfig"
+
+__all__ = ("connect", "get_counts", "rebuild")
+
+
+# Fields declared with counted=True per model class, proxies and subclasses
+# included, filled on first use.
+_counted_fields = {}  # type: Dict[Any, List[Any]]
+
+# PendingCounts of the current thread per (database alias, savepoint ids).
+# Only the on_commit callback of a PendingCounts holds it, so it is dropped
+# with the callback when its transaction or savepoint is rolled back.
+_local = threading.local()
+
+
+class PendingCounts(Counter):
+    """Count changes per (model label, field name, value) of a transaction."""
+
+
+def get_saved_attname(field):
+    return "_enum_saved_%s" % field.attname
+
+
+def _get_counted_fields(model):
+    try:
+        return _counted_fields[model]
+    except KeyError:
+        fields = _counted_fields[model] = [
+            field
+            for field in model._meta.concrete_fields
+            if getattr(field, "counted", False)
+        ]
+        return fields
+
+
+def connect(model):
+    """Connect the receivers maintaining counts to model, called when a field
+    is declared with counted=True. Proxies and subclasses are connected when
+    they are prepared.
+    """
+    _counted_fields.pop(model, None)
+    signals.post_init.connect(_remember, sender=model, dispatch_uid=__name__)
+    signals.pre_save.connect(_load_saved, sender=model, dispatch_uid=__name__)
+    signals.post_save.connect(_saved, sender=model, dispatch_uid=__name__)
+    signals.post_delete.connect(_deleted, sender=model, dispatch_uid=__name__)
+    signals.class_prepared.connect(_prepared, dispatch_uid=__name__)
+
+
+def _prepared(sender, **kwargs):
+    if _get_counted_fields(sender):
+        connect(sender)
+
+
+def _remember(sender, instance, **kwargs):
+    # The value as loaded from the database, or the initial value of new
+    # instances, which are counted on creation instead.
+    values = instance.__dict__
+    for field in _get_counted_fields(sender):
+        if field.attname in values:
+            values[get_saved_attname(field)] = values[field.attname]
+
+
+def _load_saved(sender, instance, update_fields=None, using=None, **kwargs):
+    # Fields deferred when loaded, e.g. with only(), have no remembered value,
+    # read the stored one before it is overwritten.
+    if instance._state.adding:
+        return
+    values = instance.__dict__
+    fields = [
+        field
+        for field in _get_counted_fields(sender)
+        if field.attname in values
+        and get_saved_attname(field) not in values
+        and (update_fields is None or field.name in update_fields)
+    ]
+    if not fields:
+        return
+    row = (
+        sender._base_manager.using(using)
+        .filter(pk=instance.pk)
+        .values_list(*[field.attname for field in fields])
+        .first()
+    )
+    if row is not None:
+        for field, value in zip(fields, row):
+            values[get_saved_attname(field)] = value
+
+
+def _saved(sender, instance, created, update_fields=None, using=None, **kwargs):
+    values = instance.__dict__
+    for field in _get_counted_fields(sender):
+        if update_fields is not None and field.name not in update_fields:
+            continue
+        saved_attname = get_saved_attname(field)
+        value = values.get(field.attname)
+        if created:
+            _add(using, field, value, 1)
+        elif saved_attname in values:
+            old_value = values[saved_attname]
+            if old_value == value:
+                continue
+            _add(using, field, old_value, -1)
+            _add(using, field, value, 1)
+        values[saved_attname] = value
+
+
+def _deleted(sender, instance, using=None, **kwargs):
+    values = instance.__dict__
+    for field in _get_counted_fields(sender):
+        _add(using, field, values.get(get_saved_attname(field)), -1)
+
+
+def _add(using, field, value, delta):
+    if value is None:
+        return
+    connection = connections[using]
+    try:
+        pending_counts = _local.pending
+    except AttributeError:
+        pending_counts = _local.pending = weakref.WeakValueDictionary()
+    key = (connection.alias, tuple(connection.savepoint_ids))
+    pending = pending_counts.get(key) if connection.in_atomic_block else None
+    if pending is None:
+        # First change in this transaction or savepoint. The changes are
+        # dropped with the callback when it is rolled back.
+        pending = PendingCounts()
+        if connection.in_atomic_block:
+            pending_counts[key] = pending
+        pending[(field.model._meta.label_lower, field.name, int(value))] += delta
+        # Runs right away outside of transactions.
+        transaction.on_commit(partial(_flush, using, pending, key), using=using)
+    else:
+        pending[(field.model._meta.label_lower, field.name, int(value))] += delta
+
+
+def _flush(using, pending, key):
+    from django_enumfield.contrib.counters.models import EnumCounter
+
+    pending_counts = getattr(_local, "pending", {})
+    if pending_counts.get(key) is pending:
+        del pending_counts[key]
+    counters = EnumCounter.objects.using(using)
+    with transaction.atomic(using=using):
+        for (model, field, value), delta in sorted(pending.items()):
+            if not delta:
+                continue
+            lookup = {"model": model, "field": field, "value": value}
+            if counters.filter(**lookup).update(count=F("count") + delta):
+                continue
+            try:
+                with transaction.atomic(using=using):
+                    counters.create(count=delta, **lookup)
+            except IntegrityError:
+                # Created concurrently
+                counters.filter(**lookup).update(count=F("count") + delta)
+
+
+def get_counts(model, field_name, using=None):
+    # type: (Any, str, Any) -> Dict[Any, int]
+    """:return: Dict of member to number of rows of model holding it"""
+    from django_enumfield.contrib.counters.models import EnumCounter
+
+    return EnumCounter.objects.using(using).get_counts(model, field_name)
+
+
+def rebuild(model, field, using=None, chunk_size=2000):
+    # type: (Any, Any, Any, int) -> Dict[int, int]
+    """Recount the values of field with a chunked scan of the table of model
+    and replace its counters.
+
+    :return: Dict of stored value to number of rows
+    """
+    from django_enumfield.contrib.counters.models import EnumCounter
+    from django_enumfield.db.utils import iter_chunks
+
+    queryset = model._base_manager.using(using)
+    counts = Counter()  # type: Counter
+    for chunk in iter_chunks(queryset, field, chunk_size=chunk_size):
+        counts.update(value for _, value in chunk if value is not None)
+
+    label = field.model._meta.label_lower
+    with transaction.atomic(using=using):
+        counters = EnumCounter.objects.using(using)
+        counters.filter(model=label, field=field.name).delete()
+        counters.bulk_create(
+            EnumCounter(model=label, field=field.name, value=value, count=count)
+            for value, count in sorted(counts.items())
+        )
+    return dict(counts)
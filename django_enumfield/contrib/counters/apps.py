@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class CountersConfig(AppConfig):
+    name = "django_enumfield.contrib.counters"
+    label = "enumfield_counters"
+    verbose_name = "Enum counters"
+    default_auto_field = "django.db.models.AutoField"
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from django_enumfield.contrib import counters
+from django_enumfield.db.utils import iter_enum_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the rows holding each member of EnumFields declared with "
+        "counted=True, replacing their counters."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "args",
+            metavar="app_label[.ModelName]",
+            nargs="*",
+            help="Restrict the rebuild to these apps or models.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of rows fetched per query (default: 2000).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Database to rebuild. Defaults to the "default" database.',
+        )
+
+    def handle(self, *app_labels, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive integer.")
+
+        for model, fields in iter_enum_models(app_labels):
+            for field in fields:
+                # Inherited fields are counted with the model declaring them.
+                if not field.counted or field.model is not model:
+                    continue
+                counts = counters.rebuild(
+                    model,
+                    field,
+                    using=options["database"],
+                    chunk_size=options["chunk_size"],
+                )
+                self.stdout.write(
+                    "{}.{}: {} row(s)".format(
+                        model._meta.label, field.name, sum(counts.values())
+                    )
+                )
@@ -0,0 +1,34 @@
+# Generated by Django 4.1.13 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="EnumCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=100)),
+                ("field", models.CharField(max_length=100)),
+                ("value", models.IntegerField()),
+                ("count", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "unique_together": {("model", "field", "value")},
+            },
+        ),
+    ]
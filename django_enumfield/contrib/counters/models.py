@@ -0,0 +1,37 @@
+from django.db import models
+
+
+class EnumCounterQuerySet(models.QuerySet):
+    def get_counts(self, model, field_name):
+        """
+        :return: Dict of member to number of rows of model holding it in
+            EnumField field_name, which must be declared with counted=True
+        """
+        field = model._meta.get_field(field_name)
+        counts = dict.fromkeys(field.enum, 0)
+        for value, count in self.filter(
+            model=model._meta.label_lower, field=field_name
+        ).values_list("value", "count"):
+            member = field.enum.get(value)
+            if member is not None:
+                counts[member] = count
+        return counts
+
+
+class EnumCounter(models.Model):
+    """Number of rows holding each member of an EnumField declared with
+    counted=True, maintained by django_enumfield.contrib.counters.
+    """
+
+    model = models.CharField(max_length=100)
+    field = models.CharField(max_length=100)
+    value = models.IntegerField()
+    count = models.BigIntegerField(default=0)
+
+    objects = EnumCounterQuerySet.as_manager()
+
+    class Meta:
+        unique_together = (("model", "field", "value"),)
+
+    def __str__(self):
+        return "{}.{}={}: {}".format(self.model, self.field, self.value, self.count)
@@ -1,12 +1,34 @@
+from collections import namedtuple
+from typing import Any, Dict, List, Mapping  # noqa: F401
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils import translation
+from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.fields import flatten_choices_dict, get_attribute, to_choices_dict
+from rest_framework.schemas.openapi import AutoSchema
+
+from django_enumfield.db.utils import get_enum_fields
+from django_enumfield.registry import registry
+
+# Choices of an EnumField with next_choices for one current member.
+NextChoices = namedtuple("NextChoices", ("members", "grouped_choices", "choices"))
 
 
 class EnumField(serializers.ChoiceField):
+    """With next_choices, a serializer of an instance only offers and accepts
+    the current value of the instance and the members it can make a transition
+    to. The restricted choices are built once per enum, current value and
+    language and shared by every serializer.
+    """
+
     default_error_messages = {"invalid_choice": _('"{input}" is not a valid choice.')}
 
-    def __init__(self, enum, **kwargs):
+    def __init__(self, enum, next_choices=False, **kwargs):
         self.enum = enum
+        self.next_choices = next_choices
         choices = (
             (self.get_choice_value(enum_value), enum_value.label)
             for _, enum_value in enum.choices()
@@ -16,18 +38,72 @@ class EnumField(serializers.ChoiceField):
     def get_choice_value(self, enum_value):
         return enum_value.value
 
+    def get_current_member(self):
+        """The member of the serialized instance with next_choices, or None."""
+        if not self.next_choices:
+            return None
+        instance = getattr(getattr(self, "parent", None), "instance", None)
+        if instance is None:
+            return None
+        try:
+            value = get_attribute(instance, self.source_attrs)
+        except (AttributeError, KeyError, ObjectDoesNotExist):
+            return None
+        return self.enum.get(value)
+
+    def get_next_choices(self, member):
+        # type: (Any) -> NextChoices
+        language = translation.get_language()
+
+        def build():
+            members = (member,) + self.enum.transition_targets(member)
+            choices = to_choices_dict(
+                (self.get_choice_value(enum_value), force_str(enum_value.label))
+                for enum_value in sorted(members, key=lambda item: item.value)
+            )
+            return NextChoices(
+                frozenset(members), choices, flatten_choices_dict(choices)
+            )
+
+        return self.enum._cached(
+            ("drf_next_choices", self.__class__, member, language), build
+        )
+
+    def _get_choices(self):
+        member = self.get_current_member()
+        if member is not None:
+            return self.get_next_choices(member).choices
+        return self._choices
+
+    choices = property(_get_choices, serializers.ChoiceField._set_choices)
+
+    def _get_grouped_choices(self):
+        member = self.get_current_member()
+        if member is not None:
+            return self.get_next_choices(member).grouped_choices
+        return self._grouped_choices
+
+    def _set_grouped_choices(self, grouped_choices):
+        self._grouped_choices = grouped_choices
+
+    grouped_choices = property(_get_grouped_choices, _set_grouped_choices)
+
     def to_internal_value(self, data):
         if isinstance(data, str) and data.isdigit():
             data = int(data)
 
-        try:
-            value = self.enum.get(data).value
-        except AttributeError:  # .get() returned None
+        enum_value = self.enum.get(data)
+        if enum_value is None:
             if not self.required:
                 raise serializers.SkipField()
             self.fail("invalid_choice", input=data)
 
-        return value
+        member = self.get_current_member()
+        if member is not None:
+            if enum_value not in self.get_next_choices(member).members:
+                self.fail("invalid_choice", input=data)
+
+        return enum_value.value
 
     def to_representation(self, value):
         enum_value = self.enum.get(value)
@@ -41,3 +117,118 @@ class NamedEnumField(EnumField):
 
     class Meta:
         swagger_schema_fields = {"type": "string"}
+
+
+class EnumAutoSchema(AutoSchema):
+    """AutoSchema describing EnumField and NamedEnumField from the enum
+    registry, with member names and labels, cached per enum and language.
+    """
+
+    def map_choicefield(self, field):
+        if isinstance(field, EnumField):
+            return registry.openapi_schema(
+                field.enum, named=isinstance(field, NamedEnumField)
+            )
+        return super(EnumAutoSchema, self).map_choicefield(field)
+
+
+class EnumFilterBackend(BaseFilterBackend):
+    """Filter the EnumFields of the view's model with query parameters named
+    after the fields, holding comma separated names or values, e.g.
+    ?status=ACTIVE,PENDING or ?status=1&status=2.
+
+    The tokens of a parameter are compiled into one __in lookup of the
+    distinct members sorted by value, unknown tokens are a 400 response.
+    Set enum_filter_fields on the view to filter only some of the fields.
+    Usage:
+        class JobList(generics.ListAPIView):
+            queryset = Job.objects.all()
+            filter_backends = [EnumFilterBackend]
+    """
+
+    separator = ","
+
+    @staticmethod
+    def get_tokens(enum):
+        # type: (Any) -> Mapping[str, Any]
+        """:return: Cached mapping of every name and value, as a string, to
+        its member
+        """
+
+        def build():
+            tokens = {str(member.value): member for member in enum}
+            tokens.update((member.name, member) for member in enum)
+            return tokens
+
+        return enum._cached("filter_tokens", build)
+
+    def get_filter_fields(self, view, model):
+        fields = get_enum_fields(model)
+        names = getattr(view, "enum_filter_fields", None)
+        if names is not None:
+            fields = [field for field in fields if field.name in names]
+        return fields
+
+    def parse(self, field, raw_values):
+        # type: (Any, List[str]) -> List[Any]
+        """Members of the tokens in raw_values, distinct and sorted by value.
+
+        :raise ValidationError: On unknown tokens
+        """
+        tokens = self.get_tokens(field.enum)
+        members = set()
+        unknown = []
+        for raw_value in raw_values:
+            for token in raw_value.split(self.separator):
+                token = token.strip()
+                if not token:
+                    continue
+                member = tokens.get(token)
+                if member is None:
+                    unknown.append(token)
+                else:
+                    members.add(member)
+        if unknown:
+            raise serializers.ValidationError(
+                {
+                    field.name: [
+                        _('"{input}" is not a valid choice.').format(input=token)
+                        for token in unknown
+                    ]
+                }
+            )
+        return sorted(members, key=lambda member: member.value)
+
+    def filter_queryset(self, request, queryset, view):
+        lookups = {}  # type: Dict[str, Any]
+        for field in self.get_filter_fields(view, queryset.model):
+            raw_values = request.query_params.getlist(field.name)
+            if not raw_values:
+                continue
+            members = self.parse(field, raw_values)
+            if len(members) == 1:
+                lookups[field.name] = members[0]
+            elif members:
+                lookups[field.name + "__in"] = members
+        if lookups:
+            queryset = queryset.filter(**lookups)
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        queryset = getattr(view, "queryset", None)
+        if queryset is None:
+            return []
+        return [
+            {
+                "name": field.name,
+                "required": False,
+                "in": "query",
+                "description": force_str(
+                    _("Comma separated names or values of {enum}").format(
+                        enum=field.enum.__name__
+                    )
+                ),
+                "schema": {"type": "string"},
+            }
+            for field in self.get_filter_fields(view, queryset.model)
+        ]
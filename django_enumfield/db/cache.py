@@ -0,0 +1,190 @@
+from functools import partial
+from typing import Any, Optional, Tuple  # noqa: F401
+from uuid import uuid4
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import models, transaction
+
+from django_enumfield.db.utils import get_enum_fields
+
+__all__ = ("CacheStats", "TerminalCacheManager")
+
+
+class CacheStats(object):
+    """Hits and misses of a TerminalCacheManager, counted without locking."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # type: () -> None
+        self.hits = 0
+        self.misses = 0
+        # Misses of rows in a terminal state, which were then cached
+        self.stored = 0
+
+    @property
+    def hit_rate(self):
+        # type: () -> float
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return "<CacheStats hits={} misses={} stored={} hit_rate={:.2f}>".format(
+            self.hits, self.misses, self.stored, self.hit_rate
+        )
+
+
+class TerminalCacheManager(models.Manager):
+    """Manager reading rows by primary key through Django's cache framework.
+    Rows whose EnumField holds a terminal member, see Enum.is_terminal(), never
+    change state again and are cached without expiry, other rows are read
+    from the database every time.
+
+    Keys include a version per row, replaced once the transaction saving or
+    deleting an instance commits, so every process stops reading the entries
+    of the row. Changes bypassing save(), e.g. QuerySet.update(), are not
+    seen.
+    Usage:
+        class Order(models.Model):
+            status = EnumField(OrderStatus)
+
+            objects = models.Manager()
+            cached = TerminalCacheManager()
+
+        order = Order.cached.get_cached(pk)
+        Order.cached.stats.hit_rate
+    """
+
+    def __init__(self, field_name=None, cache_alias=DEFAULT_CACHE_ALIAS):
+        super(TerminalCacheManager, self).__init__()
+        self.field_name = field_name
+        self.cache_alias = cache_alias
+        self.stats = CacheStats()
+
+    def contribute_to_class(self, model, name):
+        super(TerminalCacheManager, self).contribute_to_class(model, name)
+        if not model._meta.abstract:
+            # Without a sender, proxies and children send their own class.
+            uid = "enumfield_terminal_cache_%s" % id(self)
+            models.signals.post_save.connect(self._invalidate, dispatch_uid=uid)
+            models.signals.post_delete.connect(self._invalidate, dispatch_uid=uid)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_field(self):
+        if self.field_name is not None:
+            return self.model._meta.get_field(self.field_name)
+        fields = get_enum_fields(self.model)
+        if len(fields) != 1:
+            raise ValueError(
+                "{} has {} EnumFields, pass field_name to {}.".format(
+                    self.model.__name__, len(fields), self.__class__.__name__
+                )
+            )
+        return fields[0]
+
+    def make_version_key(self, pk, model=None):
+        # type: (Any, Any) -> str
+        # Shared by proxies, so that saving through one invalidates all.
+        opts = (model or self.model)._meta.concrete_model._meta
+        return "enumfield:terminal:{}:{}:version".format(opts.label_lower, pk)
+
+    def get_version(self, pk):
+        # type: (Any) -> str
+        """The version of the cache entries of the row with primary key pk,
+        a new one when missing, e.g. evicted, so that no older entry is read.
+        """
+        key = self.make_version_key(pk)
+        version = self.cache.get(key)
+        if version is None:
+            version = uuid4().hex
+            if not self.cache.add(key, version, timeout=None):
+                # Added concurrently
+                version = self.cache.get(key, version)
+        return version
+
+    def make_key(self, pk, fields=None, version=None):
+        # type: (Any, Optional[Tuple[str, ...]], Optional[str]) -> str
+        if version is None:
+            version = self.get_version(pk)
+        key = "enumfield:terminal:{}:{}:{}".format(
+            self.model._meta.label_lower, pk, version
+        )
+        if fields is not None:
+            key += ":" + ",".join(fields)
+        return key
+
+    def _read_through(self, key, load):
+        value = self.cache.get(key)
+        if value is not None:
+            self.stats.hits += 1
+            return value
+        self.stats.misses += 1
+        value, member = load()
+        if self.get_field().enum.is_terminal(member):
+            self.cache.set(key, value, timeout=None)
+            self.stats.stored += 1
+        return value
+
+    def get_cached(self, pk):
+        """The instance with primary key pk, from the cache when it is in a
+        terminal state.
+
+        :raise DoesNotExist: When there is no such row
+        """
+
+        def load():
+            instance = self.get(pk=pk)
+            return instance, getattr(instance, self.get_field().attname)
+
+        return self._read_through(self.make_key(pk), load)
+
+    def get_values_cached(self, pk, *fields):
+        """The values() row of fields of the row with primary key pk, from the
+        cache when it is in a terminal state.
+
+        :raise DoesNotExist: When there is no such row
+        """
+        fields = tuple(fields)
+        name = self.get_field().name
+
+        def load():
+            query_fields = fields if not fields or name in fields else fields + (name,)
+            row = self.filter(pk=pk).values(*query_fields).first()
+            if row is None:
+                raise self.model.DoesNotExist(
+                    "{} matching query does not exist.".format(self.model.__name__)
+                )
+            member = row[name]
+            if fields and name not in fields:
+                del row[name]
+            return row, member
+
+        return self._read_through(self.make_key(pk, fields), load)
+
+    def _invalidate(self, sender, instance, using=None, **kwargs):
+        if not isinstance(instance, self.model._meta.concrete_model):
+            return
+        # Rows read before the commit may still be cached under the current
+        # version. The pk is None once the instance is deleted. Saving a
+        # child also changes the row of its parent.
+        for model in {self.model._meta.concrete_model, instance._meta.concrete_model}:
+            transaction.on_commit(
+                partial(self.invalidate, instance.pk, model), using=using
+            )
+
+    def invalidate(self, pk, model=None):
+        # type: (Any, Any) -> None
+        """Stop reading the cache entries of the row with primary key pk, of
+        model when given instead of the model of the manager.
+        """
+        concrete_model = (model or self.model)._meta.concrete_model
+        version_key = self.make_version_key(pk, concrete_model)
+        version = self.cache.get(version_key)
+        self.cache.set(version_key, uuid4().hex, timeout=None)
+        if version is not None and concrete_model is self.model._meta.concrete_model:
+            # Entries of values rows are left to be evicted.
+            self.cache.delete(self.make_key(pk, version=version))
@@ -1,14 +1,18 @@
+import hashlib
 from enum import Enum
-from functools import partial
-from typing import Any, Callable  # noqa: F401
+from functools import partial, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple  # noqa: F401
 
-from django import forms
+from django.core.exceptions import ImproperlyConfigured
 from django.db import models
+from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.translation import gettext
 
+from django_enumfield.choices import EnumChoices
 from django_enumfield.exceptions import InvalidStatusOperationError
 from django_enumfield.forms.fields import EnumChoiceField
+from django_enumfield.forms.widgets import EnumSelect
 
 from .. import validators
 
@@ -37,11 +41,54 @@ class EnumField(models.IntegerField):
 
     default_error_messages = models.IntegerField.default_error_messages  # type: ignore
 
+    VALIDATION_MODES = ("strict", "deferred", "off")
+
+    # Options only used by Python, changing them in a migration does not alter
+    # the column, e.g. remake the table on SQLite. Django before 4.1 ignores
+    # non_db_attrs and alters the column.
+    non_db_attrs = getattr(models.IntegerField, "non_db_attrs", ()) + (
+        "counted",
+        "fingerprint",
+        "hot",
+        "next_choices",
+        "validation",
+    )
+
     def __init__(self, enum, *args, **kwargs):
-        kwargs.setdefault("choices", enum.choices())
-        if enum.default() is not None:
-            kwargs.setdefault("default", enum.default())
+        validation = kwargs.pop("validation", "strict")
+        if validation not in self.VALIDATION_MODES:
+            raise ValueError(
+                "validation must be one of {}, not {!r}".format(
+                    ", ".join(self.VALIDATION_MODES), validation
+                )
+            )
+        self.validation = validation
+        # None uses enum.__hot__, an empty sequence disables the hot index.
+        self.hot = kwargs.pop("hot", None)
+        # Maintain per member row counts, see django_enumfield.contrib.counters.
+        self.counted = kwargs.pop("counted", False)
+        # Form fields only offer the current value and its transition targets.
+        self.next_choices = kwargs.pop("next_choices", False)
+        # Maintain a <name>_entered_at column, see entered_at_field.
+        self.track_entered_at = kwargs.pop("track_entered_at", False)
+        self.entered_at_field = None  # type: Optional[models.DateTimeField]
+        # True to write the fingerprint of the enum to migrations, or the
+        # fingerprint written by a migration, see deconstruct().
+        self.fingerprint = kwargs.pop("fingerprint", None)
+        # Choices are only built once something iterates them, e.g. formfield(),
+        # system checks or migrations, and are then shared by all fields.
+        kwargs.setdefault("choices", EnumChoices(enum))
+        if "default" not in kwargs:
+            default = enum.default()
+            if default is not None:
+                kwargs["default"] = default
         self.enum = enum
+        # (kind, from_value, to_value, callback) registered with guard() and
+        # on_transition(), compiled into transition_dispatch.
+        self._transition_callbacks = []  # type: List[Tuple[str, Any, Any, Callable]]
+        self.transition_dispatch = (
+            {}
+        )  # type: Dict[Tuple[Any, Any], Tuple[Tuple, Tuple]]
         super(EnumField, self).__init__(*args, **kwargs)
 
     def get_default(self):
@@ -56,13 +103,20 @@ class EnumField(models.IntegerField):
         self, cls, name, private_only=False, virtual_only=models.NOT_PROVIDED
     ):
         super(EnumField, self).contribute_to_class(cls, name)
-        if self.choices:
+        if self.choices is not None:
             setattr(
                 cls,
                 "get_%s_display" % self.name,
                 partialishmethod(self._get_FIELD_display),
             )
         models.signals.class_prepared.connect(self._setup_validation, sender=cls)
+        models.signals.class_prepared.connect(self._compile_transitions, sender=cls)
+        if self.track_entered_at:
+            self._add_entered_at_field(cls)
+        if self.counted:
+            from django_enumfield.contrib import counters
+
+            counters.connect(cls)
 
     def _get_FIELD_display(self, cls):
         value = getattr(cls, self.attname)
@@ -95,41 +149,14 @@ class EnumField(models.IntegerField):
         """
         User a customer setter for the field to validate new value against the old one.
         The current value is set as '_enum_[att_name]' on the model instance.
+
+        With validation="deferred" the first value is kept as
+        '_enum_original_[att_name]' and only the transition from it to the
+        current value is validated before saving. With validation="off"
+        values are only checked to be members of the enum.
         """
         att_name = self.get_attname()
         private_att_name = "_enum_%s" % att_name
-        enum = self.enum
-
-        def set_enum(self, new_value):
-            if new_value is models.NOT_PROVIDED:
-                new_value = None
-            if hasattr(self, private_att_name):
-                # Fetch previous value from private enum attribute.
-                old_value = getattr(self, private_att_name)
-            else:
-                # First setattr no previous value on instance.
-                old_value = new_value
-            # Update private enum attribute with new value
-            if new_value is not None and not isinstance(new_value, enum):
-                if isinstance(new_value, Enum):
-                    raise TypeError(
-                        "Invalid Enum class passed. Passed {}, expected {}".format(
-                            new_value.__class__.__name__, enum.__name__
-                        )
-                    )
-                try:
-                    new_value = enum(new_value)
-                except ValueError:
-                    raise InvalidStatusOperationError(
-                        gettext(
-                            "{value!r} is not one of the available choices "
-                            "for enum {enum}."
-                        ).format(value=new_value, enum=enum)
-                    )
-            setattr(self, private_att_name, new_value)
-            self.__dict__[att_name] = new_value
-            # Run validation for new value.
-            validators.validate_valid_transition(enum, old_value, new_value)
 
         def get_enum(self):
             return getattr(self, private_att_name)
@@ -138,22 +165,250 @@ class EnumField(models.IntegerField):
             self.__dict__[att_name] = None
             return setattr(self, private_att_name, None)
 
+        setter = SETTER_FACTORIES[self.validation](self.enum, att_name)
+        setter = self._track_changes(setter)
         if not sender._meta.abstract:
-            setattr(sender, att_name, property(get_enum, set_enum, delete_enum))
+            setattr(sender, att_name, property(get_enum, setter, delete_enum))
+            if self.validation == "deferred":
+                # Without a sender, proxies and children send their own class.
+                models.signals.pre_save.connect(self._validate_deferred)
+                models.signals.post_save.connect(self._saved_deferred)
+                _reset_deferred_on_refresh(sender)
+
+    def _add_entered_at_field(self, cls):
+        """Add the nullable <name>_entered_at DateTimeField set by pre_save()
+        when the value changes. Abstract models leave it to the copies of the
+        field in their children. Migrations see it as a field of its own, so
+        track_entered_at is not part of deconstruct().
+        """
+        if cls._meta.abstract:
+            return
+        name = "%s_entered_at" % self.name
+        if any(field.name == name for field in cls._meta.local_fields):
+            return
+        field = models.DateTimeField(null=True, blank=True, editable=False)
+        cls.add_to_class(name, field)
+        self.entered_at_field = field
+        # Without a sender, proxies and children send their own class.
+        models.signals.post_save.connect(self._save_entered_at)
+
+    def entered_at_index(self, model):
+        # type: (Any) -> Optional[models.Index]
+        """The index of (field, <name>_entered_at) used by
+        EnumQuerySet.in_state_longer_than(), to add to Meta.indexes of model,
+        see entered_at_index(). Check django_enumfield.W004 warns when
+        Meta.indexes has no such index.
+        """
+        if not self.track_entered_at:
+            return None
+        table = model._meta.db_table
+        # At most 30 characters, the limit of Index names.
+        digest = hashlib.sha256(
+            "{}.{}.entered".format(table, self.column).encode("utf-8")
+        ).hexdigest()[:6]
+        return entered_at_index(
+            self.name, "%s_%s_%s_ent" % (table[:10], self.column[:8], digest)
+        )
+
+    def _track_changes(self, setter):
+        """Wrap setter to flag instances whose value changed after the first
+        assignment, for pre_save() to set the entered at field.
+        """
+        if not self.track_entered_at:
+            return setter
+        private_att_name = "_enum_%s" % self.attname
+        changed_att_name = "_enum_changed_%s" % self.attname
+
+        def set_enum_tracked(self, new_value):
+            values = self.__dict__
+            first = private_att_name not in values
+            old_value = values.get(private_att_name)
+            setter(self, new_value)
+            if not first and values[private_att_name] != old_value:
+                values[changed_att_name] = True
+
+        return set_enum_tracked
+
+    def pre_save(self, model_instance, add):
+        value = super(EnumField, self).pre_save(model_instance, add)
+        entered_at_field = self.entered_at_field
+        if entered_at_field is not None:
+            values = model_instance.__dict__
+            changed = values.pop("_enum_changed_%s" % self.attname, False)
+            if changed or (add and values.get(entered_at_field.attname) is None):
+                # Fields are saved in order, so this is written by the same
+                # INSERT or UPDATE, unless update_fields leaves it out.
+                values[entered_at_field.attname] = timezone.now()
+                values["_enum_entered_%s" % self.attname] = True
+        return value
+
+    def _save_entered_at(self, sender, instance, update_fields=None, **kwargs):
+        """Write the <name>_entered_at value set by pre_save() when
+        update_fields includes the field but not <name>_entered_at, e.g.
+        save(update_fields=["status"]).
+        """
+        if not isinstance(instance, self.model):
+            return
+        if not instance.__dict__.pop("_enum_entered_%s" % self.attname, False):
+            return
+        attname = self.entered_at_field.attname
+        if update_fields is None or attname in update_fields:
+            return
+        if self.entered_at_field.name in update_fields:
+            return
+        instance._meta.base_manager.using(kwargs.get("using")).filter(
+            pk=instance.pk
+        ).update(**{attname: instance.__dict__[attname]})
+
+    def _saved_fields(self, update_fields):
+        return update_fields is None or self.name in update_fields
+
+    def _validate_deferred(self, sender, instance, update_fields=None, **kwargs):
+        """Validate the transition from the first value to the current one
+        before a model with validation="deferred" is saved, outside of the
+        saving transaction.
+        """
+        if isinstance(instance, self.model) and self._saved_fields(update_fields):
+            values = instance.__dict__
+            value = values.get(self.attname)
+            validators.validate_valid_transition(
+                self.enum,
+                values.get("_enum_original_%s" % self.attname, value),
+                value,
+                self.attname,
+            )
+
+    def _saved_deferred(self, sender, instance, update_fields=None, **kwargs):
+        # Later transitions are validated from the saved value.
+        if isinstance(instance, self.model) and self._saved_fields(update_fields):
+            values = instance.__dict__
+            values["_enum_original_%s" % self.attname] = values.get(self.attname)
+
+    @property
+    def hot_values(self):
+        # type: () -> List[int]
+        """Sorted values of the hot members, see hot_index()."""
+        hot = self.enum.__hot__ if self.hot is None else self.hot
+        values = []
+        for value in hot:
+            member = self.enum.get(value)
+            if member is None:
+                raise ImproperlyConfigured(
+                    "{!r} is not a member of {}".format(value, self.enum.__name__)
+                )
+            values.append(member.value)
+        return sorted(set(values))
+
+    def hot_index(self, model):
+        # type: (Any) -> Optional[models.Index]
+        """The partial index of the rows holding a hot member, declared with
+        EnumField(hot=...) or Enum.__hot__, to add to Meta.indexes of model,
+        see hot_index(). Check django_enumfield.W002 warns when Meta.indexes
+        has no such index. Filter with field__hot=True (and e.g.
+        field=member) for SQLite to use it, PostgreSQL also uses it for
+        field=member.
+        """
+        values = self.hot_values
+        if not values:
+            return None
+        table = model._meta.db_table
+        # At most 30 characters, the limit of Index names.
+        digest = hashlib.sha256(
+            "{}.{}".format(table, self.column).encode("utf-8")
+        ).hexdigest()[:6]
+        return hot_index(
+            self.name, values, "%s_%s_%s_hot" % (table[:10], self.column[:8], digest)
+        )
+
+    def _register_transition_callback(self, kind, from_value, to_value):
+        if isinstance(from_value, (list, tuple, set, frozenset)):
+            from_values = from_value
+        else:
+            from_values = (from_value,)
+
+        def decorator(func):
+            for value in from_values:
+                self._transition_callbacks.append((kind, value, to_value, func))
+            return func
+
+        return decorator
+
+    def guard(self, from_value, to_value):
+        """Register a guard for transitions from from_value (a member or a
+        sequence of members) to to_value, used by
+        TransitionMixin.transition_to(). A guard is called as
+        guard(instance, from_value, to_value, **kwargs) and rejects the
+        transition by returning False.
+        Usage:
+            class Order(TransitionMixin, models.Model):
+                status = EnumField(OrderStatus)
+
+                @status.guard(OrderStatus.NEW, OrderStatus.PAID)
+                def is_paid(self, from_value, to_value, **kwargs):
+                    return self.payment is not None
+        """
+        return self._register_transition_callback("guard", from_value, to_value)
+
+    def on_transition(self, from_value, to_value):
+        """Register a handler run by TransitionMixin.transition_to() after
+        the value changed from from_value (a member or a sequence of members)
+        to to_value. Handlers are called as
+        handler(instance, from_value, to_value, **kwargs).
+        """
+        return self._register_transition_callback("handler", from_value, to_value)
+
+    def _compile_transitions(self, sender, **kwargs):
+        """Compile registered guards and handlers into a dispatch table keyed
+        by (from_value, to_value), so that a transition only looks up and runs
+        the callbacks of its own edge.
+        """
+        dispatch = {}  # type: Dict[Tuple[Any, Any], Tuple[List, List]]
+        for kind, from_value, to_value, func in self._transition_callbacks:
+            from_member = self.enum.get(from_value)
+            to_member = self.enum.get(to_value)
+            if (
+                from_member is None
+                or to_member is None
+                or not self.enum.is_valid_transition(from_member, to_member)
+            ):
+                raise ImproperlyConfigured(
+                    "{}.{}: {} can not go from {!r} to {!r}, "
+                    "{} {} is never called.".format(
+                        sender.__name__,
+                        self.name,
+                        self.enum.__name__,
+                        from_value,
+                        to_value,
+                        kind,
+                        func.__name__,
+                    )
+                )
+            guards, handlers = dispatch.setdefault((from_member, to_member), ([], []))
+            (guards if kind == "guard" else handlers).append(func)
+        self.transition_dispatch = {
+            edge: (tuple(guards), tuple(handlers))
+            for edge, (guards, handlers) in dispatch.items()
+        }
 
     def validate(self, value, model_instance):
         super(EnumField, self).validate(value, model_instance)
         validators.validate_valid_transition(
-            self.enum, self.value_from_object(model_instance), value
+            self.enum, self.value_from_object(model_instance), value, self.attname
         )
 
     def formfield(self, **kwargs):
-        enum_form_class = partial(EnumChoiceField, enum=self.enum)
+        enum_form_class = partial(
+            EnumChoiceField, enum=self.enum, next_choices=self.next_choices
+        )
         defaults = {
-            "widget": forms.Select,
+            "widget": EnumSelect,
             "form_class": enum_form_class,
             "choices_form_class": enum_form_class,
-            "choices": self.enum.choices(blank=self.blank),
+            "choices": (
+                EnumChoices(self.enum, blank=self.blank)
+                if self.enum.__lazy_choices__
+                else self.enum.choices(blank=self.blank)
+            ),
         }
         defaults.update(kwargs)
         return super(EnumField, self).formfield(**defaults)
@@ -161,10 +416,22 @@ class EnumField(models.IntegerField):
     def deconstruct(self):
         name, path, args, kwargs = super(EnumField, self).deconstruct()
         kwargs["enum"] = self.enum
+        # The enum class is the same in migrations and models, the
+        # fingerprint tells the autodetector when its members changed.
+        if self.fingerprint is True:
+            kwargs["fingerprint"] = self.enum.fingerprint()
+        elif self.fingerprint:
+            kwargs["fingerprint"] = self.fingerprint
         if "choices" in kwargs:
             del kwargs["choices"]
         if "verbose_name" in kwargs:
             del kwargs["verbose_name"]
+        if self.validation != "strict":
+            kwargs["validation"] = self.validation
+        if self.hot is not None:
+            kwargs["hot"] = [int(value) for value in self.hot]
+        if self.counted:
+            kwargs["counted"] = True
         if "default" in kwargs and isinstance(kwargs["default"], self.enum):
             # The enum value cannot be deconstructed properly
             # for migrations (on django <= 1.8).
@@ -172,3 +439,164 @@ class EnumField(models.IntegerField):
             kwargs["default"] = kwargs["default"].value
 
         return name, path, args, kwargs
+
+
+def hot_index(field_name, hot, name):
+    # type: (str, Any, str) -> models.Index
+    """A partial index of the rows whose EnumField field_name holds a hot
+    member, for Meta.indexes, so that migrations create and update it.
+    Usage:
+        class Job(models.Model):
+            status = EnumField(JobStatus)
+
+            class Meta:
+                indexes = [hot_index("status", JobStatus, "job_status_hot")]
+
+    :param hot: An enum, whose __hot__ members are hot, or a sequence of
+        hot members or values
+    """
+    if isinstance(hot, type) and issubclass(hot, Enum):
+        hot = hot.__hot__  # type: ignore[attr-defined]
+    values = sorted({int(value) for value in hot})
+    return models.Index(
+        fields=[field_name],
+        condition=models.Q(**{"%s__in" % field_name: values}),
+        name=name,
+    )
+
+
+def entered_at_index(field_name, name):
+    # type: (str, str) -> models.Index
+    """An index of the EnumField field_name declared with
+    track_entered_at=True and its <field_name>_entered_at column, for
+    Meta.indexes, so that migrations create it.
+    Usage:
+        class Order(models.Model):
+            status = EnumField(OrderStatus, track_entered_at=True)
+
+            class Meta:
+                indexes = [entered_at_index("status", "order_status_entered")]
+    """
+    return models.Index(fields=[field_name, "%s_entered_at" % field_name], name=name)
+
+
+def to_member(enum, new_value):
+    """The member of enum for a value assigned to an EnumField."""
+    if new_value is models.NOT_PROVIDED:
+        return None
+    if new_value is not None and not isinstance(new_value, enum):
+        if isinstance(new_value, Enum):
+            raise TypeError(
+                "Invalid Enum class passed. Passed {}, expected {}".format(
+                    new_value.__class__.__name__, enum.__name__
+                )
+            )
+        try:
+            new_value = enum(new_value)
+        except ValueError:
+            raise InvalidStatusOperationError(
+                gettext(
+                    "{value!r} is not one of the available choices for enum {enum}."
+                ).format(value=new_value, enum=enum)
+            )
+    return new_value
+
+
+def make_strict_setter(enum, att_name):
+    private_att_name = "_enum_%s" % att_name
+
+    def set_enum(self, new_value):
+        new_value = to_member(enum, new_value)
+        if private_att_name in self.__dict__:
+            # Fetch previous value from private enum attribute.
+            old_value = self.__dict__[private_att_name]
+        else:
+            # First setattr no previous value on instance.
+            old_value = new_value
+        # Update private enum attribute with new value
+        self.__dict__[private_att_name] = new_value
+        self.__dict__[att_name] = new_value
+        # Run validation for new value.
+        validators.validate_valid_transition(enum, old_value, new_value, att_name)
+
+    return set_enum
+
+
+def make_deferred_setter(enum, att_name):
+    private_att_name = "_enum_%s" % att_name
+    original_att_name = "_enum_original_%s" % att_name
+
+    def set_enum_deferred(self, new_value):
+        new_value = to_member(enum, new_value)
+        values = self.__dict__
+        if original_att_name not in values:
+            # First setattr, transitions are validated from this value.
+            values[original_att_name] = new_value
+        values[private_att_name] = values[att_name] = new_value
+
+    return set_enum_deferred
+
+
+def make_unvalidated_setter(enum, att_name):
+    private_att_name = "_enum_%s" % att_name
+
+    def set_enum_unvalidated(self, new_value):
+        new_value = to_member(enum, new_value)
+        self.__dict__[private_att_name] = self.__dict__[att_name] = new_value
+
+    return set_enum_unvalidated
+
+
+# Setter factory per EnumField validation mode
+SETTER_FACTORIES = {
+    "strict": make_strict_setter,
+    "deferred": make_deferred_setter,
+    "off": make_unvalidated_setter,
+}
+
+
+def _reset_deferred_on_refresh(model):
+    """Wrap model.refresh_from_db() so that transitions of EnumFields with
+    validation="deferred" are validated from the refreshed values.
+    """
+    if "_enum_refresh_from_db" in model.__dict__:
+        return
+    refresh_from_db = model.refresh_from_db
+
+    @wraps(refresh_from_db)
+    def refresh_from_db_resetting_deferred(self, *args, **kwargs):
+        refresh_from_db(self, *args, **kwargs)
+        fields = kwargs.get("fields", args[1] if len(args) > 1 else None)
+        values = self.__dict__
+        for field in self._meta.concrete_fields:
+            if not isinstance(field, EnumField) or field.validation != "deferred":
+                continue
+            if fields is None or field.name in fields or field.attname in fields:
+                values["_enum_original_%s" % field.attname] = values.get(field.attname)
+
+    model._enum_refresh_from_db = refresh_from_db
+    model.refresh_from_db = refresh_from_db_resetting_deferred
+
+
+@EnumField.register_lookup
+class HotLookup(models.Lookup):
+    """field__hot=True matches the hot members of the field, see
+    EnumField.hot_index(). The values are inlined as in the index condition,
+    since SQLite only uses a partial index when the query repeats its
+    condition literally. field__hot=False also matches NULL.
+    """
+
+    lookup_name = "hot"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, params = self.process_lhs(compiler, connection)
+        values = ", ".join(str(value) for value in self.lhs.output_field.hot_values)
+        if not values:
+            # Nothing is hot
+            return ("1 = 0", []) if self.rhs else ("1 = 1", [])
+        if self.rhs:
+            return "%s IN (%s)" % (lhs, values), params
+        if self.lhs.output_field.null:
+            return "(%s NOT IN (%s) OR %s IS NULL)" % (lhs, values, lhs), params * 2
+        return "%s NOT IN (%s)" % (lhs, values), params
@@ -0,0 +1,123 @@
+from django.utils.translation import gettext
+
+from django_enumfield import validators
+from django_enumfield.db.utils import get_enum_fields
+from django_enumfield.exceptions import InvalidStatusOperationError
+
+
+class EnumPickleMixin(object):
+    """Model mixin storing the members of EnumFields as plain ints when
+    pickled and restoring the members when unpickled, which keeps pickles
+    small, e.g. for model instances stored in a cache.
+
+    Usage:
+        class Order(EnumPickleMixin, models.Model):
+            status = EnumField(OrderStatus)
+    """
+
+    @classmethod
+    def _get_enum_pickle_fields(cls):
+        # (attname, private attname, value to member map) per EnumField,
+        # collected once per model class.
+        fields = cls.__dict__.get("_enum_pickle_fields")
+        if fields is None:
+            fields = [
+                (
+                    field.attname,
+                    "_enum_%s" % field.attname,
+                    field.enum._value2member_map_,
+                )
+                for field in get_enum_fields(cls)
+            ]
+            cls._enum_pickle_fields = fields
+        return fields
+
+    def __getstate__(self):
+        # Django before 3.2 returns the __dict__ of the instance itself.
+        state = dict(super(EnumPickleMixin, self).__getstate__())  # type: ignore[misc]
+        for attname, private_attname, _ in self._get_enum_pickle_fields():
+            # Same member as the field value, set by the EnumField setter.
+            state.pop(private_attname, None)
+            value = state.get(attname)
+            if value is not None:
+                state[attname] = int(value)
+        return state
+
+    def __setstate__(self, state):
+        super(EnumPickleMixin, self).__setstate__(state)  # type: ignore[misc]
+        values = self.__dict__
+        for attname, private_attname, members in self._get_enum_pickle_fields():
+            if attname not in values:
+                # Deferred field
+                continue
+            value = values[attname]
+            if value is not None:
+                value = members.get(value)
+            values[attname] = values[private_attname] = value
+
+
+class TransitionMixin(object):
+    """Model mixin running the guards and handlers registered with
+    EnumField.guard() and EnumField.on_transition() when changing state
+    through transition_to().
+    """
+
+    def _get_transition_field(self, field_name=None):
+        if field_name is not None:
+            return self._meta.get_field(field_name)  # type: ignore[attr-defined]
+        fields = get_enum_fields(self.__class__)
+        with_callbacks = [field for field in fields if field.transition_dispatch]
+        if len(with_callbacks) == 1:
+            return with_callbacks[0]
+        if len(fields) == 1:
+            return fields[0]
+        raise ValueError(
+            "{} has several EnumFields, pass the field to transition.".format(
+                self.__class__.__name__
+            )
+        )
+
+    def transition_to(self, value, field=None, **kwargs):
+        """Change an EnumField to value. Guards of the (current value, value)
+        transition are called first and any of them returning False raises
+        InvalidStatusOperationError, as does a transition the enum does not
+        allow. The value is then set and the handlers of the transition are
+        called. The instance is not saved.
+
+        :param value: The member, value or name to transition to
+        :param field: Name of the EnumField, optional when the model has a
+            single EnumField or a single one with guards or handlers
+        :param kwargs: Passed to guards and handlers
+        :return: The previous value
+        """
+        field = self._get_transition_field(field)
+        to_value = field.enum.get(value)
+        if to_value is None:
+            raise InvalidStatusOperationError(
+                gettext(
+                    "{value!r} is not one of the available choices for enum {enum}."
+                ).format(value=value, enum=field.enum)
+            )
+        from_value = getattr(self, field.attname)
+        # Validate before guards run and before the value is touched.
+        validators.validate_valid_transition(
+            field.enum, from_value, to_value, field.attname
+        )
+        guards, handlers = field.transition_dispatch.get(
+            (from_value, to_value), ((), ())
+        )
+        for guard in guards:
+            if not guard(self, from_value, to_value, **kwargs):
+                raise InvalidStatusOperationError(
+                    gettext(
+                        '{enum} can not go from "{from_value}" to "{to_value}"'
+                    ).format(
+                        enum=field.enum.__name__,
+                        from_value=getattr(from_value, "name", from_value),
+                        to_value=to_value.name,
+                    )
+                )
+        setattr(self, field.attname, to_value)
+        for handler in handlers:
+            handler(self, from_value, to_value, **kwargs)
+        return from_value
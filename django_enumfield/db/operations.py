@@ -0,0 +1,206 @@
+import copy
+import hashlib
+from typing import Any, Dict, List, Mapping, Optional, Sequence  # noqa: F401
+
+from django.db import migrations
+
+
+def normalize_transitions(transitions):
+    # type: (Mapping[Any, Sequence[Any]]) -> Dict[int, List[int]]
+    """Transitions of an enum as {to value: [sorted from values]} of ints."""
+    return {
+        int(to_value): sorted(int(value) for value in from_values)
+        for to_value, from_values in sorted(transitions.items())
+    }
+
+
+class EnforceTransitions(migrations.operations.base.Operation):
+    """Create a BEFORE UPDATE trigger rejecting changes of an EnumField column
+    that are not in transitions, {to value: [from values]} as in
+    Enum.__transitions__, on SQLite and PostgreSQL. Writes bypassing the ORM,
+    e.g. QuerySet.update() and raw SQL, are then validated by the database,
+    which raises IntegrityError.
+
+    Changes from or to NULL are not checked. The trigger is replaced by a later
+    EnforceTransitions of the same field, add one when the transitions of the
+    enum change (check django_enumfield.W001 warns about it). Empty
+    transitions drop the trigger. Migrating backwards restores the trigger of
+    the previous EnforceTransitions of the field, recorded in the migration
+    state.
+
+    SQLite drops the trigger when a later migration remakes the table, e.g.
+    AlterField or RemoveField of the model. Add EnforceTransitions again after
+    such operations, check django_enumfield.W003 warns about missing
+    triggers. Usage:
+
+        operations = [
+            EnforceTransitions("person", "status", {2: [1], 3: [2]}),
+        ]
+    """
+
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name, name, transitions):
+        self.model_name = model_name
+        self.name = name
+        self.transitions = normalize_transitions(transitions)
+
+    @classmethod
+    def for_field(cls, model, field_name):
+        """The operation enforcing the current transitions of an EnumField."""
+        field = model._meta.get_field(field_name)
+        return cls(model._meta.model_name, field_name, field.enum.__transitions__)
+
+    def deconstruct(self):
+        return (
+            self.__class__.__name__,
+            [self.model_name, self.name, self.transitions],
+            {},
+        )
+
+    def state_forwards(self, app_label, state):
+        # The transitions are recorded on a copy of the field in the state,
+        # which database_backwards() restores from the previous state.
+        model_state = state.models[app_label, self.model_name.lower()]
+        fields = model_state.fields
+        if isinstance(fields, dict):
+            fields[self.name] = self._with_transitions(fields[self.name])
+        else:
+            # Django before 3.1 keeps a list of (name, field).
+            model_state.fields = [
+                (name, self._with_transitions(field) if name == self.name else field)
+                for name, field in fields
+            ]
+
+    def _with_transitions(self, field):
+        field = copy.copy(field)
+        field.enforced_transitions = self.transitions
+        return field
+
+    def describe(self):
+        return "Enforce transitions of {}.{} with a trigger".format(
+            self.model_name, self.name
+        )
+
+    @property
+    def migration_name_fragment(self):
+        return "enforce_{}_{}_transitions".format(self.model_name, self.name)
+
+    def get_trigger_name(self, table, column):
+        # Short enough for any backend.
+        digest = hashlib.sha256(
+            "{}.{}".format(table, column).encode("utf-8")
+        ).hexdigest()[:8]
+        return "%s_%s_%s_tr" % (table[:12], column[:8], digest)
+
+    def trigger_exists(self, connection, table, column):
+        # type: (Any, str, str) -> Optional[bool]
+        """Whether the trigger of the operation exists in the database of
+        connection, None on backends without triggers.
+        """
+        name = self.get_trigger_name(table, column)
+        if connection.vendor == "sqlite":
+            sql = "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = %s"
+        elif connection.vendor == "postgresql":
+            sql = "SELECT 1 FROM pg_trigger WHERE tgname = %s AND NOT tgisinternal"
+        else:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [name])
+            return cursor.fetchone() is not None
+
+    def get_condition(self, column, quote_name):
+        """SQL condition true for updates making an invalid transition."""
+        old, new = "OLD." + quote_name(column), "NEW." + quote_name(column)
+        allowed = " OR ".join(
+            "({} = {} AND {} IN ({}))".format(
+                new, to_value, old, ", ".join(str(value) for value in from_values)
+            )
+            for to_value, from_values in self.transitions.items()
+            if from_values
+        )
+        return (
+            "{old} IS NOT NULL AND {new} IS NOT NULL AND {old} <> {new}{rest}".format(
+                old=old,
+                new=new,
+                rest=" AND NOT ({})".format(allowed) if allowed else "",
+            )
+        )
+
+    def get_sql(self, vendor, table, column, quote_name):
+        # type: (str, str, str, Any) -> List[str]
+        """Statements (re)creating the trigger, dropping it when transitions
+        are empty.
+        """
+        name = self.get_trigger_name(table, column)
+        message = "Invalid transition of {}.{}".format(table, column)
+        condition = self.get_condition(column, quote_name)
+        if vendor == "sqlite":
+            statements = ["DROP TRIGGER IF EXISTS {}".format(quote_name(name))]
+            if self.transitions:
+                statements.append(
+                    "CREATE TRIGGER {name} BEFORE UPDATE OF {column} ON {table} "
+                    "FOR EACH ROW WHEN {condition} "
+                    "BEGIN SELECT RAISE(ABORT, '{message}'); END".format(
+                        name=quote_name(name),
+                        column=quote_name(column),
+                        table=quote_name(table),
+                        condition=condition,
+                        message=message,
+                    )
+                )
+            return statements
+        if vendor == "postgresql":
+            statements = [
+                "DROP TRIGGER IF EXISTS {} ON {}".format(
+                    quote_name(name), quote_name(table)
+                ),
+                "DROP FUNCTION IF EXISTS {}()".format(quote_name(name)),
+            ]
+            if self.transitions:
+                statements += [
+                    "CREATE FUNCTION {name}() RETURNS trigger AS $$ BEGIN "
+                    "IF {condition} THEN RAISE EXCEPTION '{message}: % to %', "
+                    "OLD.{column}, NEW.{column} USING ERRCODE = 'check_violation'; "
+                    "END IF; RETURN NEW; END; $$ LANGUAGE plpgsql".format(
+                        name=quote_name(name),
+                        condition=condition,
+                        message=message,
+                        column=quote_name(column),
+                    ),
+                    "CREATE TRIGGER {name} BEFORE UPDATE OF {column} ON {table} "
+                    "FOR EACH ROW EXECUTE PROCEDURE {name}()".format(
+                        name=quote_name(name),
+                        column=quote_name(column),
+                        table=quote_name(table),
+                    ),
+                ]
+            return statements
+        return []
+
+    def _execute(self, app_label, schema_editor, state, transitions):
+        model = state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        column = model._meta.get_field(self.name).column
+        operation = EnforceTransitions(self.model_name, self.name, transitions)
+        for statement in operation.get_sql(
+            schema_editor.connection.vendor,
+            model._meta.db_table,
+            column,
+            schema_editor.quote_name,
+        ):
+            schema_editor.execute(statement, params=None)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self._execute(app_label, schema_editor, to_state, self.transitions)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        # Restores the trigger of the previous EnforceTransitions of the
+        # field, or drops it. A field altered in between has no transitions
+        # recorded.
+        model_state = to_state.models[app_label, self.model_name.lower()]
+        field = dict(model_state.fields)[self.name]
+        transitions = getattr(field, "enforced_transitions", {})
+        self._execute(app_label, schema_editor, to_state, transitions)
@@ -0,0 +1,279 @@
+from enum import Enum
+from typing import Any, List, Sequence, Tuple  # noqa: F401
+
+from django.db import models
+from django.utils.translation import gettext
+
+from django_enumfield import validators
+from django_enumfield.exceptions import InvalidStatusOperationError
+
+# Bits of a signed 64 bit integer column usable without going negative.
+MAX_BITS = 63
+
+
+class PackedMember(object):
+    """Position of one enum in a PackedEnumField.
+
+    Members are stored as value - minimum + 1 in width bits starting at
+    shift, 0 meaning None. The width defaults to the bits needed for the
+    range of values, and minimum to the smallest value.
+    """
+
+    def __init__(self, name, enum, shift, width=None, minimum=None):
+        values = [member.value for member in enum]
+        self.name = name
+        self.enum = enum
+        self.minimum = min(values) if minimum is None else minimum
+        needed = (max(values) - self.minimum + 1).bit_length()
+        self.width = needed if width is None else width
+        if self.width < needed or self.minimum > min(values):
+            raise ValueError(
+                "{} does not fit in {} bits from {}.".format(
+                    enum.__name__, self.width, self.minimum
+                )
+            )
+        self.shift = shift
+        self.mask = ((1 << self.width) - 1) << shift
+        self.members = {
+            self.encode(member): member for member in enum  # type: ignore[attr-defined]
+        }
+
+    def encode(self, member):
+        # type: (Any) -> int
+        if member is None:
+            return 0
+        return int(member) - self.minimum + 1
+
+    def from_code(self, code):
+        # type: (int) -> Any
+        if not code:
+            return None
+        try:
+            return self.members[code]
+        except KeyError:
+            raise InvalidStatusOperationError(
+                gettext("{code} is not a stored value of enum {enum}.").format(
+                    code=code, enum=self.enum.__name__
+                )
+            )
+
+    def decode(self, packed):
+        # type: (int) -> Any
+        return self.from_code(((packed or 0) & self.mask) >> self.shift)
+
+    def pack(self, packed, member):
+        # type: (int, Any) -> int
+        return ((packed or 0) & ~self.mask) | (self.encode(member) << self.shift)
+
+
+class PackedEnumField(models.BigIntegerField):
+    """Several enums bit-packed into one integer column, each taking the bits
+    needed for its range of values, or a pinned width leaving room for new
+    members.
+    Every enum is accessed through an attribute of the model, with the usual
+    transition validation, and filtered with field__name lookups.
+    The layout (shift, width, minimum of every enum) is part of
+    deconstruct(), and check django_enumfield.E002 fails when it differs
+    from the migrations, since stored values are not repacked.
+    Usage:
+        class Lamp(models.Model):
+            flags = PackedEnumField([("state", LampState), ("color", Color, 4)])
+
+        lamp = Lamp.objects.create(state=LampState.ON)
+        lamp.color = Color.RED
+        Lamp.objects.filter(flags__state=LampState.ON)
+    """
+
+    def __init__(self, enums, *args, **kwargs):
+        # Recorded by migrations, used as is by their historical models.
+        layout = kwargs.pop("layout", None)
+        self.enums = [tuple(entry) for entry in enums]  # type: List[Tuple[Any, ...]]
+        self.packed_members = {}
+        shift = 0
+        for index, entry in enumerate(self.enums):
+            name, enum = entry[:2]
+            width = entry[2] if len(entry) > 2 else None
+            minimum = None
+            if layout is not None:
+                _, shift, width, minimum = layout[index]
+            member = PackedMember(name, enum, shift, width, minimum)
+            self.packed_members[name] = member
+            shift += member.width
+        if shift > MAX_BITS:
+            raise ValueError(
+                "The enums need {} bits, more than the {} of a packed "
+                "column.".format(shift, MAX_BITS)
+            )
+        if "default" not in kwargs:
+            kwargs["default"] = self.pack_defaults()
+        super(PackedEnumField, self).__init__(*args, **kwargs)
+
+    def get_layout(self):
+        # type: () -> List[Tuple[str, int, int, int]]
+        return [
+            (member.name, member.shift, member.width, member.minimum)
+            for member in self.packed_members.values()
+        ]
+
+    def pack_defaults(self):
+        # type: () -> int
+        packed = 0
+        for member in self.packed_members.values():
+            packed = member.pack(packed, member.enum.default())
+        return packed
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super(PackedEnumField, self).contribute_to_class(cls, name, *args, **kwargs)
+        if not cls._meta.abstract:
+            setattr(cls, self.attname, self._make_packed_property())
+            for member in self.packed_members.values():
+                setattr(cls, member.name, self._make_property(member))
+
+    def _make_packed_property(self):
+        """The column itself, validating the transition of every enum whose
+        bits change when assigned a packed value. The first value, e.g. when
+        loaded from the database, is stored as is.
+        """
+        attname = self.attname
+        assigned_attname = "_packed_%s" % attname
+        packed_members = list(self.packed_members.values())
+
+        def get_packed(self):
+            if attname not in self.__dict__:
+                # Deferred
+                self.refresh_from_db(fields=[attname])
+            return self.__dict__[attname]
+
+        def set_packed(self, value):
+            values = self.__dict__
+            if attname in values:
+                assigned = values.setdefault(assigned_attname, set())
+                for packed_member in packed_members:
+                    old_member = packed_member.decode(values[attname])
+                    new_member = packed_member.decode(value)
+                    if old_member != new_member and (
+                        packed_member.name in assigned or not self._state.adding
+                    ):
+                        validators.validate_valid_transition(
+                            packed_member.enum, old_member, new_member, attname
+                        )
+                    assigned.add(packed_member.name)
+            values[attname] = value
+
+        return property(get_packed, set_packed)
+
+    def _make_property(self, packed_member):
+        attname = self.attname
+        name = packed_member.name
+        enum = packed_member.enum
+        assigned_attname = "_packed_%s" % attname
+
+        def get_member(self):
+            return packed_member.decode(getattr(self, attname))
+
+        def set_member(self, value):
+            if value is not None and not isinstance(value, enum):
+                if isinstance(value, Enum):
+                    raise TypeError(
+                        "Invalid Enum class passed. Passed {}, expected {}".format(
+                            value.__class__.__name__, enum.__name__
+                        )
+                    )
+                try:
+                    value = enum(value)
+                except ValueError:
+                    raise InvalidStatusOperationError(
+                        gettext(
+                            "{value!r} is not one of the available choices "
+                            "for enum {enum}."
+                        ).format(value=value, enum=enum)
+                    )
+            values = self.__dict__
+            assigned = values.setdefault(assigned_attname, set())
+            # Like EnumField, the first value of a new instance is not a
+            # transition.
+            if name in assigned or not self._state.adding:
+                validators.validate_valid_transition(
+                    enum, get_member(self), value, attname
+                )
+            assigned.add(name)
+            values[attname] = packed_member.pack(getattr(self, attname), value)
+
+        return property(get_member, set_member)
+
+    def get_transform(self, name):
+        packed_member = self.packed_members.get(name)
+        if packed_member is not None:
+            return PackedMemberTransformFactory(packed_member)
+        return super(PackedEnumField, self).get_transform(name)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super(PackedEnumField, self).deconstruct()
+        kwargs["enums"] = self.enums
+        kwargs["layout"] = self.get_layout()
+        if kwargs.get("default") == self.pack_defaults():
+            del kwargs["default"]
+        return name, path, args, kwargs
+
+
+class PackedMemberField(models.IntegerField):
+    """Output field of PackedMemberTransform, comparing and returning
+    members of one enum of a PackedEnumField.
+    """
+
+    def __init__(self, packed_member, *args, **kwargs):
+        self.packed_member = packed_member
+        super(PackedMemberField, self).__init__(*args, **kwargs)
+
+    def get_prep_value(self, value):
+        if value is None or hasattr(value, "resolve_expression"):
+            return value
+        member = self.packed_member.enum.get(value)
+        if member is None:
+            raise InvalidStatusOperationError(
+                gettext(
+                    "{value!r} is not one of the available choices for enum {enum}."
+                ).format(value=value, enum=self.packed_member.enum)
+            )
+        return self.packed_member.encode(member)
+
+    def from_db_value(self, value, *_):
+        if value is None:
+            return value
+        return self.packed_member.from_code(value)
+
+
+@PackedMemberField.register_lookup
+class PackedMemberIsNull(models.lookups.IsNull):
+    """None is stored as 0."""
+
+    def as_sql(self, compiler, connection):
+        sql, params = compiler.compile(self.lhs)
+        return ("%s = 0" if self.rhs else "%s <> 0") % sql, params
+
+
+class PackedMemberTransform(models.Transform):
+    """field__name, the bits of one enum extracted with a mask and a shift."""
+
+    def __init__(self, packed_member, *args, **kwargs):
+        self.packed_member = packed_member
+        self.lookup_name = packed_member.name
+        kwargs["output_field"] = PackedMemberField(packed_member)
+        super(PackedMemberTransform, self).__init__(*args, **kwargs)
+
+    def as_sql(self, compiler, connection):
+        lhs, params = compiler.compile(self.lhs)
+        ops = connection.ops
+        masked = ops.combine_expression("&", [lhs, str(self.packed_member.mask)])
+        shifted = ops.combine_expression(
+            ">>", ["(%s)" % masked, str(self.packed_member.shift)]
+        )
+        return "(%s)" % shifted, params
+
+
+class PackedMemberTransformFactory(object):
+    def __init__(self, packed_member):
+        self.packed_member = packed_member
+
+    def __call__(self, *args, **kwargs):
+        return PackedMemberTransform(self.packed_member, *args, **kwargs)
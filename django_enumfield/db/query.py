@@ -0,0 +1,126 @@
+from django.db import models
+from django.db.models.query import NamedValuesListIterable, ValuesListIterable
+from django.db.models.sql.constants import MULTI
+from django.utils import timezone
+
+from django_enumfield.db.fields import EnumField
+
+
+def iter_converted_rows(compiler, chunked_fetch, chunk_size):
+    """Execute the query of compiler and yield row tuples with the values of
+    EnumFields turned into members. Members are looked up one column of a
+    fetched chunk at a time, instead of calling from_db_value() per value.
+    """
+    results = compiler.execute_sql(
+        MULTI, chunked_fetch=chunked_fetch, chunk_size=chunk_size
+    )
+    fields = [column[0] for column in compiler.select[: compiler.col_count]]
+    converters = compiler.get_converters(fields)
+    # (position, value to member map) of EnumField columns
+    enum_columns = []
+    for position, (column_converters, expression) in list(converters.items()):
+        field = getattr(expression, "output_field", None)
+        if not isinstance(field, EnumField):
+            continue
+        enum_columns.append((position, field.enum._value2member_map_))
+        column_converters = [
+            converter
+            for converter in column_converters
+            if converter != field.from_db_value
+        ]
+        if column_converters:
+            converters[position] = (column_converters, expression)
+        else:
+            del converters[position]
+
+    for chunk in results:
+        if converters:
+            chunk = compiler.apply_converters(chunk, converters)
+        if not enum_columns:
+            yield from map(tuple, chunk)
+            continue
+        columns = list(zip(*chunk))
+        if not columns:
+            continue
+        for position, members in enum_columns:
+            columns[position] = map(members.get, columns[position])
+        yield from zip(*columns)
+
+
+class EnumValuesListIterable(ValuesListIterable):
+    """ValuesListIterable converting EnumField values in chunks, see
+    EnumQuerySet.enum_values_list().
+    """
+
+    def __iter__(self):
+        queryset = self.queryset
+        query = queryset.query
+        compiler = query.get_compiler(queryset.db)
+        rows = iter_converted_rows(compiler, self.chunked_fetch, self.chunk_size)
+        if queryset._fields:
+            # Same column order as ValuesListIterable
+            names = [
+                *query.extra_select,
+                *query.values_select,
+                *query.annotation_select,
+            ]
+            fields = [
+                *queryset._fields,
+                *(f for f in query.annotation_select if f not in queryset._fields),
+            ]
+            if fields != names:
+                index_map = {name: index for index, name in enumerate(names)}
+                positions = [index_map[f] for f in fields]
+                return (tuple(row[i] for i in positions) for row in rows)
+        return rows
+
+
+class NamedEnumValuesListIterable(NamedValuesListIterable, EnumValuesListIterable):
+    pass
+
+
+class FlatEnumValuesListIterable(EnumValuesListIterable):
+    def __iter__(self):
+        for row in super(FlatEnumValuesListIterable, self).__iter__():
+            yield row[0]
+
+
+class EnumQuerySet(models.QuerySet):
+    """QuerySet with enum_values_list(), use as
+    objects = EnumQuerySet.as_manager()
+    """
+
+    def enum_values_list(self, *fields, flat=False, named=False):
+        """Like values_list(), returning the values of EnumFields as members.
+        The members are looked up for a whole fetched chunk at once, e.g. the
+        chunk_size of iterator(), which is faster than values_list() calling
+        from_db_value() for every value. Values that are not members are
+        returned as None, like values_list() does.
+        """
+        clone = self.values_list(*fields, flat=flat, named=named)
+        if named:
+            clone._iterable_class = NamedEnumValuesListIterable
+        elif flat:
+            clone._iterable_class = FlatEnumValuesListIterable
+        else:
+            clone._iterable_class = EnumValuesListIterable
+        return clone
+
+    def in_state_longer_than(self, field_name, value, duration):
+        """Rows with value in the EnumField field_name, declared with
+        track_entered_at=True, that entered it more than duration (a
+        timedelta) ago. A range scan of the (field, entered at) index.
+        """
+        field = self.model._meta.get_field(field_name)
+        if field.entered_at_field is None:
+            raise ValueError(
+                "{}.{} is not declared with track_entered_at=True".format(
+                    self.model.__name__, field_name
+                )
+            )
+        return self.filter(
+            **{
+                field_name: value,
+                field.entered_at_field.name + "__lt": timezone.now() - duration,
+            }
+        )
@@ -0,0 +1,72 @@
+from typing import Any, Iterator, List, Optional, Sequence, Tuple  # noqa: F401
+
+from django.apps import apps
+from django.db import models
+
+from django_enumfield.db.fields import EnumField
+
+
+def get_enum_fields(model):
+    # type: (type) -> List[EnumField]
+    """Return every concrete EnumField declared on model."""
+    return [
+        field
+        for field in model._meta.concrete_fields  # type: ignore[attr-defined]
+        if isinstance(field, EnumField)
+    ]
+
+
+def iter_enum_models(app_labels=None):
+    # type: (Optional[Sequence[str]]) -> Iterator[Tuple[type, List[EnumField]]]
+    """Yield (model, enum_fields) for every installed model with an EnumField.
+    Proxy and unmanaged models are skipped since they share or do not own
+    their tables.
+
+    :param app_labels: Restrict to these app labels or "app_label.ModelName"
+    """
+    for model in apps.get_models():
+        opts = model._meta
+        if opts.proxy or not opts.managed:
+            continue
+        if app_labels and not (
+            opts.app_label in app_labels or opts.label in app_labels
+        ):
+            continue
+        fields = get_enum_fields(model)
+        if fields:
+            yield model, fields
+
+
+def raw_value(field, lookup=None):
+    # type: (models.Field, Optional[str]) -> models.Expression
+    """An expression selecting the stored integer of field, bypassing
+    from_db_value() so that values outside of the enum are not turned into None.
+
+    :param lookup: Path to field when it is reached through relations
+    """
+    return models.ExpressionWrapper(
+        models.F(lookup or field.attname), output_field=models.IntegerField()
+    )
+
+
+def iter_chunks(queryset, *fields, chunk_size=2000):
+    # type: (models.QuerySet, models.Field, int) -> Iterator[List[Tuple]]
+    """Keyset paginate queryset by primary key, yielding lists of
+    (pk, raw value of field, ...) rows. Only one chunk is held in memory at a
+    time, independent of table size.
+    """
+    pk_name = queryset.model._meta.pk.attname
+    columns = [raw_value(field) for field in fields]
+    queryset = queryset.order_by(pk_name)
+    last_pk = None
+    while True:
+        chunk_queryset = queryset
+        if last_pk is not None:
+            chunk_queryset = chunk_queryset.filter(**{pk_name + "__gt": last_pk})
+        chunk = list(chunk_queryset.values_list(pk_name, *columns)[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last_pk = chunk[-1][0]
@@ -0,0 +1,142 @@
+"""Waiting for EnumField columns to reach a state, see wait_for_state()."""
+
+import asyncio
+import random
+import time
+from typing import Any  # noqa: F401
+
+from django.db import models
+from django.utils.translation import gettext
+
+from django_enumfield.exceptions import UnreachableStateError
+
+__all__ = ("wait_for_state", "wait_for_state_sync")
+
+
+class _StatePoll(object):
+    """Polling state shared by wait_for_state() and wait_for_state_sync()."""
+
+    def __init__(
+        self, instance, field, targets, timeout, interval, max_interval, backoff
+    ):
+        if not isinstance(field, models.Field):
+            field = instance._meta.get_field(field)
+        self.field = field
+        enum = field.enum
+        if isinstance(targets, (int, str)):
+            targets = (targets,)
+        self.targets = set()
+        for target in targets:
+            member = enum.get(target)
+            if member is None:
+                raise ValueError(
+                    "{!r} is not a member of {}".format(target, enum.__name__)
+                )
+            self.targets.add(member)
+        # Only the enum column is fetched.
+        self.queryset = (
+            instance.__class__._base_manager.using(instance._state.db)
+            .filter(pk=instance.pk)
+            .values_list(field.attname, flat=True)
+        )
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+    def check(self, value):
+        # type: (Any) -> bool
+        if value in self.targets:
+            return True
+        if value is not None and self.targets.isdisjoint(
+            self.field.enum.reachable_from(value)
+        ):
+            raise UnreachableStateError(
+                gettext('{enum} can not go from "{from_value}" to {to_values}').format(
+                    enum=self.field.enum.__name__,
+                    from_value=value.name,
+                    to_values=", ".join(
+                        '"{}"'.format(target.name) for target in sorted(self.targets)
+                    ),
+                )
+            )
+        return False
+
+    def next_delay(self):
+        # type: () -> float
+        """Seconds to sleep before the next poll, with exponential backoff
+        and jitter so that many waiters do not poll in lockstep.
+        """
+        delay = self.interval * random.uniform(0.5, 1)
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    "{} did not reach {} in time".format(
+                        self.field.name,
+                        ", ".join(target.name for target in sorted(self.targets)),
+                    )
+                )
+            delay = min(delay, remaining)
+        return delay
+
+
+async def wait_for_state(
+    instance,
+    field,
+    targets,
+    timeout=None,
+    interval=0.1,
+    max_interval=5.0,
+    backoff=2.0,
+):
+    """Wait until the stored value of an EnumField of instance is one of
+    targets, polling only that column. The instance is not modified.
+
+    :param field: The EnumField or its name
+    :param targets: A member or an iterable of members to wait for
+    :param timeout: Seconds to wait before raising TimeoutError, None waits
+        for as long as a target can still be reached
+    :param interval: Seconds to wait after the first poll, multiplied by
+        backoff after every poll up to max_interval, with jitter
+    :raises UnreachableStateError: When no target can be reached from the
+        stored value through the transitions of the enum
+    :raises instance.DoesNotExist: When the row is deleted
+    :return: The target member reached
+    """
+    poll = _StatePoll(
+        instance, field, targets, timeout, interval, max_interval, backoff
+    )
+    if hasattr(poll.queryset, "aget"):
+        get = poll.queryset.aget
+    else:  # pragma: no cover
+        # Before Django 4.1, asgiref is a dependency of Django 3.0+
+        from asgiref.sync import sync_to_async
+
+        get = sync_to_async(poll.queryset.get)
+    while True:
+        value = await get()
+        if poll.check(value):
+            return value
+        await asyncio.sleep(poll.next_delay())
+
+
+def wait_for_state_sync(
+    instance,
+    field,
+    targets,
+    timeout=None,
+    interval=0.1,
+    max_interval=5.0,
+    backoff=2.0,
+):
+    """Blocking version of wait_for_state()."""
+    poll = _StatePoll(
+        instance, field, targets, timeout, interval, max_interval, backoff
+    )
+    while True:
+        value = poll.queryset.get()
+        if poll.check(value):
+            return value
+        time.sleep(poll.next_delay())
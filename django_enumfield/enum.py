@@ -1,9 +1,16 @@
 from __future__ import absolute_import
 
+import bisect
+import hashlib
+import json
 import logging
 import enum
 from typing import (
     Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -14,25 +21,41 @@ from typing import (
     Mapping,
     TYPE_CHECKING,
 )
+from django.utils import translation
 from django.utils.encoding import force_str
+from django.utils.translation import gettext
+
+from django_enumfield.choices import EnumChoices
+from django_enumfield.exceptions import InvalidStatusOperationError
+from django_enumfield.registry import registry
 
 if TYPE_CHECKING:
     from django.utils.functional import _StrOrPromise as StrOrPromise
 
+    from django_enumfield.db.fields import EnumField
+
 try:
     from django.utils.functional import classproperty  # type: ignore
 except ImportError:
     # Pre-Django 3.1
     from django.utils.decorators import classproperty
 
-from django_enumfield.db.fields import EnumField
-
-__all__ = ("Enum", "EnumField")
+__all__ = ("Enum", "EnumChoices", "EnumField")
 
 logger = logging.getLogger(__name__)
 RAISE = object()
 
 
+def __getattr__(name):
+    # EnumField is imported on first use only, so that defining enums does not
+    # pull in the model field and forms machinery.
+    if name == "EnumField":
+        from django_enumfield.db.fields import EnumField
+
+        return EnumField
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 class BlankEnum(enum.Enum):
     BLANK = ""
 
@@ -64,6 +87,16 @@ class Enum(enum.IntEnum):
     __labels__ = {}  # type: Mapping[int, StrOrPromise]
     __default__ = None  # type: Optional[int]
     __transitions__ = {}  # type: Mapping[int, Sequence[int]]
+    # Let form fields share the cached choices sequence, like model fields do,
+    # instead of a list each. Useful for enums with very many members.
+    __lazy_choices__ = False  # type: bool
+    # Members most queries filter on, EnumFields of the enum get a partial
+    # index of rows holding one of them. See EnumField(hot=...).
+    __hot__ = ()  # type: Sequence[int]
+
+    def __init_subclass__(cls, **kwargs):
+        super(Enum, cls).__init_subclass__(**kwargs)
+        registry.register(cls)
 
     def __str__(self):
         return self.label
@@ -104,6 +137,50 @@ class Enum(enum.IntEnum):
         path = "{}.{}".format(c.__module__, c.__name__)
         return path, [self.value], {}
 
+    @classmethod
+    def _cached(cls, key, build):
+        # type: (Any, Any) -> Any
+        """Return build() memoized on this class (and not on subclasses) by key.
+        Members are fixed once the class is created, so anything derived from
+        them is safe to keep for the lifetime of the class.
+        """
+        cache = cls.__dict__.get("_enumfield_cache_")
+        if cache is None:
+            cache = {}
+            setattr(cls, "_enumfield_cache_", cache)
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = build()
+            return value
+
+    @classmethod
+    def name_map(cls):
+        # type: () -> Mapping[int, str]
+        """
+        :return: Cached mapping of every enum value to its name
+        """
+        return cls._cached(
+            "name_map", lambda: {member.value: member.name for member in cls}
+        )
+
+    @classmethod
+    def label_map(cls, language=None):
+        # type: (Optional[str]) -> Mapping[int, str]
+        """
+        :param language: Language to translate labels to, defaults to the
+            currently active language
+        :return: Cached mapping of every enum value to its label
+        """
+        if language is None:
+            language = translation.get_language()
+
+        def build():
+            with translation.override(language):
+                return {member.value: member.label for member in cls}
+
+        return cls._cached(("label_map", language), build)
+
     @classmethod
     def items(cls):
         # type: () -> List[Tuple[str, int]]
@@ -127,6 +204,73 @@ class Enum(enum.IntEnum):
             choices.insert(0, (BlankEnum.BLANK.value, BlankEnum.BLANK))
         return choices
 
+    @classmethod
+    def search(cls, text, limit=None, language=None):
+        # type: (str, Optional[int], Optional[str]) -> List[Enum]
+        """Find members by label, case insensitively, e.g. for autocompletion.
+        Labels starting with text are found by bisecting a sorted label index
+        and come first, followed by labels containing text elsewhere.
+        :param text: Text to search for
+        :param limit: Maximum number of members to return
+        :param language: Language of the labels, defaults to the active language
+        :return: List of matching members
+        """
+        if language is None:
+            language = translation.get_language()
+
+        def build():
+            index = sorted(
+                (label.casefold(), value)
+                for value, label in cls.label_map(language).items()
+            )
+            return [label for label, _ in index], [cls(value) for _, value in index]
+
+        labels, members = cls._cached(("search_index", language), build)
+        text = text.casefold()
+        if limit is None:
+            limit = len(members)
+
+        results = []  # type: List[Enum]
+        start = position = bisect.bisect_left(labels, text)
+        while (
+            position < len(labels)
+            and len(results) < limit
+            and labels[position].startswith(text)
+        ):
+            results.append(members[position])
+            position += 1
+        if len(results) < limit:
+            for index, label in enumerate(labels):
+                if start <= index < position or text not in label:
+                    continue
+                results.append(members[index])
+                if len(results) >= limit:
+                    break
+        return results
+
+    @classmethod
+    def fingerprint(cls):
+        # type: () -> str
+        """
+        :return: Cached hash of the members, default and transitions, which
+            changes when any of them changes
+        """
+
+        def build():
+            default = cls.default()
+            structure = {
+                "members": sorted((member.value, member.name) for member in cls),
+                "default": default.value if default is not None else None,
+                "transitions": sorted(
+                    (int(to_value), sorted(int(value) for value in from_values))
+                    for to_value, from_values in cls.__transitions__.items()
+                ),
+            }
+            content = json.dumps(structure, separators=(",", ":"))
+            return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+        return cls._cached("fingerprint", build)
+
     @classmethod
     def default(cls):
         # type: () -> Optional[Enum]
@@ -155,6 +299,8 @@ class Enum(enum.IntEnum):
         :param kwargs: Arguments passed in EnumField.__init__()
         :rtype: EnumField
         """
+        from django_enumfield.db.fields import EnumField
+
         return EnumField(cls, **kwargs)
 
     @classmethod
@@ -209,6 +355,66 @@ class Enum(enum.IntEnum):
             return value.label
         return None
 
+    @classmethod
+    def from_label(
+        cls,
+        text,  # type: str
+        language=None,  # type: Optional[str]
+        case_insensitive=False,  # type: bool
+        default=None,  # type: Optional[Default]
+    ):
+        # type: (...) -> Union[Enum, Optional[Default]]
+        """Get Enum.Value object matching a human readable label.
+        Labels are looked up in a reverse index built once per language.
+        :param text: Label, as returned by Enum.label
+        :param language: Language of the label, defaults to the active language
+        :param case_insensitive: Compare labels casefolded
+        :param default: The default to return if no label matches
+        """
+        if language is None:
+            language = translation.get_language()
+
+        def build():
+            index = {}  # type: Dict[str, Enum]
+            for value, label in sorted(cls.label_map(language).items()):
+                if case_insensitive:
+                    label = label.casefold()
+                index.setdefault(label, cls(value))
+            return index
+
+        index = cls._cached(("label_index", language, case_insensitive), build)
+        if case_insensitive:
+            text = text.casefold()
+        return index.get(text, default)
+
+    @classmethod
+    def parse_many(cls, iterable, language=None, case_insensitive=False):
+        # type: (Iterable[Any], Optional[str], bool) -> Iterator[Union[Enum, InvalidStatusOperationError]]  # noqa: E501
+        """Lazily parse values, e.g. the cells of an imported column.
+        Members, ints, numeric strings, names and labels are accepted.
+        :param iterable: Values to parse
+        :param language: Language of labels, defaults to the active language
+        :param case_insensitive: Compare labels casefolded
+        :return: Generator yielding the matching member, or an
+            InvalidStatusOperationError for values not in the enum, per item
+        """
+        for item in iterable:
+            if isinstance(item, str) and item.lstrip("-").isdigit():
+                member = cls.get(int(item))
+            else:
+                member = cls.get(item)
+            if member is None and isinstance(item, str):
+                member = cls.from_label(item, language, case_insensitive)
+            if member is None:
+                yield InvalidStatusOperationError(
+                    gettext(
+                        "{value!r} is not one of the available choices "
+                        "for enum {enum}."
+                    ).format(value=item, enum=cls)
+                )
+            else:
+                yield member
+
     @classmethod
     def is_valid_transition(cls, from_value, to_value):
         # type: (Union[int, Enum], Union[int, Enum]) -> bool
@@ -240,3 +446,65 @@ class Enum(enum.IntEnum):
             to_value = to_value.value
 
         return cls.__transitions__.get(to_value, [])
+
+    @classmethod
+    def transition_targets(cls, from_value):
+        # type: (Union[int, T]) -> Tuple[T, ...]
+        """Returns the members from_value can make a transition to, sorted by
+        value and not including from_value itself.
+        :param from_value Start transition point
+        """
+        from_member = cls.get(from_value)
+        if from_member is None:
+            return ()
+
+        def build():
+            return tuple(
+                member
+                for member in sorted(cls, key=lambda member: member.value)
+                if member is not from_member
+                and cls.is_valid_transition(from_member, member)
+            )
+
+        return cls._cached(("transition_targets", from_member), build)
+
+    @classmethod
+    def is_terminal(cls, value):
+        # type: (Union[int, T]) -> bool
+        """A member is terminal when the enum has transitions and none of them
+        leaves the member, so it never changes again.
+        """
+        member = cls.get(value)
+        if member is None or not cls.__transitions__:
+            return False
+        return not cls.transition_targets(member)
+
+    @classmethod
+    def reachable_from(cls, from_value):
+        # type: (Union[int, T]) -> FrozenSet[T]
+        """Returns all members that can be reached from from_value through
+        one or more valid transitions, including itself. Computed once per
+        member from __transitions__.
+        :param from_value Start transition point
+        """
+        from_member = cls.get(from_value)
+        if from_member is None:
+            return frozenset()
+        if not cls.__transitions__:
+            return frozenset(cls)  # type: ignore[arg-type]
+
+        def build():
+            targets = {}  # type: Dict[int, List[int]]
+            for to_value, from_values in cls.__transitions__.items():
+                for value in from_values:
+                    targets.setdefault(value, []).append(to_value)
+            reached = {from_member.value}
+            pending = [from_member.value]
+            while pending:
+                for value in targets.get(pending.pop(), ()):
+                    if value not in reached:
+                        reached.add(value)
+                        pending.append(value)
+            return frozenset(cls(value) for value in reached)
+
+        return cls._cached(("reachable_from", from_member), build)
@@ -3,3 +3,7 @@ from django.core.exceptions import ValidationError
 
 class InvalidStatusOperationError(ValidationError):
     pass
+
+
+class UnreachableStateError(InvalidStatusOperationError):
+    pass
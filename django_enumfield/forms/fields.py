@@ -1,24 +1,157 @@
 from enum import Enum as NativeEnum
 
 from django import forms
+from django.forms.fields import CallableChoiceIterator
 
+from django_enumfield.choices import EnumChoices
+from django_enumfield.forms.widgets import EnumSelect, EnumSelectMultiple
 
-class EnumChoiceField(forms.TypedChoiceField):
-    def __init__(self, enum, **kwargs):
+
+class EnumChoiceFieldMixin(object):
+    """Validate submitted values against a set of the choice values, built
+    once when choices are assigned, instead of scanning the choices for
+    every value.
+    """
+
+    _choice_index = None
+
+    def _get_choices(self):
+        return self._choices
+
+    def _set_choices(self, value):
+        if isinstance(value, EnumChoices):
+            # Shared and immutable, no need for a copy or a new index.
+            self._choices = self.widget.choices = value
+            self._choice_index = value.choice_index
+            return
+        forms.ChoiceField.choices.fset(self, value)  # type: ignore[attr-defined]
+        if isinstance(self._choices, CallableChoiceIterator):
+            # Keep callable choices lazy, validate them the usual way.
+            self._choice_index = None
+        else:
+            self._choice_index = self.build_choice_index(self._choices)
+
+    choices = property(_get_choices, _set_choices)
+
+    @staticmethod
+    def build_choice_index(choices):
+        index = set()
+        for key, label in choices:
+            if isinstance(label, (list, tuple)):
+                index.update(str(k) for k, _ in label)
+            else:
+                index.add(str(key))
+        return frozenset(index)
+
+    def valid_value(self, value):
+        if self._choice_index is None:
+            return super(EnumChoiceFieldMixin, self).valid_value(value)
+        return str(value) in self._choice_index
+
+    def prepare_value(self, value):
+        if isinstance(value, NativeEnum):
+            return value.value
+        return value
+
+    def to_member(self, value):
+        if isinstance(value, self.enum):
+            return value
+        return self.enum(value)
+
+
+class EnumChoiceField(EnumChoiceFieldMixin, forms.TypedChoiceField):
+    """With next_choices, a form with an initial value, e.g. a ModelForm of a
+    saved instance, only offers and accepts that value and the members it can
+    make a transition to. The restricted choices are shared EnumChoices,
+    built once per enum and initial value.
+
+    The choices are restricted when the field is bound to the form. Django
+    before 4.0 cleans fields without binding them, so forms need
+    NextChoicesFormMixin there to validate against the restricted choices.
+    """
+
+    widget = EnumSelect
+
+    def __init__(self, enum, next_choices=False, **kwargs):
+        self.next_choices = next_choices
+        blank = not kwargs.get("required", True)
         kwargs.setdefault(
-            "choices", enum.choices(blank=not kwargs.get("required", True))
+            "choices",
+            (
+                EnumChoices(enum, blank=blank)
+                if enum.__lazy_choices__
+                else enum.choices(blank=blank)
+            ),
         )
         kwargs.setdefault("coerce", int)
         super(EnumChoiceField, self).__init__(**kwargs)
         self.enum = enum
 
-    def prepare_value(self, value):
-        if isinstance(value, NativeEnum):
-            return value.value
-        return value
+    def restrict_choices(self, form, field_name):
+        """With next_choices, restrict the choices to the initial value of
+        the field in form and its transition targets.
+        """
+        if not self.next_choices:
+            return
+        instance = getattr(form, "instance", None)
+        # The first value of a new instance is not a transition.
+        if instance is not None and instance._state.adding:
+            return
+        current = self.enum.get(form.get_initial_for_field(self, field_name))
+        if current is not None:
+            # form.fields are copies, this does not change other forms.
+            self.choices = EnumChoices(
+                self.enum, blank=not self.required, from_value=current
+            )
+
+    def get_bound_field(self, form, field_name):
+        self.restrict_choices(form, field_name)
+        return super(EnumChoiceField, self).get_bound_field(form, field_name)
 
     def clean(self, value):
         value = super(EnumChoiceField, self).clean(value)
         if value == self.empty_value:
             return value
-        return self.enum(value)
+        return self.to_member(value)
+
+
+class EnumMultipleChoiceField(EnumChoiceFieldMixin, forms.TypedMultipleChoiceField):
+    widget = EnumSelectMultiple
+
+    def __init__(self, enum, **kwargs):
+        kwargs.setdefault(
+            "choices", EnumChoices(enum) if enum.__lazy_choices__ else enum.choices()
+        )
+        kwargs.setdefault("coerce", int)
+        super(EnumMultipleChoiceField, self).__init__(**kwargs)
+        self.enum = enum
+
+    def prepare_value(self, value):
+        if isinstance(value, (list, tuple)):
+            return [
+                super(EnumMultipleChoiceField, self).prepare_value(item)
+                for item in value
+            ]
+        return super(EnumMultipleChoiceField, self).prepare_value(value)
+
+    def clean(self, value):
+        values = super(EnumMultipleChoiceField, self).clean(value)
+        if values == self.empty_value:
+            return values
+        return [self.to_member(value) for value in values]
+
+
+class NextChoicesFormMixin(object):
+    """Restrict the choices of EnumChoiceFields with next_choices when the
+    form is created, so that Django before 4.0, which cleans fields without
+    binding them, validates against the restricted choices.
+    Usage:
+        class OrderForm(NextChoicesFormMixin, forms.ModelForm):
+            ...
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(NextChoicesFormMixin, self).__init__(*args, **kwargs)
+        for name, field in self.fields.items():  # type: ignore[attr-defined]
+            if isinstance(field, EnumChoiceField):
+                field.restrict_choices(self, name)
@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from enum import Enum as NativeEnum
+from typing import Any, List, Optional, Tuple  # noqa: F401
+
+from django import forms
+from django.conf import settings
+from django.forms.renderers import DjangoTemplates, get_default_renderer
+from django.utils.encoding import force_str
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+# Rendered <option> elements keyed by (enum, language, choice values), the
+# least recently used are dropped beyond MAX_CACHED_OPTIONS entries.
+# Each entry holds (value, html, selected html) per option.
+_options_cache = OrderedDict()  # type: OrderedDict[Tuple, List[Tuple[str, str, str]]]
+MAX_CACHED_OPTIONS = 256
+
+
+class EnumSelect(forms.Select):
+    """A Select widget that can render Enum choices from option HTML that is
+    rendered once per enum, language and set of choices and then cached.
+    Only the selected marker is applied on render, skipping the template
+    engine, with the same output as the default select templates.
+
+    The fast rendering is opt-in, with fast_render=True or the
+    ENUMFIELD_FAST_SELECT setting, since it ignores overridden select
+    templates. Renderers other than the default DjangoTemplates, choices that
+    are not Enum members, option groups, or subclasses customizing the option
+    templates always use the regular rendering.
+    """
+
+    def __init__(self, attrs=None, choices=(), fast_render=None):
+        super(EnumSelect, self).__init__(attrs, choices)
+        self.fast_render = fast_render
+
+    def use_fast_render(self, renderer):
+        # type: (Any) -> bool
+        fast_render = self.fast_render
+        if fast_render is None:
+            fast_render = getattr(settings, "ENUMFIELD_FAST_SELECT", False)
+        if not fast_render:
+            return False
+        if renderer is None:
+            renderer = get_default_renderer()
+        return type(renderer) is DjangoTemplates
+
+    def get_rendered_options(self):
+        # type: () -> Optional[List[Tuple[str, str, str]]]
+        if (
+            self.template_name != forms.Select.template_name
+            or self.option_template_name != forms.Select.option_template_name
+            or type(self).create_option is not forms.Select.create_option
+        ):
+            return None
+
+        enum = None
+        values = []
+        for value, label in self.choices:
+            if not isinstance(label, NativeEnum):
+                return None
+            if value != "":
+                enum = type(label)
+            values.append(value)
+        key = (enum, get_language(), tuple(values))
+        try:
+            options = _options_cache[key]
+        except KeyError:
+            pass
+        else:
+            _options_cache.move_to_end(key)
+            return options
+
+        options = []
+        for value, label in self.choices:
+            value = force_str(value)
+            html = format_html(
+                '<option value="{}">{}</option>', value, force_str(label)
+            )
+            selected_html = format_html(
+                '<option value="{}" selected>{}</option>', value, force_str(label)
+            )
+            options.append((value, html, selected_html))
+        _options_cache[key] = options
+        while len(_options_cache) > MAX_CACHED_OPTIONS:
+            _options_cache.popitem(last=False)
+        return options
+
+    def render(self, name, value, attrs=None, renderer=None):
+        options = None
+        if self.use_fast_render(renderer):
+            options = self.get_rendered_options()
+        if options is None:
+            return super(EnumSelect, self).render(name, value, attrs, renderer)
+
+        value = set(self.format_value(value))
+        final_attrs = self.build_attrs(self.attrs, attrs)
+        if self.allow_multiple_selected:
+            final_attrs["multiple"] = True
+        has_selected = False
+        output = [format_html('<select name="{}"', name)]
+        for attr, attr_value in final_attrs.items():
+            # Same rules as django/forms/widgets/attrs.html
+            if attr_value is True:
+                output.append(format_html(" {}", attr))
+            elif attr_value is not False:
+                output.append(format_html(' {}="{}"', attr, attr_value))
+        output.append(">")
+        for option_value, html, selected_html in options:
+            if option_value in value and (
+                not has_selected or self.allow_multiple_selected
+            ):
+                has_selected = True
+                html = selected_html
+            output.append("\n  ")
+            output.append(html)
+            output.append("\n")
+        output.append("\n</select>")
+        return mark_safe("".join(output))
+
+
+class EnumSelectMultiple(EnumSelect, forms.SelectMultiple):
+    allow_multiple_selected = True
+
+
+def clear_cache():
+    # type: () -> None
+    """Drop all rendered options, e.g. after translations are reloaded."""
+    _options_cache.clear()
@@ -0,0 +1,293 @@
+"""Optional counters and sampled timings of enum work on hot paths.
+
+Instrumentation is disabled by default. Enabling it wraps the instrumented
+functions, and disabling it restores the originals, so there is no overhead
+while it is disabled.
+
+Instrumented events:
+
+- ``from_db_value``: values loaded from the database, failures are values
+  that are not members of the enum
+- ``validate_transition``: validated assignments per field, failures are
+  rejected transitions or values
+- ``to_representation``: values serialized by the DRF EnumField
+
+Enable it for the whole process with a setting::
+
+    ENUMFIELD_INSTRUMENTATION = {
+        "sample_rate": 0.01,  # Time 1% of the calls, defaults to 0
+        "exporters": ["django_enumfield.instrumentation.logging_exporter"],
+    }
+
+or for a block of code::
+
+    with instrumentation.instrument(sample_rate=1):
+        ...
+    print(instrumentation.snapshot())
+
+Counters are updated without locking and may be slightly off under heavy
+concurrency.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Tuple  # noqa: F401
+
+from django_enumfield.exceptions import InvalidStatusOperationError
+
+__all__ = (
+    "Measurement",
+    "add_exporter",
+    "disable",
+    "enable",
+    "flush",
+    "instrument",
+    "is_enabled",
+    "logging_exporter",
+    "remove_exporter",
+    "reset",
+    "snapshot",
+)
+
+logger = logging.getLogger(__name__)
+
+Measurement = namedtuple(
+    "Measurement",
+    ("event", "enum", "field", "calls", "failures", "timed_calls", "total_time"),
+)
+
+# [calls, failures, timed calls, total time of timed calls] per
+# (event, enum, field).
+_stats = {}  # type: Dict[Tuple[str, Any, Any], List]
+_stats_lock = threading.Lock()
+_exporters = []  # type: List[Callable[[List[Measurement]], Any]]
+# (owner, attribute name, original) of installed probes
+_installed = []  # type: List[Tuple[Any, str, Any]]
+_sample_rate = 0.0
+
+
+def _counters(event, enum, field):
+    key = (event, enum, field)
+    try:
+        return _stats[key]
+    except KeyError:
+        with _stats_lock:
+            return _stats.setdefault(key, [0, 0, 0, 0.0])
+
+
+def _timed(counters, start):
+    counters[2] += 1
+    counters[3] += time.perf_counter() - start
+
+
+def _from_db_value_probe(from_db_value):
+    @wraps(from_db_value)
+    def probe(self, value, *args):
+        counters = _counters("from_db_value", self.enum, _field_label(self))
+        counters[0] += 1
+        if _sample_rate and random.random() < _sample_rate:
+            start = time.perf_counter()
+            result = from_db_value(self, value, *args)
+            _timed(counters, start)
+        else:
+            result = from_db_value(self, value, *args)
+        if result is None and value is not None:
+            counters[1] += 1
+        return result
+
+    return probe
+
+
+def _validate_transition_probe(validate_valid_transition):
+    @wraps(validate_valid_transition)
+    def probe(enum, from_value, to_value, field=None):
+        counters = _counters("validate_transition", enum, field)
+        counters[0] += 1
+        start = None
+        if _sample_rate and random.random() < _sample_rate:
+            start = time.perf_counter()
+        try:
+            validate_valid_transition(enum, from_value, to_value, field)
+        except InvalidStatusOperationError:
+            counters[1] += 1
+            raise
+        finally:
+            if start is not None:
+                _timed(counters, start)
+
+    return probe
+
+
+def _to_representation_probe(to_representation):
+    @wraps(to_representation)
+    def probe(self, value):
+        counters = _counters(
+            "to_representation", self.enum, getattr(self, "field_name", None)
+        )
+        counters[0] += 1
+        if _sample_rate and random.random() < _sample_rate:
+            start = time.perf_counter()
+            result = to_representation(self, value)
+            _timed(counters, start)
+        else:
+            result = to_representation(self, value)
+        if result is None and value is not None:
+            counters[1] += 1
+        return result
+
+    return probe
+
+
+def _field_label(field):
+    model = getattr(field, "model", None)
+    if model is None:
+        return field.name
+    return "{}.{}".format(model._meta.label, field.name)
+
+
+def _get_probes():
+    # type: () -> List[Tuple[Any, str, Callable]]
+    from django_enumfield import validators
+    from django_enumfield.db.fields import EnumField
+
+    probes = [
+        (EnumField, "from_db_value", _from_db_value_probe),
+        (validators, "validate_valid_transition", _validate_transition_probe),
+    ]
+    try:
+        from django_enumfield.contrib import drf
+    except ImportError:  # djangorestframework is not installed
+        pass
+    else:
+        probes.append((drf.EnumField, "to_representation", _to_representation_probe))
+    return probes
+
+
+def is_enabled():
+    # type: () -> bool
+    return bool(_installed)
+
+
+def enable(sample_rate=0.0):
+    # type: (float) -> None
+    """Start counting calls, and time about sample_rate (0 to 1) of them."""
+    global _sample_rate
+    _sample_rate = sample_rate
+    if _installed:
+        return
+    for owner, name, make_probe in _get_probes():
+        original = owner.__dict__[name]
+        _installed.append((owner, name, original))
+        setattr(owner, name, make_probe(original))
+
+
+def disable():
+    # type: () -> None
+    """Stop counting, restoring the instrumented functions. Counters are
+    kept until reset() or flush().
+    """
+    while _installed:
+        owner, name, original = _installed.pop()
+        setattr(owner, name, original)
+
+
+@contextmanager
+def instrument(sample_rate=0.0):
+    # type: (float) -> Iterator[None]
+    """Enable instrumentation within the block, restoring the previous state
+    on exit.
+    """
+    was_enabled, previous_rate = is_enabled(), _sample_rate
+    enable(sample_rate)
+    try:
+        yield
+    finally:
+        if was_enabled:
+            enable(previous_rate)
+        else:
+            disable()
+
+
+def snapshot(reset=False):
+    # type: (bool) -> List[Measurement]
+    """:return: A Measurement per event, enum and field seen so far"""
+    with _stats_lock:
+        items = list(_stats.items())
+        if reset:
+            _stats.clear()
+    return [
+        Measurement(event, enum, field, *counters)
+        for (event, enum, field), counters in items
+    ]
+
+
+def reset():
+    # type: () -> None
+    with _stats_lock:
+        _stats.clear()
+
+
+def add_exporter(exporter):
+    # type: (Callable[[List[Measurement]], Any]) -> None
+    """Register a callable receiving the list of measurements on flush(),
+    e.g. to forward them to logging or a statsd client.
+    """
+    _exporters.append(exporter)
+
+
+def remove_exporter(exporter):
+    # type: (Callable[[List[Measurement]], Any]) -> None
+    _exporters.remove(exporter)
+
+
+def flush():
+    # type: () -> List[Measurement]
+    """Pass a snapshot to every exporter and reset the counters.
+
+    :return: The exported measurements
+    """
+    measurements = snapshot(reset=True)
+    if measurements:
+        for exporter in _exporters:
+            exporter(measurements)
+    return measurements
+
+
+def logging_exporter(measurements):
+    # type: (List[Measurement]) -> None
+    """Exporter logging one line per measurement."""
+    for measurement in measurements:
+        logger.info(
+            "%s %s%s calls=%d failures=%d timed=%d total=%.6fs",
+            measurement.event,
+            measurement.enum.__name__,
+            " " + measurement.field if measurement.field else "",
+            measurement.calls,
+            measurement.failures,
+            measurement.timed_calls,
+            measurement.total_time,
+        )
+
+
+def configure(config):
+    # type: (Any) -> None
+    """Enable instrumentation from the ENUMFIELD_INSTRUMENTATION setting,
+    True or a dict with optional "sample_rate" and "exporters" (callables or
+    dotted paths to them).
+    """
+    from django.utils.module_loading import import_string
+
+    if not config:
+        return
+    if config is True:
+        config = {}
+    for exporter in config.get("exporters", ()):
+        if isinstance(exporter, str):
+            exporter = import_string(exporter)
+        add_exporter(exporter)
+    enable(config.get("sample_rate", 0.0))
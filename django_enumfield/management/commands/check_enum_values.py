@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from django_enumfield.db.utils import iter_chunks, iter_enum_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Scan every model with an EnumField for stored values that are not "
+        "members of the field's Enum, optionally resetting them to __default__."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "args",
+            metavar="app_label[.ModelName]",
+            nargs="*",
+            help="Restrict the scan to these apps or models.",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Set invalid values to the default of the field's Enum.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of rows fetched per query (default: 2000).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Database to scan. Defaults to the "default" database.',
+        )
+
+    def handle(self, *app_labels, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive integer.")
+
+        total = 0
+        for model, fields in iter_enum_models(app_labels):
+            queryset = model._base_manager.using(options["database"])
+            counts = self.scan(queryset, fields, options["chunk_size"], options["fix"])
+            for field in fields:
+                total += counts[field.name]
+                self.stdout.write(
+                    "{}.{}: {} invalid value(s)".format(
+                        model._meta.label, field.name, counts[field.name]
+                    )
+                )
+
+        if total and not options["fix"]:
+            self.stderr.write(
+                "Found {} invalid value(s), run with --fix to reset them.".format(total)
+            )
+
+    def scan(self, queryset, fields, chunk_size, fix):
+        """Count values outside of each field's Enum, one chunk at a time."""
+        counts = dict.fromkeys((field.name for field in fields), 0)
+        valid = [frozenset(field.enum.values) for field in fields]
+        defaults = [field.enum.default() for field in fields]
+        if fix:
+            for field, default in zip(fields, defaults):
+                if default is None:
+                    self.stderr.write(
+                        "{}.{} has no default, invalid values are left as is.".format(
+                            queryset.model._meta.label, field.name
+                        )
+                    )
+
+        for chunk in iter_chunks(queryset, *fields, chunk_size=chunk_size):
+            for index, field in enumerate(fields):
+                invalid_pks = [
+                    row[0]
+                    for row in chunk
+                    if row[index + 1] is not None and row[index + 1] not in valid[index]
+                ]
+                if not invalid_pks:
+                    continue
+                counts[field.name] += len(invalid_pks)
+                if fix and defaults[index] is not None:
+                    queryset.filter(pk__in=invalid_pks).update(
+                        **{field.attname: defaults[index]}
+                    )
+        return counts
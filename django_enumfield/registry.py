@@ -0,0 +1,136 @@
+"""Registry of every Enum subclass, with a cached JSON export of their
+definitions for frontends and schema generation.
+"""
+
+import hashlib
+import json
+from collections import namedtuple
+from typing import Any, Dict, Iterator, Optional  # noqa: F401
+
+from django.utils import translation
+
+__all__ = ("EnumRegistry", "ExportedEnums", "registry")
+
+ExportedEnums = namedtuple("ExportedEnums", ("content", "etag"))
+
+
+def get_enum_path(enum):
+    # type: (Any) -> str
+    return "{}.{}".format(enum.__module__, enum.__qualname__)
+
+
+class EnumRegistry(object):
+    """Every Enum subclass is registered here when its class is created.
+
+    Exports are built once per language and cached until another enum is
+    registered.
+    """
+
+    def __init__(self):
+        self._enums = {}  # type: Dict[str, Any]
+        self._exports = {}  # type: Dict[Optional[str], ExportedEnums]
+        self._schemas = {}  # type: Dict[Any, Dict[str, Any]]
+
+    def register(self, enum):
+        # type: (Any) -> None
+        self._enums[get_enum_path(enum)] = enum
+        self.clear_cache()
+
+    def get(self, path, default=None):
+        # type: (str, Any) -> Any
+        """Get a registered enum by its dotted path, "app.models.MyEnum"."""
+        return self._enums.get(path, default)
+
+    def __iter__(self):
+        # type: () -> Iterator[Any]
+        return iter(list(self._enums.values()))
+
+    def __len__(self):
+        return len(self._enums)
+
+    def __contains__(self, enum):
+        return self._enums.get(get_enum_path(enum)) is enum
+
+    def describe(self, enum, language=None):
+        # type: (Any, Optional[str]) -> Dict[str, Any]
+        """
+        :return: JSON serializable description of enum with its values, names,
+            labels, default and transitions
+        """
+        labels = enum.label_map(language)
+        default = enum.default()
+        return {
+            "name": enum.__name__,
+            "members": [
+                {"value": value, "name": name, "label": labels[value]}
+                for name, value in enum.items()
+            ],
+            "default": default.value if default is not None else None,
+            "transitions": {
+                str(int(to_value)): sorted(int(value) for value in from_values)
+                for to_value, from_values in enum.__transitions__.items()
+            },
+        }
+
+    def export(self, language=None):
+        # type: (Optional[str]) -> ExportedEnums
+        """Export every registered enum with members as one JSON document.
+
+        :param language: Language of labels, defaults to the active language
+        :return: ExportedEnums of the encoded document and a strong ETag
+        """
+        if language is None:
+            language = translation.get_language()
+        try:
+            return self._exports[language]
+        except KeyError:
+            pass
+
+        document = {
+            path: self.describe(enum, language)
+            for path, enum in self._enums.items()
+            if len(enum)
+        }
+        content = json.dumps(
+            {"enums": document}, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        etag = '"{}"'.format(hashlib.sha256(content).hexdigest())
+        exported = self._exports[language] = ExportedEnums(content, etag)
+        return exported
+
+    def openapi_schema(self, enum, named=False, language=None):
+        # type: (Any, bool, Optional[str]) -> Dict[str, Any]
+        """OpenAPI schema of enum values, or names when named, cached per
+        language. Returns a shallow copy of the cached schema.
+        """
+        if language is None:
+            language = translation.get_language()
+        key = (enum, named, language)
+        try:
+            schema = self._schemas[key]
+        except KeyError:
+            description = self.describe(enum, language)
+            members = description["members"]
+            schema = {
+                "type": "string" if named else "integer",
+                "enum": [member["name" if named else "value"] for member in members],
+                "description": ", ".join(
+                    "{}: {}".format(
+                        member["name" if named else "value"], member["label"]
+                    )
+                    for member in members
+                ),
+            }
+            if not named:
+                schema["x-enum-varnames"] = [member["name"] for member in members]
+            self._schemas[key] = schema
+        return dict(schema)
+
+    def clear_cache(self):
+        # type: () -> None
+        """Drop cached exports, e.g. after translations are reloaded."""
+        self._exports.clear()
+        self._schemas.clear()
+
+
+registry = EnumRegistry()
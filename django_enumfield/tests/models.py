@@ -1,7 +1,11 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from django_enumfield.db.fields import EnumField
+from django_enumfield.db.cache import TerminalCacheManager
+from django_enumfield.db.fields import EnumField, entered_at_index, hot_index
+from django_enumfield.db.mixins import EnumPickleMixin, TransitionMixin
+from django_enumfield.db.packed import PackedEnumField
+from django_enumfield.db.query import EnumQuerySet
 from django_enumfield.enum import Enum
 
 
@@ -50,6 +54,19 @@ class Person(models.Model):
         return "Person.save"
 
 
+class DeferredPerson(models.Model):
+    status = EnumField(PersonStatus, default=PersonStatus.ALIVE, validation="deferred")
+
+
+class ProxyDeferredPerson(DeferredPerson):
+    class Meta:
+        proxy = True
+
+
+class UnvalidatedPerson(models.Model):
+    status = EnumField(PersonStatus, default=PersonStatus.ALIVE, validation="off")
+
+
 class BeerStyle(Enum):
     LAGER = 0
     STOUT = 1
@@ -82,3 +99,103 @@ class Beer(models.Model):
     style = EnumField(BeerStyle)
     state = EnumField(BeerState, null=True, blank=True)
     label = EnumField(LabelBeer, default=get_default_beer_label)
+
+
+class Country(Enum):
+    SWEDEN = 46
+    SWITZERLAND = 41
+    SPAIN = 34
+    NORWAY = 47
+
+    __labels__ = {SWEDEN: _("Sweden"), SWITZERLAND: _("Switzerland")}
+    __lazy_choices__ = True
+
+
+class Brewery(models.Model):
+    country = EnumField(Country, null=True, blank=True)
+
+
+class PickledPerson(EnumPickleMixin, models.Model):
+    status = EnumField(PersonStatus, default=PersonStatus.ALIVE)
+    style = EnumField(BeerStyle, null=True)
+
+
+class OrderStatus(Enum):
+    NEW = 0
+    PAID = 1
+    SHIPPED = 2
+    CANCELLED = 3
+
+    __default__ = NEW
+    __transitions__ = {
+        PAID: (NEW,),
+        SHIPPED: (PAID,),
+        CANCELLED: (NEW, PAID),
+    }
+
+
+class Order(TransitionMixin, models.Model):
+    status = EnumField(OrderStatus, next_choices=True, track_entered_at=True)
+    paid = models.BooleanField(default=False)
+
+    objects = EnumQuerySet.as_manager()
+    cached = TerminalCacheManager()
+
+    class Meta:
+        indexes = [entered_at_index("status", "tests_order_status_ent")]
+
+    @status.guard(OrderStatus.NEW, OrderStatus.PAID)
+    def is_paid(self, from_value, to_value, **kwargs):
+        return self.paid
+
+    @status.on_transition((OrderStatus.NEW, OrderStatus.PAID), OrderStatus.CANCELLED)
+    def refund(self, from_value, to_value, **kwargs):
+        self.events.append(("refund", from_value, to_value, kwargs))
+
+    @status.on_transition(OrderStatus.PAID, OrderStatus.SHIPPED)
+    def notify(self, from_value, to_value, **kwargs):
+        self.events.append(("notify", from_value, to_value, kwargs))
+
+    def __init__(self, *args, **kwargs):
+        super(Order, self).__init__(*args, **kwargs)
+        self.events = []
+
+
+class ProxyOrder(Order):
+    class Meta:
+        proxy = True
+
+
+class JobStatus(Enum):
+    PENDING = 0
+    PROCESSING = 1
+    DONE = 2
+    FAILED = 3
+
+    __default__ = PENDING
+    __hot__ = (PENDING, PROCESSING)
+
+
+class Job(models.Model):
+    status = EnumField(JobStatus, counted=True)
+    result = EnumField(JobStatus, hot=(JobStatus.FAILED,), null=True)
+    previous = EnumField(JobStatus, hot=(), null=True)
+
+    objects = EnumQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            hot_index("status", JobStatus, "tests_job_status_hot"),
+            hot_index("result", [JobStatus.FAILED], "tests_job_result_hot"),
+        ]
+
+
+class PackedFlags(models.Model):
+    flags = PackedEnumField(
+        [
+            ("lamp", LampState),
+            ("person", PersonStatus),
+            ("order", OrderStatus),
+            ("country", Country),
+        ]
+    )
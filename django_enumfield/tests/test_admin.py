@@ -0,0 +1,98 @@
+from unittest import mock
+
+import django
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from django_enumfield.admin import EnumFieldListFilter
+from django_enumfield.tests.models import Job, JobStatus
+
+
+class CachedEnumFieldListFilter(EnumFieldListFilter):
+    count_cache_timeout = 60
+
+
+class JobAdmin(admin.ModelAdmin):
+    list_filter = [
+        ("status", EnumFieldListFilter),
+        ("result", CachedEnumFieldListFilter),
+    ]
+
+
+class EnumFieldListFilterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        for status, result in (
+            (JobStatus.PENDING, None),
+            (JobStatus.DONE, JobStatus.DONE),
+            (JobStatus.DONE, JobStatus.FAILED),
+            (JobStatus.FAILED, JobStatus.FAILED),
+        ):
+            Job.objects.create(status=status, result=result)
+        self.user = User.objects.create_superuser("admin", "admin@example.com", "x")
+        self.model_admin = JobAdmin(Job, admin.site)
+
+    def get_choices(self, query=None):
+        request = RequestFactory().get("/", query or {})
+        request.user = self.user
+        changelist = self.model_admin.get_changelist_instance(request)
+        filters = changelist.get_filters(request)[0]
+        return [
+            [
+                (choice["display"], choice["selected"])
+                for choice in spec.choices(changelist)
+            ]
+            for spec in filters
+        ]
+
+    def test_counts(self):
+        status, result = self.get_choices()
+        self.assertEqual(
+            status,
+            [
+                ("All", True),
+                ("PENDING (1)", False),
+                ("PROCESSING (0)", False),
+                ("DONE (2)", False),
+                ("FAILED (1)", False),
+            ],
+        )
+        self.assertEqual(
+            result[3:], [("DONE (1)", False), ("FAILED (2)", False), ("- (1)", False)]
+        )
+
+    def test_selected_member_keeps_counts(self):
+        status, result = self.get_choices({"status__exact": "2"})
+        self.assertIn(("DONE (2)", True), status)
+        self.assertIn(("PENDING (1)", False), status)
+        # Other filters are applied
+        self.assertIn(("FAILED (1)", False), result)
+        self.assertIn(("- (0)", False), result)
+
+    def test_selected_member_list(self):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        changelist = self.model_admin.get_changelist_instance(request)
+        status_filter = changelist.get_filters(request)[0][0]
+        # Parameters are lists since Django 5.0
+        status_filter.lookup_val = ["2"]
+        with mock.patch.object(django, "VERSION", (5, 0, 0, "final", 0)):
+            self.assertFalse(status_filter.is_selected(0))
+            self.assertTrue(status_filter.is_selected(2))
+
+    def test_one_query_per_filter(self):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        changelist = self.model_admin.get_changelist_instance(request)
+        status_filter = changelist.get_filters(request)[0][0]
+        with self.assertNumQueries(1):
+            list(status_filter.choices(changelist))
+
+    def test_cached_counts(self):
+        self.get_choices()
+        Job.objects.create(status=JobStatus.PENDING, result=JobStatus.DONE)
+        status, result = self.get_choices()
+        self.assertIn(("PENDING (2)", False), status)
+        self.assertIn(("DONE (1)", False), result)
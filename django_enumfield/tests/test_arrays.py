@@ -0,0 +1,117 @@
+import unittest
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import translation
+
+from django_enumfield.contrib import arrays
+from django_enumfield.enum import Enum
+from django_enumfield.tests.models import (
+    Beer,
+    Job,
+    JobStatus,
+    LabelBeer,
+    PersonStatus,
+)
+
+
+class SparseEnum(Enum):
+    LOW = -5
+    HIGH = 100000
+
+
+@unittest.skipIf(arrays.numpy is None, "NumPy is not installed")
+class NumPyArraysTest(TestCase):
+    def test_to_names(self):
+        values = arrays.numpy.array([0, 4, 99, -1, 2])
+        self.assertEqual(
+            list(arrays.to_names(PersonStatus, values)),
+            ["UNBORN", "VOID", None, None, "DEAD"],
+        )
+
+    def test_to_labels(self):
+        field = Beer._meta.get_field("label")
+        self.assertEqual(
+            list(arrays.to_labels(field, arrays.numpy.array([0, 1, 3]))),
+            ["Stella Artois", "JUPILER", None],
+        )
+
+    def test_valid_mask(self):
+        self.assertEqual(
+            list(arrays.valid_mask(PersonStatus, [4, 5, 0])), [True, False, True]
+        )
+
+    def test_missing_values(self):
+        self.assertEqual(
+            list(arrays.to_names(PersonStatus, [0, None, 2])), ["UNBORN", None, "DEAD"]
+        )
+        values = arrays.numpy.array([0.0, float("nan"), 2.0, 1.5, 1e300])
+        self.assertEqual(
+            list(arrays.valid_mask(PersonStatus, values)),
+            [True, False, True, False, False],
+        )
+        self.assertEqual(list(arrays.valid_mask(PersonStatus, [])), [])
+
+    def test_nullable_column(self):
+        Job.objects.create(result=JobStatus.FAILED)
+        Job.objects.create(result=None)
+        values = Job.objects.order_by("pk").values_list("result", flat=True)
+        self.assertEqual(list(arrays.to_names(JobStatus, values)), ["FAILED", None])
+
+    def test_sparse_enum(self):
+        lookup = arrays._lookup_arrays(SparseEnum)
+        self.assertFalse(lookup.dense)
+        self.assertEqual(
+            list(arrays.to_names(SparseEnum, [100000, -5, 0, 100001])),
+            ["HIGH", "LOW", None, None],
+        )
+        self.assertEqual(list(arrays.valid_mask(SparseEnum, [-6, -5])), [False, True])
+
+    def test_lookup_arrays_are_cached(self):
+        self.assertIs(
+            arrays._lookup_arrays(PersonStatus), arrays._lookup_arrays(PersonStatus)
+        )
+
+
+@unittest.skipIf(arrays.pandas is None, "pandas is not installed")
+class PandasArraysTest(TestCase):
+    def test_to_categorical(self):
+        categorical = arrays.to_categorical(PersonStatus, [1, 1, 7, 3])
+        self.assertEqual(
+            list(categorical.categories),
+            ["UNBORN", "ALIVE", "DEAD", "REANIMATED", "VOID"],
+        )
+        self.assertEqual(list(categorical.codes), [1, 1, -1, 3])
+
+    def test_to_categorical_missing_values(self):
+        values = arrays.pandas.array([1, None, 3], dtype="Int64")
+        categorical = arrays.to_categorical(PersonStatus, values)
+        self.assertEqual(list(categorical.codes), [1, -1, 3])
+        categorical = arrays.to_categorical(PersonStatus, [1.0, float("nan")])
+        self.assertEqual(list(categorical.codes), [1, -1])
+
+    def test_to_categorical_values(self):
+        categorical = arrays.to_categorical(LabelBeer, [2], categories="value")
+        self.assertEqual(list(categorical.categories), [0, 1, 2])
+
+    def test_to_categorical_invalid_categories(self):
+        with self.assertRaises(ValueError):
+            arrays.to_categorical(LabelBeer, [2], categories="member")
+
+
+@mock.patch.object(arrays, "pandas", None)
+@mock.patch.object(arrays, "numpy", None)
+class PurePythonArraysTest(TestCase):
+    def test_fallback(self):
+        self.assertEqual(arrays.to_names(PersonStatus, [3, 9]), ["REANIMATED", None])
+        with translation.override("en"):
+            self.assertEqual(
+                arrays.to_labels(LabelBeer, [0, 9]), ["Stella Artois", None]
+            )
+        self.assertEqual(arrays.valid_mask(PersonStatus, [3, 9]), [True, False])
+        self.assertEqual(
+            arrays.to_names(PersonStatus, [None, float("nan")]), [None, None]
+        )
+        self.assertEqual(
+            arrays.to_categorical(PersonStatus, [3, 9], categories="value"), [3, None]
+        )
@@ -0,0 +1,112 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from django_enumfield.db.cache import TerminalCacheManager
+
+from django_enumfield.tests.models import (
+    Job,
+    LampState,
+    Order,
+    OrderStatus,
+    PersonStatus,
+    ProxyOrder,
+)
+
+
+class TerminalCacheManagerTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        Order.cached.stats.reset()
+
+    def test_is_terminal(self):
+        self.assertTrue(OrderStatus.is_terminal(OrderStatus.SHIPPED))
+        self.assertTrue(OrderStatus.is_terminal("CANCELLED"))
+        self.assertFalse(OrderStatus.is_terminal(OrderStatus.PAID))
+        self.assertFalse(OrderStatus.is_terminal(42))
+        self.assertTrue(PersonStatus.is_terminal(PersonStatus.REANIMATED))
+        self.assertFalse(PersonStatus.is_terminal(PersonStatus.DEAD))
+        # Without transitions every member can change
+        self.assertFalse(LampState.is_terminal(LampState.ON))
+
+    def test_terminal_rows_are_cached(self):
+        order = Order.objects.create(status=OrderStatus.CANCELLED)
+        self.assertEqual(Order.cached.get_cached(order.pk), order)
+        with self.assertNumQueries(0):
+            cached = Order.cached.get_cached(order.pk)
+        self.assertEqual(cached, order)
+        self.assertEqual(cached.status, OrderStatus.CANCELLED)
+        stats = Order.cached.stats
+        self.assertEqual((stats.hits, stats.misses, stats.stored), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_other_rows_are_not_cached(self):
+        order = Order.objects.create(status=OrderStatus.PAID)
+        Order.cached.get_cached(order.pk)
+        with self.assertNumQueries(1):
+            Order.cached.get_cached(order.pk)
+        self.assertEqual(Order.cached.stats.stored, 0)
+        self.assertEqual(Order.cached.stats.hit_rate, 0.0)
+
+    def test_values(self):
+        order = Order.objects.create(status=OrderStatus.SHIPPED, paid=True)
+        self.assertEqual(
+            Order.cached.get_values_cached(order.pk, "paid"), {"paid": True}
+        )
+        with self.assertNumQueries(0):
+            row = Order.cached.get_values_cached(order.pk, "paid")
+        self.assertEqual(row, {"paid": True})
+        self.assertEqual(
+            Order.cached.get_values_cached(order.pk, "status")["status"],
+            OrderStatus.SHIPPED,
+        )
+
+    def test_invalidated_on_save_and_delete(self):
+        order = Order.objects.create(status=OrderStatus.CANCELLED)
+        Order.cached.get_cached(order.pk)
+        # Cached by another process
+        other = TerminalCacheManager()
+        other.model = Order
+        other.get_values_cached(order.pk, "paid")
+        order.paid = True
+        with self.captureOnCommitCallbacks(execute=True):
+            order.save()
+            # Not before the commit
+            self.assertFalse(Order.cached.get_cached(order.pk).paid)
+        self.assertTrue(Order.cached.get_cached(order.pk).paid)
+        self.assertEqual(
+            Order.cached.get_values_cached(order.pk, "paid"), {"paid": True}
+        )
+
+        # Evicted versions are not read as the first one
+        Order.cached.get_cached(order.pk)
+        cache.delete(Order.cached.make_version_key(order.pk))
+        Order.objects.filter(pk=order.pk).update(paid=False)
+        self.assertFalse(Order.cached.get_cached(order.pk).paid)
+
+        pk = order.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            order.delete()
+        with self.assertRaises(Order.DoesNotExist):
+            Order.cached.get_cached(pk)
+        with self.assertRaises(Order.DoesNotExist):
+            Order.cached.get_values_cached(pk, "paid")
+
+    def test_invalidated_by_proxy(self):
+        order = Order.objects.create(status=OrderStatus.CANCELLED)
+        Order.cached.get_cached(order.pk)
+        proxy = ProxyOrder.cached.get_cached(order.pk)
+        self.assertIsInstance(proxy, ProxyOrder)
+        proxy.paid = True
+        with self.captureOnCommitCallbacks(execute=True):
+            proxy.save()
+        self.assertTrue(Order.cached.get_cached(order.pk).paid)
+        self.assertTrue(ProxyOrder.cached.get_cached(order.pk).paid)
+
+    def test_field_name(self):
+        manager = TerminalCacheManager()
+        manager.model = Job
+        with self.assertRaises(ValueError):
+            manager.get_field()
+        manager = TerminalCacheManager("result")
+        manager.model = Job
+        self.assertEqual(manager.get_field(), Job._meta.get_field("result"))
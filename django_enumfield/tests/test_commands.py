@@ -0,0 +1,80 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from django_enumfield.tests.models import (
+    Beer,
+    BeerState,
+    BeerStyle,
+    Job,
+    Lamp,
+    LampState,
+    Person,
+)
+
+
+class CheckEnumValuesTest(TestCase):
+    def call(self, *args, **kwargs):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("check_enum_values", *args, stdout=stdout, stderr=stderr, **kwargs)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_reports_invalid_values(self):
+        for _ in range(5):
+            Beer.objects.create()
+        Beer.objects.filter(pk__lte=3).update(style=42)
+        Beer.objects.filter(pk=5).update(state=None)
+
+        stdout, stderr = self.call("tests", chunk_size=2)
+
+        self.assertIn("tests.Beer.style: 3 invalid value(s)", stdout)
+        self.assertIn("tests.Beer.state: 0 invalid value(s)", stdout)
+        self.assertIn("Found 3 invalid value(s)", stderr)
+        self.assertEqual(Beer.objects.filter(style=42).count(), 3)
+
+    def test_scans_rows_hidden_by_default_manager(self):
+        job = Job.objects.create()
+        Job.objects.filter(pk=job.pk).update(status=42)
+        manager = type(Job._default_manager)
+        with mock.patch.object(
+            manager,
+            "get_queryset",
+            lambda self: super(manager, self).get_queryset().none(),
+        ):
+            stdout, stderr = self.call("tests.Job")
+
+        self.assertIn("tests.Job.status: 1 invalid value(s)", stdout)
+
+    def test_fix_resets_to_default(self):
+        beers = [Beer.objects.create() for _ in range(3)]
+        Beer.objects.filter(pk=beers[1].pk).update(style=42, state=7)
+
+        self.call("tests.Beer", fix=True)
+
+        beer = Beer.objects.get(pk=beers[1].pk)
+        self.assertEqual(beer.style, BeerStyle.LAGER)
+        self.assertEqual(beer.state, BeerState.FIZZY)
+        stdout, stderr = self.call("tests.Beer")
+        self.assertIn("tests.Beer.style: 0 invalid value(s)", stdout)
+        self.assertEqual(stderr, "")
+
+    def test_fix_without_default(self):
+        person = Person.objects.create()
+        Person.objects.filter(pk=person.pk).update(status=42)
+
+        stdout, stderr = self.call("tests.Person", fix=True)
+
+        self.assertIn("tests.Person.status: 1 invalid value(s)", stdout)
+        self.assertIn("tests.Person.status has no default", stderr)
+        self.assertEqual(Person.objects.filter(status=42).count(), 1)
+
+    def test_app_filter(self):
+        Lamp.objects.create(state=LampState.ON)
+        stdout, _ = self.call("tests.Lamp")
+        self.assertEqual(stdout, "tests.Lamp.state: 0 invalid value(s)\n")
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(CommandError):
+            self.call(chunk_size=0)
@@ -1,9 +1,45 @@
 from django.test import TestCase
+from rest_framework import generics, serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.fields import SkipField
+from rest_framework.test import APIRequestFactory
 
-from django_enumfield.contrib.drf import EnumField, NamedEnumField
-from django_enumfield.tests.models import BeerState, LampState
+from django_enumfield.contrib.drf import (
+    EnumAutoSchema,
+    EnumField,
+    EnumFilterBackend,
+    NamedEnumField,
+)
+from django_enumfield.tests.models import (
+    BeerState,
+    Job,
+    JobStatus,
+    LabelBeer,
+    LampState,
+    Order,
+    OrderStatus,
+)
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    status = EnumField(OrderStatus, next_choices=True)
+
+    class Meta:
+        model = Order
+        fields = ("status",)
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = ("id", "status", "result")
+
+
+class JobList(generics.ListAPIView):
+    queryset = Job.objects.order_by("id")
+    serializer_class = JobSerializer
+    filter_backends = [EnumFilterBackend]
+    enum_filter_fields = ("status", "result")
 
 
 class DRFTestCase(TestCase):
@@ -30,3 +66,85 @@ class DRFTestCase(TestCase):
         field = NamedEnumField(LampState)
         self.assertEqual(field.to_internal_value("1"), LampState.ON)
         self.assertEqual(field.to_representation(LampState.OFF), "OFF")
+
+    def test_next_choices(self):
+        order = Order(status=OrderStatus.PAID)
+        serializer = OrderSerializer(order, data={"status": "0"})
+        field = serializer.fields["status"]
+        self.assertEqual(list(field.choices), [1, 2, 3])
+        self.assertEqual(list(field.grouped_choices), [1, 2, 3])
+        self.assertIs(field.choices, OrderSerializer(order).fields["status"].choices)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("status", serializer.errors)
+
+        serializer = OrderSerializer(order, data={"status": "2"})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["status"], OrderStatus.SHIPPED)
+
+        # Without an instance every member is a choice.
+        serializer = OrderSerializer(data={"status": "0"})
+        self.assertEqual(list(serializer.fields["status"].choices), [0, 1, 2, 3])
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_auto_schema(self):
+        schema = EnumAutoSchema()
+        mapped = schema.map_field(EnumField(LabelBeer))
+        self.assertEqual(mapped["type"], "integer")
+        self.assertEqual(mapped["enum"], [0, 1, 2])
+        self.assertEqual(mapped["x-enum-varnames"], ["STELLA", "JUPILER", "TYSKIE"])
+
+        mapped = schema.map_field(NamedEnumField(LabelBeer))
+        self.assertEqual(mapped["type"], "string")
+        self.assertEqual(mapped["enum"], ["STELLA", "JUPILER", "TYSKIE"])
+
+        mapped = schema.map_field(serializers.ChoiceField(choices=["a", "b"]))
+        self.assertEqual(mapped, {"enum": ["a", "b"], "type": "string"})
+
+
+class EnumFilterBackendTestCase(TestCase):
+    def setUp(self):
+        self.jobs = [
+            Job.objects.create(status=status)
+            for status in (JobStatus.PENDING, JobStatus.DONE, JobStatus.FAILED)
+        ]
+        self.view = JobList.as_view()
+        self.factory = APIRequestFactory()
+
+    def get_ids(self, query):
+        response = self.view(self.factory.get("/jobs/", query))
+        self.assertEqual(response.status_code, 200, response.data)
+        return [job["id"] for job in response.data]
+
+    def test_filter(self):
+        pending, done, failed = [job.id for job in self.jobs]
+        self.assertEqual(self.get_ids({}), [pending, done, failed])
+        self.assertEqual(self.get_ids({"status": "DONE"}), [done])
+        self.assertEqual(
+            self.get_ids({"status": "FAILED, 0,PENDING"}), [pending, failed]
+        )
+        self.assertEqual(self.get_ids({"status": ["2", "3"]}), [done, failed])
+        self.assertEqual(self.get_ids({"status": ""}), [pending, done, failed])
+        self.assertEqual(self.get_ids({"result": "FAILED"}), [])
+
+    def test_lookup(self):
+        backend = EnumFilterBackend()
+        field = Job._meta.get_field("status")
+        self.assertEqual(
+            backend.parse(field, ["FAILED,0", "3,PENDING"]),
+            [JobStatus.PENDING, JobStatus.FAILED],
+        )
+        self.assertIs(
+            EnumFilterBackend.get_tokens(JobStatus),
+            EnumFilterBackend.get_tokens(JobStatus),
+        )
+
+    def test_unknown_tokens(self):
+        response = self.view(self.factory.get("/jobs/", {"status": "DONE,nope,7"}))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.data["status"]), 2)
+
+    def test_schema_parameters(self):
+        parameters = EnumFilterBackend().get_schema_operation_parameters(JobList())
+        self.assertEqual(
+            [parameter["name"] for parameter in parameters], ["status", "result"]
+        )
@@ -0,0 +1,120 @@
+from io import StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import models, transaction
+from django.test import TestCase
+
+from django_enumfield.checks import check_counted_fields
+from django_enumfield.contrib import counters
+from django_enumfield.contrib.counters.models import EnumCounter
+from django_enumfield.tests.models import Job, JobStatus, Person
+
+
+class CountersTest(TestCase):
+    def get_counts(self):
+        counts = counters.get_counts(Job, "status")
+        return {member.name: count for member, count in counts.items() if count}
+
+    def test_counts(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            first = Job.objects.create()
+            Job.objects.create(status=JobStatus.PROCESSING)
+            first.status = JobStatus.DONE
+            first.save()
+        # Batched in one callback per transaction
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.get_counts(), {"PROCESSING": 1, "DONE": 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job = Job.objects.get(status=JobStatus.PROCESSING)
+            job.status = JobStatus.FAILED
+            job.save(update_fields=["status"])
+            first.delete()
+            # Unchanged
+            Job.objects.get(pk=job.pk).save()
+        self.assertEqual(self.get_counts(), {"FAILED": 1})
+        self.assertEqual(EnumCounter.objects.get(value=JobStatus.DONE).count, 0)
+
+    def test_update_fields(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = Job.objects.create()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            job.status = JobStatus.DONE
+            job.save(update_fields=["previous"])
+        self.assertEqual(callbacks, [])
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        self.assertEqual(self.get_counts(), {"DONE": 1})
+
+    def test_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Job.objects.create()
+            try:
+                with transaction.atomic():
+                    Job.objects.create(status=JobStatus.DONE)
+                    raise ValueError
+            except ValueError:
+                pass
+            Job.objects.create(status=JobStatus.FAILED)
+        self.assertEqual(self.get_counts(), {"PENDING": 1, "FAILED": 1})
+
+    def test_check(self):
+        self.assertEqual(check_counted_fields(), [])
+        with mock.patch.object(apps, "is_installed", return_value=False):
+            errors = check_counted_fields([apps.get_app_config("tests")])
+        self.assertEqual(
+            [(error.id, error.obj) for error in errors],
+            [("django_enumfield.E003", Job._meta.get_field("status"))],
+        )
+
+    def test_receivers(self):
+        # Connected to counted models only
+        self.assertTrue(models.signals.post_init.has_listeners(Job))
+        self.assertFalse(models.signals.post_init.has_listeners(Person))
+
+    def test_nested_savepoints(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Job.objects.create()
+            with transaction.atomic():
+                Job.objects.create(status=JobStatus.DONE)
+            Job.objects.create(status=JobStatus.DONE)
+            try:
+                with transaction.atomic():
+                    Job.objects.create(status=JobStatus.FAILED)
+                    with transaction.atomic():
+                        Job.objects.create(status=JobStatus.FAILED)
+                    raise ValueError
+            except ValueError:
+                pass
+        # One callback for the transaction and one for the kept savepoint
+        self.assertEqual(len(callbacks), 2)
+        self.assertEqual(self.get_counts(), {"PENDING": 1, "DONE": 2})
+
+    def test_deferred(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = Job.objects.create()
+        job = Job.objects.only("pk").get(pk=job.pk)
+        job.status = JobStatus.DONE
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        self.assertEqual(self.get_counts(), {"DONE": 1})
+        job = Job.objects.defer("status").get(pk=job.pk)
+        job.status = JobStatus.FAILED
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save(update_fields=["status"])
+        self.assertEqual(self.get_counts(), {"FAILED": 1})
+
+    def test_rebuild(self):
+        for status in (JobStatus.PENDING, JobStatus.DONE, JobStatus.DONE):
+            Job.objects.create(status=status)
+        EnumCounter.objects.create(
+            model="tests.job", field="status", value=JobStatus.FAILED, count=5
+        )
+        Job.objects.filter(status=JobStatus.PENDING).update(status=JobStatus.FAILED)
+
+        out = StringIO()
+        call_command("rebuild_enum_counters", "tests", chunk_size=2, stdout=out)
+        self.assertEqual(out.getvalue(), "tests.Job.status: 3 row(s)\n")
+        self.assertEqual(self.get_counts(), {"DONE": 2, "FAILED": 1})
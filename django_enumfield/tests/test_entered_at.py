@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import connection, models
+from django.db.migrations.state import ModelState
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from django_enumfield.checks import check_entered_at_indexes
+from django_enumfield.db.fields import EnumField
+from django_enumfield.tests.models import Job, Order, OrderStatus
+
+
+class EnteredAtTest(TestCase):
+    def test_field(self):
+        field = Order._meta.get_field("status_entered_at")
+        self.assertTrue(field.null)
+        self.assertFalse(field.editable)
+        self.assertIs(Order._meta.get_field("status").entered_at_field, field)
+        self.assertNotIn(
+            "track_entered_at", Order._meta.get_field("status").deconstruct()[3]
+        )
+
+    def test_index(self):
+        index = Order._meta.get_field("status").entered_at_index(Order)
+        self.assertEqual(index.fields, ["status", "status_entered_at"])
+        self.assertLessEqual(len(index.name), 30)
+        self.assertIsNone(Job._meta.get_field("status").entered_at_index(Job))
+        self.assertEqual(check_entered_at_indexes([apps.get_app_config("tests")]), [])
+        # Declared indexes are part of migrations
+        state = ModelState.from_model(Order)
+        self.assertEqual(
+            [index.fields for index in state.options["indexes"]],
+            [["status", "status_entered_at"]],
+        )
+
+        class UnindexedOrder(models.Model):
+            status = EnumField(OrderStatus, track_entered_at=True)
+
+            class Meta:
+                app_label = "tests"
+
+        # Inherited fields are indexed on the table of the parent
+        class SubOrder(Order):
+            class Meta:
+                app_label = "tests"
+
+        try:
+            errors = check_entered_at_indexes()
+            self.assertEqual(
+                [(error.id, error.obj) for error in errors],
+                [("django_enumfield.W004", UnindexedOrder._meta.get_field("status"))],
+            )
+        finally:
+            del apps.get_app_config("tests").models["unindexedorder"]
+            del apps.get_app_config("tests").models["suborder"]
+            apps.clear_cache()
+
+    def test_set_on_create(self):
+        before = timezone.now()
+        order = Order.objects.create()
+        self.assertGreaterEqual(order.status_entered_at, before)
+        order.refresh_from_db()
+        self.assertGreaterEqual(order.status_entered_at, before)
+
+    def test_set_in_same_update(self):
+        order = Order.objects.create()
+        entered_at = order.status_entered_at
+
+        order.paid = True
+        order.save()
+        self.assertEqual(order.status_entered_at, entered_at)
+
+        order.status = OrderStatus.PAID
+        with CaptureQueriesContext(connection) as queries:
+            order.save()
+        self.assertEqual(len(queries), 1)
+        self.assertIn("status_entered_at", queries[0]["sql"])
+        self.assertGreater(order.status_entered_at, entered_at)
+        order.refresh_from_db()
+        self.assertGreater(order.status_entered_at, entered_at)
+
+    def test_update_fields(self):
+        order = Order.objects.create()
+        entered_at = order.status_entered_at
+        order.status = OrderStatus.PAID
+        order.save(update_fields=["status"])
+        self.assertGreater(order.status_entered_at, entered_at)
+        order.refresh_from_db()
+        self.assertGreater(order.status_entered_at, entered_at)
+
+        # Written by the same UPDATE when included
+        order.status = OrderStatus.SHIPPED
+        with CaptureQueriesContext(connection) as queries:
+            order.save(update_fields=["status", "status_entered_at"])
+        self.assertEqual(len(queries), 1)
+
+    def test_loaded_instance_is_unchanged(self):
+        order = Order.objects.create()
+        entered_at = order.status_entered_at
+        order = Order.objects.get(pk=order.pk)
+        order.save()
+        self.assertEqual(order.status_entered_at, entered_at)
+
+    def test_in_state_longer_than(self):
+        old = Order.objects.create()
+        Order.objects.filter(pk=old.pk).update(
+            status_entered_at=timezone.now() - timedelta(hours=2)
+        )
+        Order.objects.create()
+        paid = Order.objects.create(status=OrderStatus.PAID)
+        Order.objects.filter(pk=paid.pk).update(
+            status_entered_at=timezone.now() - timedelta(hours=2)
+        )
+        self.assertEqual(
+            list(
+                Order.objects.in_state_longer_than(
+                    "status", OrderStatus.NEW, timedelta(hours=1)
+                )
+            ),
+            [old],
+        )
+        with self.assertRaises(ValueError):
+            Job.objects.in_state_longer_than("status", 0, timedelta(hours=1))
@@ -1,31 +1,80 @@
 from contextlib import contextmanager
 from os.path import abspath, dirname, exists, join
 
+import django
 from django import forms
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
 from django.core.management import call_command
-from django.db import IntegrityError, connection
+from django.db import IntegrityError, connection, migrations, models
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.state import ModelState, ProjectState
 from django.db.backends.sqlite3.base import DatabaseWrapper
 from django.db.models.fields import NOT_PROVIDED
 from django.test import TestCase
 from django.test.client import RequestFactory
 
+from django_enumfield.checks import check_hot_indexes
 from django_enumfield.db.fields import EnumField
-from django_enumfield.enum import BlankEnum, Enum
+from django_enumfield.enum import BlankEnum, Enum, EnumChoices
 from django_enumfield.exceptions import InvalidStatusOperationError
-from django_enumfield.forms.fields import EnumChoiceField
+from django_enumfield.forms.fields import (
+    EnumChoiceField,
+    EnumMultipleChoiceField,
+    NextChoicesFormMixin,
+)
 from django_enumfield.tests.models import (
     Beer,
     BeerState,
     BeerStyle,
+    Brewery,
+    Country,
+    DeferredPerson,
+    Job,
+    JobStatus,
     LabelBeer,
     Lamp,
     LampState,
+    Order,
+    OrderStatus,
     Person,
     PersonStatus,
     PersonStatusDefault,
+    ProxyDeferredPerson,
+    UnvalidatedPerson,
 )
 
 
+# Enums differing in one way each, defined once as they stay registered.
+class Status(Enum):
+    ON = 1
+    OFF = 2
+
+
+class RenamedStatus(Enum):
+    ON = 1
+    STOPPED = 2
+
+
+class DefaultStatus(Enum):
+    ON = 1
+    OFF = 2
+
+    __default__ = ON
+
+
+class TransitionStatus(Enum):
+    ON = 1
+    OFF = 2
+
+    __transitions__ = {OFF: (ON,)}
+
+
+class SameStatus(Enum):
+    OFF = 2
+    ON = 1
+
+
 def _mock_disable_constraint_checking(self):
     self.cursor().execute("PRAGMA foreign_keys = OFF")
     return True
@@ -138,6 +187,201 @@ class EnumFieldTest(TestCase):
         lamp2.refresh_from_db()
         self.assertEqual(lamp2.state, LampState.ON)
 
+    def test_enum_field_deferred_validation(self):
+        person = DeferredPerson.objects.create()
+        # Intermediate values are not validated, only the net transition.
+        person.status = PersonStatus.VOID
+        person.status = PersonStatus.DEAD
+        person.save()
+        person.refresh_from_db()
+        self.assertEqual(person.status, PersonStatus.DEAD)
+
+        person.status = PersonStatus.ALIVE
+        with self.assertRaises(InvalidStatusOperationError):
+            person.save()
+        person.status = PersonStatus.REANIMATED
+        person.save()
+
+        person = DeferredPerson.objects.get(pk=person.pk)
+        person.status = PersonStatus.UNBORN
+        with self.assertRaises(InvalidStatusOperationError):
+            person.save()
+        with self.assertRaises(InvalidStatusOperationError):
+            person.status = 42
+
+    def test_enum_field_deferred_validation_proxy(self):
+        person = ProxyDeferredPerson.objects.create()
+        person.status = PersonStatus.UNBORN
+        with self.assertRaises(InvalidStatusOperationError):
+            person.save()
+        person.status = PersonStatus.DEAD
+        person.save()
+        # Validated from the saved value
+        person.status = PersonStatus.ALIVE
+        with self.assertRaises(InvalidStatusOperationError):
+            person.save()
+
+    def test_enum_field_deferred_validation_refresh(self):
+        person = DeferredPerson.objects.create()
+        DeferredPerson.objects.filter(pk=person.pk).update(status=PersonStatus.DEAD)
+        person.refresh_from_db(fields=["status"])
+        # Validated from the refreshed DEAD, not the ALIVE it was created with
+        person.status = PersonStatus.REANIMATED
+        person.save()
+
+        DeferredPerson.objects.filter(pk=person.pk).update(status=PersonStatus.ALIVE)
+        person.refresh_from_db()
+        person.status = PersonStatus.REANIMATED
+        with self.assertRaises(InvalidStatusOperationError):
+            person.save()
+
+    def test_enum_field_validation_off(self):
+        person = UnvalidatedPerson.objects.create()
+        person.status = PersonStatus.UNBORN
+        person.save()
+        self.assertEqual(
+            UnvalidatedPerson.objects.get(pk=person.pk).status, PersonStatus.UNBORN
+        )
+        with self.assertRaises(InvalidStatusOperationError):
+            person.status = 42
+
+    def test_enum_field_validation_mode(self):
+        self.assertEqual(Person._meta.get_field("status").validation, "strict")
+        field = DeferredPerson._meta.get_field("status")
+        self.assertEqual(field.deconstruct()[3]["validation"], "deferred")
+        self.assertNotIn(
+            "validation", Person._meta.get_field("status").deconstruct()[3]
+        )
+        with self.assertRaises(ValueError):
+            EnumField(PersonStatus, validation="lazy")
+
+    def test_deconstruct_fingerprint(self):
+        # Opt-in
+        self.assertNotIn(
+            "fingerprint", Person._meta.get_field("status").deconstruct()[3]
+        )
+        field = EnumField(PersonStatus, fingerprint=True)
+        self.assertEqual(
+            field.deconstruct()[3]["fingerprint"], PersonStatus.fingerprint()
+        )
+        field = EnumField(PersonStatus, fingerprint="0123456789abcdef")
+        self.assertEqual(field.deconstruct()[3]["fingerprint"], "0123456789abcdef")
+        if django.VERSION >= (4, 1):
+            # Not altering the column
+            old_field = EnumField(PersonStatus, fingerprint="0123456789abcdef")
+            new_field = EnumField(PersonStatus, fingerprint=True)
+            old_field.set_attributes_from_name("status")
+            new_field.set_attributes_from_name("status")
+            self.assertFalse(
+                connection.schema_editor()._field_should_be_altered(
+                    old_field, new_field
+                )
+            )
+
+        def state(fingerprint):
+            project_state = ProjectState()
+            project_state.add_model(
+                ModelState(
+                    "tests",
+                    "Thing",
+                    [
+                        ("id", models.AutoField(primary_key=True)),
+                        ("status", EnumField(PersonStatus, fingerprint=fingerprint)),
+                    ],
+                )
+            )
+            return project_state
+
+        current = state(True)
+        changes = MigrationAutodetector(
+            state(PersonStatus.fingerprint()), current
+        )._detect_changes()
+        self.assertEqual(changes, {})
+        # The members changed since the migration
+        changes = MigrationAutodetector(
+            state("0123456789abcdef"), current
+        )._detect_changes()
+        operation = changes["tests"][0].operations[0]
+        self.assertIsInstance(operation, migrations.AlterField)
+        self.assertEqual(
+            operation.field.deconstruct()[3]["fingerprint"],
+            PersonStatus.fingerprint(),
+        )
+
+    def test_hot_index(self):
+        indexes = {index.name: index for index in Job._meta.indexes}
+        self.assertEqual(
+            indexes["tests_job_status_hot"].condition.children,
+            [("status__in", [0, 1])],
+        )
+        status_index = Job._meta.get_field("status").hot_index(Job)
+        self.assertEqual(
+            status_index.condition, indexes["tests_job_status_hot"].condition
+        )
+        self.assertLessEqual(len(status_index.name), 30)
+        result_index = Job._meta.get_field("result").hot_index(Job)
+        self.assertEqual(result_index.condition.children, [("result__in", [3])])
+        self.assertIsNone(Job._meta.get_field("previous").hot_index(Job))
+        self.assertEqual(check_hot_indexes([apps.get_app_config("tests")]), [])
+
+        # Declared indexes are part of migrations
+        state = ModelState.from_model(Job)
+        self.assertEqual(
+            sorted(index.name for index in state.options["indexes"]),
+            ["tests_job_result_hot", "tests_job_status_hot"],
+        )
+
+        class UnindexedJob(models.Model):
+            status = EnumField(JobStatus, counted=False)
+
+            class Meta:
+                app_label = "tests"
+
+        # Inherited fields are indexed on the table of the parent
+        class SubJob(Job):
+            class Meta:
+                app_label = "tests"
+
+        try:
+            errors = check_hot_indexes()
+            self.assertEqual(
+                [(error.id, error.obj) for error in errors],
+                [("django_enumfield.W002", UnindexedJob._meta.get_field("status"))],
+            )
+        finally:
+            del apps.get_app_config("tests").models["unindexedjob"]
+            del apps.get_app_config("tests").models["subjob"]
+            apps.clear_cache()
+
+        field = Job._meta.get_field("result")
+        self.assertEqual(field.deconstruct()[3]["hot"], [3])
+        self.assertNotIn("hot", Job._meta.get_field("status").deconstruct()[3])
+        with self.assertRaises(ImproperlyConfigured):
+            EnumField(JobStatus, hot=(42,)).hot_values
+
+    def test_hot_lookup(self):
+        Job.objects.create(status=JobStatus.PENDING, result=JobStatus.FAILED)
+        Job.objects.create(status=JobStatus.PROCESSING)
+        Job.objects.create(status=JobStatus.DONE)
+        self.assertEqual(Job.objects.filter(status__hot=True).count(), 2)
+        self.assertEqual(Job.objects.filter(status__hot=False).count(), 1)
+        self.assertEqual(
+            Job.objects.filter(status__hot=True, status=JobStatus.PENDING).count(), 1
+        )
+        self.assertEqual(Job.objects.filter(result__hot=True).count(), 1)
+        self.assertEqual(Job.objects.filter(previous__hot=True).count(), 0)
+        self.assertEqual(Job.objects.filter(previous__hot=False).count(), 3)
+        # NULL is not hot
+        self.assertEqual(Job.objects.filter(result__hot=False).count(), 2)
+
+        if connection.vendor == "sqlite":
+            index_name = "tests_job_status_hot"
+            queryset = Job.objects.filter(status__hot=True, status=JobStatus.PENDING)
+            sql, params = queryset.values("pk").query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+                self.assertIn(index_name, str(cursor.fetchall()))
+
     def test_magic_model_properties(self):
         beer = Beer.objects.create(style=BeerStyle.WEISSBIER)
         self.assertEqual(getattr(beer, "get_style_display")(), "WEISSBIER")
@@ -258,6 +502,110 @@ class EnumFieldTest(TestCase):
         self.assertTrue(form.is_valid(), form.errors)
         self.assertEqual(form.cleaned_data["status"], "")
 
+    def test_enum_form_field_choice_index(self):
+        field = EnumChoiceField(BeerStyle, required=False)
+        self.assertEqual(field._choice_index, frozenset(["", "0", "1", "2"]))
+        self.assertTrue(field.valid_value("2"))
+        self.assertFalse(field.valid_value("3"))
+        self.assertEqual(field.clean("2"), BeerStyle.WEISSBIER)
+        with self.assertRaises(forms.ValidationError):
+            field.clean("3")
+
+        field.choices = [(BeerStyle.LAGER.value, BeerStyle.LAGER)]
+        self.assertFalse(field.valid_value("2"))
+
+        field.choices = lambda: BeerStyle.choices()
+        self.assertIsNone(field._choice_index)
+        self.assertTrue(field.valid_value("2"))
+
+    def test_enum_multiple_choice_field(self):
+        class BeerForm(forms.Form):
+            styles = EnumMultipleChoiceField(BeerStyle)
+
+        form = BeerForm(initial={"styles": [BeerStyle.STOUT]})
+        self.assertIn('<option value="1" selected', str(form["styles"]))
+
+        form = BeerForm(data={"styles": ["0", "2"]})
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(
+            form.cleaned_data["styles"], [BeerStyle.LAGER, BeerStyle.WEISSBIER]
+        )
+        self.assertTrue(
+            all(isinstance(value, BeerStyle) for value in form.cleaned_data["styles"])
+        )
+
+        form = BeerForm(data={"styles": ["0", "3"]})
+        self.assertFalse(form.is_valid())
+        self.assertIn("styles", form.errors)
+
+        field = EnumMultipleChoiceField(BeerStyle, required=False)
+        self.assertEqual(field.clean([]), [])
+
+    def test_lazy_choices(self):
+        field = Brewery._meta.get_field("country")
+        self.assertIsInstance(field.choices, EnumChoices)
+        self.assertIs(field.choices.choices, EnumField(Country).choices.choices)
+        self.assertEqual(field.choices, Country.choices())
+        self.assertEqual(len(field.choices), 4)
+
+        class BreweryForm(forms.ModelForm):
+            class Meta:
+                model = Brewery
+                fields = ("country",)
+
+        form = BreweryForm(data={"country": "47"})
+        self.assertEqual(
+            form.fields["country"].choices, EnumChoices(Country, blank=True)
+        )
+        self.assertIs(
+            form.fields["country"].choices.choices,
+            EnumChoices(Country, blank=True).choices,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data["country"], Country.NORWAY)
+        self.assertIn('<option value="" selected>', str(BreweryForm()["country"]))
+        self.assertFalse(BreweryForm(data={"country": "1"}).is_valid())
+
+    def test_next_choices(self):
+        class OrderForm(forms.ModelForm):
+            class Meta:
+                model = Order
+                fields = ("status",)
+
+        order = Order.objects.create(status=OrderStatus.PAID)
+        form = OrderForm(instance=order)
+        self.assertEqual(
+            [member for _, member in form["status"].field.choices],
+            [OrderStatus.PAID, OrderStatus.SHIPPED, OrderStatus.CANCELLED],
+        )
+        self.assertIs(
+            form["status"].field.choices.choices,
+            OrderForm(instance=order)["status"].field.choices.choices,
+        )
+        self.assertFalse(OrderForm(data={"status": "0"}, instance=order).is_valid())
+        form = OrderForm(data={"status": "2"}, instance=order)
+        self.assertTrue(form.is_valid(), form.errors)
+
+        # New instances have no current value to restrict the choices.
+        form = OrderForm(data={"status": "2"})
+        self.assertEqual(len(form["status"].field.choices), len(OrderStatus))
+
+        # Restricted without binding the fields, as cleaned before Django 4.0
+        class NextChoicesOrderForm(NextChoicesFormMixin, OrderForm):
+            pass
+
+        form = NextChoicesOrderForm(data={"status": "0"}, instance=order)
+        with self.assertRaises(forms.ValidationError):
+            form.fields["status"].clean("0")
+        self.assertEqual(form.fields["status"].clean("2"), OrderStatus.SHIPPED)
+
+        class StatusForm(NextChoicesFormMixin, forms.Form):
+            status = EnumChoiceField(OrderStatus, next_choices=True)
+
+        form = StatusForm(initial={"status": OrderStatus.SHIPPED})
+        with self.assertRaises(forms.ValidationError):
+            form.fields["status"].clean("1")
+
     def test_enum_display_none(self):
         beer = Beer(state=None)
         self.assertIsNone(beer.get_state_display())
@@ -306,6 +654,77 @@ class EnumTest(TestCase):
         self.assertEqual(LabelBeer.get_label(LabelBeer.STELLA.name), "Stella Artois")
         self.assertIsNone(LabelBeer.get_label(89))
 
+    def test_from_label(self):
+        self.assertEqual(LabelBeer.from_label("Stella Artois"), LabelBeer.STELLA)
+        self.assertEqual(LabelBeer.from_label("JUPILER"), LabelBeer.JUPILER)
+        self.assertIsNone(LabelBeer.from_label("stella artois"))
+        self.assertEqual(
+            LabelBeer.from_label("stella ARTOIS", case_insensitive=True),
+            LabelBeer.STELLA,
+        )
+        self.assertEqual(LabelBeer.from_label("Heineken", default="?"), "?")
+        self.assertEqual(
+            LabelBeer.from_label("Browar Tyskie", language="en"), LabelBeer.TYSKIE
+        )
+
+    def test_parse_many(self):
+        parsed = list(
+            LabelBeer.parse_many(
+                ["Stella Artois", "1", 2, "TYSKIE", LabelBeer.JUPILER, "Heineken", 9]
+            )
+        )
+        self.assertEqual(
+            parsed[:5],
+            [
+                LabelBeer.STELLA,
+                LabelBeer.JUPILER,
+                LabelBeer.TYSKIE,
+                LabelBeer.TYSKIE,
+                LabelBeer.JUPILER,
+            ],
+        )
+        self.assertIsInstance(parsed[5], InvalidStatusOperationError)
+        self.assertIsInstance(parsed[6], InvalidStatusOperationError)
+
+    def test_search(self):
+        self.assertEqual(Country.search("sw"), [Country.SWEDEN, Country.SWITZERLAND])
+        self.assertEqual(Country.search("S", limit=1), [Country.SPAIN])
+        self.assertEqual(
+            Country.search("A"),
+            [Country.NORWAY, Country.SPAIN, Country.SWITZERLAND],
+        )
+        self.assertEqual(Country.search("n", limit=2), [Country.NORWAY, Country.SPAIN])
+        self.assertEqual(Country.search("denmark"), [])
+
+    def test_fingerprint(self):
+        self.assertIs(PersonStatus.fingerprint(), PersonStatus.fingerprint())
+        self.assertEqual(len(PersonStatus.fingerprint()), 16)
+
+        fingerprints = {
+            enum.fingerprint()
+            for enum in (Status, RenamedStatus, DefaultStatus, TransitionStatus)
+        }
+        self.assertEqual(len(fingerprints), 4)
+        self.assertEqual(SameStatus.fingerprint(), Status.fingerprint())
+
+    def test_reachable_from(self):
+        self.assertEqual(
+            PersonStatus.reachable_from(PersonStatus.ALIVE),
+            {PersonStatus.ALIVE, PersonStatus.DEAD, PersonStatus.REANIMATED},
+        )
+        self.assertEqual(PersonStatus.reachable_from("VOID"), frozenset(PersonStatus))
+        self.assertEqual(PersonStatus.reachable_from(42), frozenset())
+        self.assertEqual(LampState.reachable_from(LampState.ON), frozenset(LampState))
+
+    def test_transition_targets(self):
+        self.assertEqual(
+            OrderStatus.transition_targets(OrderStatus.NEW),
+            (OrderStatus.PAID, OrderStatus.CANCELLED),
+        )
+        self.assertEqual(OrderStatus.transition_targets("SHIPPED"), ())
+        self.assertEqual(OrderStatus.transition_targets(42), ())
+        self.assertEqual(LampState.transition_targets(LampState.OFF), (LampState.ON,))
+
     def test_choices(self):
         self.assertEqual(len(PersonStatus.choices()), len(PersonStatus))
         for value, member in PersonStatus.choices():
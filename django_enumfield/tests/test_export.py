@@ -0,0 +1,83 @@
+import json
+from io import StringIO
+
+from django.db.models import Case, When
+from django.test import TestCase
+
+from django_enumfield import export
+from django_enumfield.tests.models import Beer, BeerState, BeerStyle, LabelBeer
+
+
+class ExportTest(TestCase):
+    def setUp(self):
+        self.stout = Beer.objects.create(style=BeerStyle.STOUT, label=LabelBeer.STELLA)
+        self.lager = Beer.objects.create(state=None)
+        Beer.objects.filter(pk=self.lager.pk).update(label=42)
+        self.queryset = Beer.objects.order_by("pk")
+
+    def test_iter_rows(self):
+        rows = list(export.iter_rows(self.queryset, ["id", "style", "state", "label"]))
+        self.assertEqual(
+            rows,
+            [
+                (self.stout.pk, "STOUT", "FIZZY", "Stella Artois"),
+                (self.lager.pk, "LAGER", None, None),
+            ],
+        )
+
+    def test_iter_rows_render(self):
+        rows = export.iter_rows(self.queryset, ["style", "label"], render="name")
+        self.assertEqual(list(rows), [("STOUT", "STELLA"), ("LAGER", None)])
+        rows = export.iter_rows(self.queryset, ["style", "label"], render="value")
+        self.assertEqual(list(rows), [(1, 0), (0, None)])
+        with self.assertRaises(ValueError):
+            export.iter_rows(self.queryset, render="member")
+
+    def test_iter_rows_without_enum_columns(self):
+        rows = export.iter_rows(self.queryset, ["id"], chunk_size=1)
+        self.assertEqual(list(rows), [(self.stout.pk,), (self.lager.pk,)])
+
+    def test_iter_rows_pk_and_annotations(self):
+        queryset = self.queryset.annotate(
+            stout=Case(When(style=BeerStyle.STOUT, then=1), default=0)
+        )
+        rows = export.iter_rows(queryset, ["pk", "stout", "style"])
+        self.assertEqual(
+            list(rows), [(self.stout.pk, 1, "STOUT"), (self.lager.pk, 0, "LAGER")]
+        )
+
+    def test_write_csv(self):
+        out = StringIO()
+        export.write_csv(self.queryset, out)
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            [
+                "id,style,state,label",
+                "{},STOUT,FIZZY,Stella Artois".format(self.stout.pk),
+                "{},LAGER,,".format(self.lager.pk),
+            ],
+        )
+
+    def test_write_jsonl(self):
+        out = StringIO()
+        export.write_jsonl(self.queryset, out, ["style", "state"], render="value")
+        self.assertEqual(
+            [json.loads(line) for line in out.getvalue().splitlines()],
+            [
+                {"style": BeerStyle.STOUT.value, "state": BeerState.FIZZY.value},
+                {"style": BeerStyle.LAGER.value, "state": None},
+            ],
+        )
+
+    def test_streaming_response(self):
+        response = export.streaming_response(
+            self.queryset, fields=["style"], filename="beers.csv", header=False
+        )
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="beers.csv"', response["Content-Disposition"])
+        self.assertEqual(b"".join(response.streaming_content), b"STOUT\r\nLAGER\r\n")
+
+        response = export.streaming_response(self.queryset, "jsonl", fields=["style"])
+        self.assertEqual(response["Content-Type"], "application/jsonl")
+        with self.assertRaises(ValueError):
+            export.streaming_response(self.queryset, "xml")
@@ -0,0 +1,122 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+from rest_framework import serializers
+
+from django_enumfield import instrumentation, validators
+from django_enumfield.contrib import drf
+from django_enumfield.db.fields import EnumField
+from django_enumfield.exceptions import InvalidStatusOperationError
+from django_enumfield.tests.models import (
+    Job,
+    JobStatus,
+    Lamp,
+    LampState,
+    Person,
+    PersonStatus,
+)
+
+
+class LampSerializer(serializers.Serializer):
+    state = drf.EnumField(LampState)
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.disable)
+        self.addCleanup(instrumentation.reset)
+
+    def get_counts(self):
+        return {
+            (m.event, m.enum, m.field): (m.calls, m.failures)
+            for m in instrumentation.snapshot()
+        }
+
+    def test_disabled(self):
+        original = EnumField.__dict__["from_db_value"]
+        with instrumentation.instrument():
+            self.assertTrue(instrumentation.is_enabled())
+            self.assertIsNot(EnumField.__dict__["from_db_value"], original)
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(EnumField.__dict__["from_db_value"], original)
+        self.assertEqual(
+            validators.validate_valid_transition.__name__, "validate_valid_transition"
+        )
+        self.assertNotIn("__wrapped__", vars(validators.validate_valid_transition))
+
+        Lamp.objects.create()
+        list(Lamp.objects.all())
+        self.assertEqual(instrumentation.snapshot(), [])
+
+    def test_counters(self):
+        Lamp.objects.create()
+        Lamp.objects.update(state=5)
+        person = Person.objects.create(status=PersonStatus.ALIVE)
+
+        with instrumentation.instrument(sample_rate=1):
+            self.assertEqual(list(Lamp.objects.all())[0].state, None)
+            person.status = PersonStatus.DEAD
+            with self.assertRaises(InvalidStatusOperationError):
+                person.status = PersonStatus.ALIVE
+            LampSerializer({"state": LampState.ON}).data
+
+        counts = self.get_counts()
+        self.assertEqual(
+            counts[("from_db_value", LampState, "tests.Lamp.state")], (1, 1)
+        )
+        self.assertEqual(
+            counts[("validate_transition", PersonStatus, "status")], (2, 1)
+        )
+        self.assertEqual(counts[("to_representation", LampState, "state")], (1, 0))
+        for measurement in instrumentation.snapshot():
+            self.assertEqual(measurement.timed_calls, measurement.calls)
+            self.assertGreater(measurement.total_time, 0)
+
+    def test_counts_per_field(self):
+        job = Job.objects.create()
+        with instrumentation.instrument():
+            job.result = JobStatus.FAILED
+            job.previous = JobStatus.DONE
+            job.previous = JobStatus.FAILED
+
+        counts = self.get_counts()
+        self.assertEqual(counts[("validate_transition", JobStatus, "result")], (1, 0))
+        self.assertEqual(counts[("validate_transition", JobStatus, "previous")], (2, 0))
+
+    def test_untimed(self):
+        with instrumentation.instrument():
+            Person.objects.create(status=PersonStatus.ALIVE)
+        (measurement,) = instrumentation.snapshot()
+        self.assertEqual((measurement.calls, measurement.timed_calls), (1, 0))
+
+    def test_flush(self):
+        exported = []
+        instrumentation.add_exporter(exported.append)
+        self.addCleanup(instrumentation.remove_exporter, exported.append)
+        self.assertEqual(instrumentation.flush(), [])
+        self.assertEqual(exported, [])
+
+        with instrumentation.instrument():
+            Person.objects.create(status=PersonStatus.ALIVE)
+        with self.assertLogs("django_enumfield.instrumentation"):
+            instrumentation.logging_exporter(instrumentation.snapshot())
+        measurements = instrumentation.flush()
+        self.assertEqual(exported, [measurements])
+        self.assertEqual(measurements[0].event, "validate_transition")
+        self.assertEqual(instrumentation.snapshot(), [])
+
+    @override_settings(
+        ENUMFIELD_INSTRUMENTATION={
+            "sample_rate": 0.5,
+            "exporters": ["django_enumfield.instrumentation.logging_exporter"],
+        }
+    )
+    def test_configure(self):
+        from django.conf import settings
+
+        self.addCleanup(
+            instrumentation.remove_exporter, instrumentation.logging_exporter
+        )
+        instrumentation.configure(settings.ENUMFIELD_INSTRUMENTATION)
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIn(instrumentation.logging_exporter, instrumentation._exporters)
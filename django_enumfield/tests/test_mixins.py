@@ -0,0 +1,128 @@
+import pickle
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.test import TestCase
+
+from django_enumfield.db.fields import EnumField
+from django_enumfield.exceptions import InvalidStatusOperationError
+from django_enumfield.tests.models import (
+    BeerStyle,
+    Order,
+    OrderStatus,
+    Person,
+    PersonStatus,
+    PickledPerson,
+)
+
+
+class EnumPickleMixinTest(TestCase):
+    def test_state_holds_ints(self):
+        person = PickledPerson(status=PersonStatus.DEAD, style=BeerStyle.STOUT)
+        state = person.__getstate__()
+        self.assertIs(type(state["status"]), int)
+        self.assertIs(type(state["style"]), int)
+        self.assertNotIn("_enum_status", state)
+        # The instance itself is left untouched
+        self.assertIsInstance(person.status, PersonStatus)
+
+        # Django before 3.2 returns the __dict__ of the instance itself
+        with mock.patch.object(
+            models.Model, "__getstate__", lambda self: self.__dict__
+        ):
+            state = person.__getstate__()
+        self.assertIs(type(state["status"]), int)
+        self.assertIsInstance(person.status, PersonStatus)
+        self.assertIs(person._enum_status, person.status)
+
+    def test_round_trip(self):
+        person = PickledPerson.objects.create(style=None)
+        loaded = pickle.loads(pickle.dumps(person))
+        self.assertEqual(loaded.pk, person.pk)
+        self.assertIsInstance(loaded.status, PersonStatus)
+        self.assertIs(loaded.status, PersonStatus.ALIVE)
+        self.assertIsNone(loaded.style)
+
+        # Transitions are validated against the restored value
+        with self.assertRaises(InvalidStatusOperationError):
+            loaded.status = PersonStatus.UNBORN
+        loaded.status = PersonStatus.DEAD
+        loaded.save()
+        self.assertEqual(
+            PickledPerson.objects.get(pk=person.pk).status, PersonStatus.DEAD
+        )
+
+    def test_deferred_fields(self):
+        PickledPerson.objects.create(style=BeerStyle.LAGER)
+        person = PickledPerson.objects.defer("style").get()
+        loaded = pickle.loads(pickle.dumps(person))
+        self.assertEqual(loaded.get_deferred_fields(), {"style"})
+        self.assertIs(loaded.status, PersonStatus.ALIVE)
+
+    def test_smaller_than_plain_pickle(self):
+        compact = PickledPerson(status=PersonStatus.DEAD)
+        plain = Person(status=PersonStatus.DEAD)
+        self.assertLess(len(pickle.dumps(compact)), len(pickle.dumps(plain)))
+
+
+class TransitionMixinTest(TestCase):
+    def test_dispatch_table(self):
+        field = Order._meta.get_field("status")
+        self.assertEqual(
+            set(field.transition_dispatch),
+            {
+                (OrderStatus.NEW, OrderStatus.PAID),
+                (OrderStatus.NEW, OrderStatus.CANCELLED),
+                (OrderStatus.PAID, OrderStatus.CANCELLED),
+                (OrderStatus.PAID, OrderStatus.SHIPPED),
+            },
+        )
+        guards, handlers = field.transition_dispatch[
+            (OrderStatus.NEW, OrderStatus.PAID)
+        ]
+        self.assertEqual((guards, handlers), ((Order.is_paid,), ()))
+
+    def test_guard(self):
+        order = Order.objects.create()
+        with self.assertRaises(InvalidStatusOperationError):
+            order.transition_to(OrderStatus.PAID)
+        self.assertEqual(order.status, OrderStatus.NEW)
+
+        order.paid = True
+        self.assertEqual(order.transition_to("PAID"), OrderStatus.NEW)
+        self.assertEqual(order.status, OrderStatus.PAID)
+        self.assertEqual(order.events, [])
+
+    def test_handlers(self):
+        order = Order.objects.create(paid=True)
+        order.transition_to(OrderStatus.PAID)
+        order.transition_to(OrderStatus.SHIPPED, field="status", carrier="DHL")
+        self.assertEqual(
+            order.events,
+            [("notify", OrderStatus.PAID, OrderStatus.SHIPPED, {"carrier": "DHL"})],
+        )
+
+        order = Order.objects.create()
+        order.transition_to(OrderStatus.CANCELLED)
+        self.assertEqual(
+            order.events, [("refund", OrderStatus.NEW, OrderStatus.CANCELLED, {})]
+        )
+
+    def test_invalid_transition(self):
+        order = Order.objects.create()
+        with self.assertRaises(InvalidStatusOperationError):
+            order.transition_to(OrderStatus.SHIPPED)
+        with self.assertRaises(InvalidStatusOperationError):
+            order.transition_to(42)
+        self.assertEqual(order.status, OrderStatus.NEW)
+
+    def test_invalid_edge_registration(self):
+        field = EnumField(OrderStatus)
+
+        @field.on_transition(OrderStatus.SHIPPED, OrderStatus.NEW)
+        def handler(self, from_value, to_value):
+            pass  # pragma: no cover
+
+        with self.assertRaises(ImproperlyConfigured):
+            field._compile_transitions(Order)
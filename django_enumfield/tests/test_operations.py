@@ -0,0 +1,140 @@
+from unittest import mock
+
+from django.db import IntegrityError, connection, migrations, transaction
+from django.db.migrations.state import ProjectState
+from django.test import TestCase
+
+from django_enumfield.checks import check_transition_triggers
+from django_enumfield.db.operations import EnforceTransitions
+from django_enumfield.tests.models import Person, PersonStatus
+
+
+class EnforceTransitionsTest(TestCase):
+    def migrate(self, operation, backwards=False):
+        state = ProjectState.from_apps(Person._meta.apps)
+        editor = connection.schema_editor()
+        if backwards:
+            operation.database_backwards("tests", editor, state, state)
+        else:
+            operation.database_forwards("tests", editor, state, state)
+
+    def assertRejected(self, queryset, status):
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                queryset.update(status=status)
+
+    def test_operation(self):
+        operation = EnforceTransitions.for_field(Person, "status")
+        self.assertEqual(
+            operation.deconstruct(),
+            (
+                "EnforceTransitions",
+                ["person", "status", {0: [4], 1: [0], 2: [0, 1], 3: [2]}],
+                {},
+            ),
+        )
+        self.assertEqual(
+            operation.migration_name_fragment, "enforce_person_status_transitions"
+        )
+
+    def test_trigger(self):
+        if connection.vendor not in ("sqlite", "postgresql"):  # pragma: no cover
+            self.skipTest("Triggers are not supported on " + connection.vendor)
+        person = Person.objects.create(status=PersonStatus.ALIVE)
+        queryset = Person.objects.filter(pk=person.pk)
+        self.migrate(EnforceTransitions.for_field(Person, "status"))
+
+        self.assertRejected(queryset, PersonStatus.REANIMATED)
+        self.assertRejected(queryset, PersonStatus.VOID)
+        queryset.update(status=PersonStatus.ALIVE)
+        queryset.update(example="bar")
+        queryset.update(status=PersonStatus.DEAD)
+        self.assertRejected(queryset, PersonStatus.ALIVE)
+
+        # Replaced by later transitions
+        self.migrate(EnforceTransitions("person", "status", {PersonStatus.ALIVE: [2]}))
+        queryset.update(status=PersonStatus.ALIVE)
+        self.assertRejected(queryset, PersonStatus.DEAD)
+
+        self.migrate(EnforceTransitions("person", "status", {}), backwards=True)
+        queryset.update(status=PersonStatus.VOID)
+        self.assertEqual(queryset.get().status, PersonStatus.VOID)
+
+    def test_backwards(self):
+        if connection.vendor not in ("sqlite", "postgresql"):  # pragma: no cover
+            self.skipTest("Triggers are not supported on " + connection.vendor)
+        person = Person.objects.create(status=PersonStatus.ALIVE)
+        queryset = Person.objects.filter(pk=person.pk)
+        first = EnforceTransitions.for_field(Person, "status")
+        second = EnforceTransitions("person", "status", {PersonStatus.ALIVE: [2]})
+        state = ProjectState.from_apps(Person._meta.apps)
+        first_state = state.clone()
+        first.state_forwards("tests", first_state)
+        second_state = first_state.clone()
+        second.state_forwards("tests", second_state)
+        editor = connection.schema_editor()
+        first.database_forwards("tests", editor, state, first_state)
+        second.database_forwards("tests", editor, first_state, second_state)
+
+        # Restores the transitions of the previous operation
+        second.database_backwards("tests", editor, second_state, first_state)
+        queryset.update(status=PersonStatus.DEAD)
+        self.assertRejected(queryset, PersonStatus.ALIVE)
+        first.database_backwards("tests", editor, first_state, state)
+        queryset.update(status=PersonStatus.ALIVE)
+
+    def test_check(self):
+        migration = migrations.Migration("0002_transitions", "tests")
+        migration.operations = [
+            EnforceTransitions("person", "status", {1: [0]}),
+            migrations.RunSQL("SELECT 1"),
+        ]
+        loader = mock.Mock()
+        loader.graph.leaf_nodes.return_value = [("tests", "0002_transitions")]
+        loader.graph.forwards_plan.return_value = [("tests", "0002_transitions")]
+        loader.graph.nodes = {("tests", "0002_transitions"): migration}
+        with mock.patch(
+            "django.db.migrations.loader.MigrationLoader", return_value=loader
+        ):
+            (warning,) = check_transition_triggers()
+            self.assertEqual(warning.id, "django_enumfield.W001")
+            self.assertIn(
+                "EnforceTransitions('person', 'status', "
+                "{0: [4], 1: [0], 2: [0, 1], 3: [2]})",
+                warning.hint,
+            )
+
+            migration.operations[0] = EnforceTransitions.for_field(Person, "status")
+            self.assertEqual(check_transition_triggers(), [])
+
+            # Not replaced by older migrations in the plan of a later app
+            old = migrations.Migration("0001_transitions", "tests")
+            old.operations = [EnforceTransitions("person", "status", {1: [0]})]
+            other = migrations.Migration("0001_initial", "zoo")
+            loader.graph.leaf_nodes.return_value = [
+                ("tests", "0002_transitions"),
+                ("zoo", "0001_initial"),
+            ]
+            plans = {
+                ("zoo", "0001_initial"): [
+                    ("tests", "0001_transitions"),
+                    ("zoo", "0001_initial"),
+                ],
+                ("tests", "0002_transitions"): [
+                    ("tests", "0001_transitions"),
+                    ("tests", "0002_transitions"),
+                ],
+            }
+            loader.graph.forwards_plan.side_effect = plans.__getitem__
+            loader.graph.nodes.update(
+                {("tests", "0001_transitions"): old, ("zoo", "0001_initial"): other}
+            )
+            self.assertEqual(check_transition_triggers(), [])
+
+            if connection.vendor not in ("sqlite", "postgresql"):  # pragma: no cover
+                return
+            # Missing from the database, e.g. dropped by a table remake
+            (warning,) = check_transition_triggers(databases=["default"])
+            self.assertEqual(warning.id, "django_enumfield.W003")
+            self.migrate(migration.operations[0])
+            self.assertEqual(check_transition_triggers(databases=["default"]), [])
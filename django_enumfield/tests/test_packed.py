@@ -0,0 +1,159 @@
+from unittest import mock
+
+from django.apps import apps
+from django.db.migrations.state import ProjectState
+from django.db.models import F
+from django.test import TestCase
+
+from django_enumfield.checks import check_packed_layouts
+from django_enumfield.db.packed import PackedEnumField
+from django_enumfield.exceptions import InvalidStatusOperationError
+from django_enumfield.tests.models import (
+    BeerState,
+    Country,
+    LampState,
+    OrderStatus,
+    PackedFlags,
+    PersonStatus,
+)
+
+
+class PackedEnumFieldTest(TestCase):
+    def test_layout(self):
+        field = PackedFlags._meta.get_field("flags")
+        self.assertEqual(
+            [
+                (member.name, member.shift, member.width)
+                for member in field.packed_members.values()
+            ],
+            [("lamp", 0, 2), ("person", 2, 3), ("order", 5, 3), ("country", 8, 4)],
+        )
+        with self.assertRaises(ValueError):
+            PackedEnumField([(str(i), Country) for i in range(16)])
+
+        # Pinned widths
+        field = PackedEnumField([("lamp", LampState, 4), ("person", PersonStatus)])
+        self.assertEqual(field.get_layout(), [("lamp", 0, 4, 0), ("person", 4, 3, 0)])
+        with self.assertRaises(ValueError):
+            PackedEnumField([("person", PersonStatus, 2)])
+
+    def test_check(self):
+        state = ProjectState.from_apps(apps)
+        loader = mock.Mock()
+        loader.project_state.return_value = state
+        app_configs = [apps.get_app_config("tests")]
+        with mock.patch(
+            "django.db.migrations.loader.MigrationLoader", return_value=loader
+        ):
+            self.assertEqual(check_packed_layouts(app_configs), [])
+
+            fields = state.models[("tests", "packedflags")].fields
+            field = PackedFlags._meta.get_field("flags")
+            layout = field.get_layout()
+            layout[0] = ("lamp", 0, 3, 0)
+            fields["flags"] = PackedEnumField(field.enums, layout=layout)
+            (error,) = check_packed_layouts(app_configs)
+            self.assertEqual(error.id, "django_enumfield.E002")
+
+    def test_members(self):
+        flags = PackedFlags(country=Country.SWEDEN, person=PersonStatus.DEAD)
+        self.assertEqual(flags.lamp, LampState.OFF)
+        self.assertEqual(flags.order, OrderStatus.NEW)
+        self.assertEqual(flags.person, PersonStatus.DEAD)
+        self.assertEqual(flags.country, Country.SWEDEN)
+        flags.save()
+
+        flags = PackedFlags.objects.get(pk=flags.pk)
+        self.assertEqual(
+            (flags.lamp, flags.person, flags.order, flags.country),
+            (LampState.OFF, PersonStatus.DEAD, OrderStatus.NEW, Country.SWEDEN),
+        )
+        flags.lamp = 1
+        flags.order = 1
+        flags.country = None
+        self.assertEqual(
+            (flags.lamp, flags.person, flags.order, flags.country),
+            (LampState.ON, PersonStatus.DEAD, OrderStatus.PAID, None),
+        )
+
+    def test_validation(self):
+        flags = PackedFlags.objects.create(order=OrderStatus.PAID)
+        with self.assertRaises(InvalidStatusOperationError):
+            flags.order = OrderStatus.NEW
+        self.assertEqual(flags.order, OrderStatus.PAID)
+        with self.assertRaises(InvalidStatusOperationError):
+            flags.lamp = 5
+        with self.assertRaises(TypeError):
+            flags.lamp = BeerState.FIZZY
+        flags.order = OrderStatus.SHIPPED
+        flags.save()
+
+        flags = PackedFlags.objects.get(pk=flags.pk)
+        with self.assertRaises(InvalidStatusOperationError):
+            flags.order = OrderStatus.CANCELLED
+
+    def test_raw_validation(self):
+        flags = PackedFlags.objects.create(order=OrderStatus.PAID)
+        field = PackedFlags._meta.get_field("flags")
+        order = field.packed_members["order"]
+        with self.assertRaises(InvalidStatusOperationError):
+            flags.flags = order.pack(flags.flags, OrderStatus.NEW)
+        flags.flags = order.pack(flags.flags, OrderStatus.SHIPPED)
+        self.assertEqual(flags.order, OrderStatus.SHIPPED)
+
+        # Unknown codes are not read as None
+        unknown = flags.flags | order.mask
+        with self.assertRaises(InvalidStatusOperationError):
+            flags.flags = unknown
+        PackedFlags.objects.filter(pk=flags.pk).update(flags=unknown)
+        flags = PackedFlags.objects.get(pk=flags.pk)
+        with self.assertRaises(InvalidStatusOperationError):
+            flags.order
+        with self.assertRaises(InvalidStatusOperationError):
+            list(PackedFlags.objects.values_list("flags__order", flat=True))
+
+        # Deferred
+        flags = PackedFlags.objects.create(country=Country.SWEDEN)
+        flags = PackedFlags.objects.defer("flags").get(pk=flags.pk)
+        self.assertEqual(flags.country, Country.SWEDEN)
+
+    def test_lookups(self):
+        PackedFlags.objects.create(lamp=LampState.ON, country=Country.SPAIN)
+        PackedFlags.objects.create(lamp=LampState.ON, country=Country.NORWAY)
+        PackedFlags.objects.create(order=OrderStatus.PAID, country=Country.NORWAY)
+
+        self.assertEqual(
+            PackedFlags.objects.filter(flags__lamp=LampState.ON).count(), 2
+        )
+        self.assertEqual(
+            PackedFlags.objects.filter(
+                flags__lamp=LampState.OFF, flags__country=Country.NORWAY
+            ).count(),
+            1,
+        )
+        self.assertEqual(
+            PackedFlags.objects.filter(
+                flags__country__in=[Country.SPAIN, "SWEDEN", 47]
+            ).count(),
+            3,
+        )
+        self.assertEqual(PackedFlags.objects.filter(flags__person=None).count(), 3)
+        self.assertEqual(
+            PackedFlags.objects.filter(flags__country__isnull=False).count(), 3
+        )
+        self.assertEqual(
+            sorted(PackedFlags.objects.values_list("flags__country", flat=True)),
+            [Country.SPAIN, Country.NORWAY, Country.NORWAY],
+        )
+        self.assertEqual(
+            PackedFlags.objects.filter(flags__order=F("flags__order")).count(), 3
+        )
+        with self.assertRaises(InvalidStatusOperationError):
+            PackedFlags.objects.filter(flags__lamp=5)
+
+    def test_deconstruct(self):
+        field = PackedFlags._meta.get_field("flags")
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(path, "django_enumfield.db.packed.PackedEnumField")
+        self.assertEqual(kwargs, {"enums": field.enums, "layout": field.get_layout()})
+        self.assertEqual(PackedEnumField(**kwargs).get_default(), field.get_default())
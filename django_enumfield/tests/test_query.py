@@ -0,0 +1,53 @@
+from django.db.models import F, Value
+from django.test import TestCase
+
+from django_enumfield.tests.models import Job, JobStatus
+
+
+class EnumValuesListTest(TestCase):
+    def setUp(self):
+        Job.objects.create(status=JobStatus.PENDING)  # result defaults to PENDING
+        Job.objects.create(status=JobStatus.DONE, result=JobStatus.DONE)
+        Job.objects.create(status=JobStatus.FAILED, result=JobStatus.FAILED)
+        self.queryset = Job.objects.order_by("pk")
+
+    def test_enum_values_list(self):
+        rows = list(self.queryset.enum_values_list("status", "result"))
+        self.assertEqual(rows, list(self.queryset.values_list("status", "result")))
+        self.assertEqual(
+            rows,
+            [
+                (JobStatus.PENDING, JobStatus.PENDING),
+                (JobStatus.DONE, JobStatus.DONE),
+                (JobStatus.FAILED, JobStatus.FAILED),
+            ],
+        )
+        self.assertIs(type(rows[0][0]), JobStatus)
+        self.assertEqual(
+            list(self.queryset.enum_values_list("status", flat=True)),
+            [JobStatus.PENDING, JobStatus.DONE, JobStatus.FAILED],
+        )
+        row = self.queryset.enum_values_list("pk", "status", named=True).first()
+        self.assertEqual(row.status, JobStatus.PENDING)
+        self.assertEqual(row.pk, self.queryset.first().pk)
+
+    def test_all_fields(self):
+        self.assertEqual(
+            list(self.queryset.enum_values_list()), list(self.queryset.values_list())
+        )
+
+    def test_iterator(self):
+        Job.objects.update(previous=F("status"))
+        Job.objects.filter(status=JobStatus.PENDING).update(previous=42)
+        queryset = self.queryset.enum_values_list("previous", "pk")
+        self.assertEqual(
+            [previous for previous, _ in queryset.iterator(chunk_size=2)],
+            [None, JobStatus.DONE, JobStatus.FAILED],
+        )
+
+    def test_annotations(self):
+        queryset = self.queryset.annotate(one=Value(1)).enum_values_list(
+            "one", "status"
+        )
+        self.assertEqual(list(queryset)[0], (1, JobStatus.PENDING))
+        self.assertEqual(list(queryset.none()), [])
@@ -0,0 +1,85 @@
+import json
+
+from django.test import TestCase
+from django.test.client import RequestFactory
+
+from django_enumfield.enum import Enum
+from django_enumfield.registry import EnumRegistry, registry
+from django_enumfield.tests.models import LabelBeer, PersonStatus
+from django_enumfield.views import enums_view
+
+
+class EnumRegistryTest(TestCase):
+    def test_subclasses_are_registered(self):
+        self.assertIn(PersonStatus, registry)
+        self.assertIs(
+            registry.get("django_enumfield.tests.models.LabelBeer"), LabelBeer
+        )
+        self.assertNotIn(Enum, registry)
+
+    def test_describe(self):
+        self.assertEqual(
+            registry.describe(PersonStatus)["transitions"],
+            {"0": [4], "1": [0], "2": [0, 1], "3": [2]},
+        )
+        description = registry.describe(LabelBeer)
+        self.assertEqual(description["name"], "LabelBeer")
+        self.assertIsNone(description["default"])
+        self.assertEqual(
+            description["members"][0],
+            {"value": 0, "name": "STELLA", "label": "Stella Artois"},
+        )
+
+    def test_export_is_cached(self):
+        exported = registry.export("en")
+        self.assertIs(registry.export("en"), exported)
+        enums = json.loads(exported.content.decode())["enums"]
+        self.assertIn("django_enumfield.tests.models.PersonStatus", enums)
+
+        class Registered(Enum):
+            ONE = 1
+
+        self.assertIsNot(registry.export("en"), exported)
+        self.assertNotEqual(registry.export("en").etag, exported.etag)
+
+    def test_export_skips_enums_without_members(self):
+        empty_registry = EnumRegistry()
+
+        class Abstract(Enum):
+            pass
+
+        empty_registry.register(Abstract)
+        self.assertEqual(empty_registry.export().content, b'{"enums":{}}')
+
+    def test_openapi_schema(self):
+        schema = registry.openapi_schema(LabelBeer)
+        self.assertEqual(schema["type"], "integer")
+        self.assertEqual(schema["enum"], [0, 1, 2])
+        self.assertEqual(schema["x-enum-varnames"], ["STELLA", "JUPILER", "TYSKIE"])
+        self.assertIn("0: Stella Artois", schema["description"])
+        schema["enum"] = None
+        self.assertEqual(registry.openapi_schema(LabelBeer)["enum"], [0, 1, 2])
+
+        schema = registry.openapi_schema(LabelBeer, named=True)
+        self.assertEqual(schema["type"], "string")
+        self.assertEqual(schema["enum"], ["STELLA", "JUPILER", "TYSKIE"])
+
+
+class EnumsViewTest(TestCase):
+    def test_conditional_get(self):
+        factory = RequestFactory()
+        response = enums_view(factory.get("/enums.json"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertIn("enums", json.loads(response.content.decode()))
+        self.assertEqual(response["Vary"], "Accept-Language")
+
+        response = enums_view(
+            factory.get("/enums.json", HTTP_IF_NONE_MATCH=response["ETag"])
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["Vary"], "Accept-Language")
+
+        response = enums_view(factory.post("/enums.json"))
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,85 @@
+from unittest import mock, skipIf
+
+import django
+from django.test import TestCase
+
+from django_enumfield.db.waiting import wait_for_state, wait_for_state_sync
+from django_enumfield.exceptions import UnreachableStateError
+from django_enumfield.tests.models import Person, PersonStatus
+
+
+class WaitForStateTest(TestCase):
+    def setUp(self):
+        self.person = Person.objects.create(status=PersonStatus.ALIVE)
+
+    def test_reached(self):
+        self.assertEqual(
+            wait_for_state_sync(self.person, "status", PersonStatus.ALIVE),
+            PersonStatus.ALIVE,
+        )
+
+    def test_polling(self):
+        delays = []
+        states = [PersonStatus.ALIVE, PersonStatus.DEAD]
+
+        def sleep(delay):
+            delays.append(delay)
+            Person.objects.filter(pk=self.person.pk).update(status=states.pop(0))
+
+        with mock.patch("django_enumfield.db.waiting.time.sleep", sleep):
+            # Three polls and two updates
+            with self.assertNumQueries(5) as queries:
+                value = wait_for_state_sync(
+                    self.person,
+                    Person._meta.get_field("status"),
+                    [PersonStatus.DEAD, PersonStatus.REANIMATED],
+                    interval=1,
+                    max_interval=1.5,
+                )
+        self.assertEqual(value, PersonStatus.DEAD)
+        self.assertTrue(
+            queries.captured_queries[0]["sql"].startswith(
+                'SELECT "tests_person"."status" FROM'
+            )
+        )
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0.5 <= delays[0] <= 1)
+        self.assertTrue(0.75 <= delays[1] <= 1.5)
+        # The instance is left as is.
+        self.assertEqual(self.person.status, PersonStatus.ALIVE)
+
+    def test_timeout(self):
+        with self.assertRaises(TimeoutError):
+            wait_for_state_sync(
+                self.person, "status", PersonStatus.DEAD, timeout=0.02, interval=0.01
+            )
+
+    def test_unreachable(self):
+        Person.objects.update(status=PersonStatus.REANIMATED)
+        with self.assertRaises(UnreachableStateError):
+            wait_for_state_sync(self.person, "status", "ALIVE")
+
+    def test_invalid_target(self):
+        with self.assertRaises(ValueError):
+            wait_for_state_sync(self.person, "status", 42)
+
+    def test_deleted(self):
+        Person.objects.all().delete()
+        with self.assertRaises(Person.DoesNotExist):
+            wait_for_state_sync(self.person, "status", PersonStatus.DEAD)
+
+    @skipIf(django.VERSION < (4, 1), "QuerySet.aupdate() needs Django 4.1")
+    async def test_async(self):
+        async def sleep(delay):
+            await Person.objects.filter(pk=self.person.pk).aupdate(
+                status=PersonStatus.DEAD
+            )
+
+        with mock.patch("django_enumfield.db.waiting.asyncio.sleep", sleep):
+            value = await wait_for_state(
+                self.person, "status", PersonStatus.DEAD, timeout=5
+            )
+        self.assertEqual(value, PersonStatus.DEAD)
+
+        with self.assertRaises(UnreachableStateError):
+            await wait_for_state(self.person, "status", PersonStatus.UNBORN)
@@ -0,0 +1,91 @@
+from django import forms
+from django.forms.renderers import BaseRenderer
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from django_enumfield.forms import widgets
+from django_enumfield.forms.widgets import (
+    EnumSelect,
+    EnumSelectMultiple,
+    _options_cache,
+    clear_cache,
+)
+from django_enumfield.tests.models import Beer, LabelBeer
+
+
+@override_settings(ENUMFIELD_FAST_SELECT=True)
+class EnumSelectTest(TestCase):
+    def setUp(self):
+        clear_cache()
+
+    def assertRendersLikeDjango(self, widget_class, django_class, choices, value):
+        attrs = {"id": "id_beer", "required": True, "class": '"quoted"'}
+        self.assertEqual(
+            widget_class(choices=choices).render("beer", value, attrs),
+            django_class(choices=choices).render("beer", value, attrs),
+        )
+
+    def test_render_matches_select(self):
+        for choices in (LabelBeer.choices(), LabelBeer.choices(blank=True)):
+            for value in (None, LabelBeer.TYSKIE.value, "1"):
+                self.assertRendersLikeDjango(EnumSelect, forms.Select, choices, value)
+            self.assertRendersLikeDjango(
+                EnumSelectMultiple, forms.SelectMultiple, choices, [0, 2]
+            )
+
+    def test_options_are_cached(self):
+        widget = EnumSelect(choices=LabelBeer.choices())
+        options = widget.get_rendered_options()
+        self.assertEqual(len(_options_cache), 1)
+        self.assertIs(
+            EnumSelect(choices=LabelBeer.choices()).get_rendered_options(), options
+        )
+        self.assertIn('<option value="0" selected>', widget.render("beer", 0))
+
+        with translation.override("sv"):
+            EnumSelect(choices=LabelBeer.choices()).get_rendered_options()
+        self.assertEqual(len(_options_cache), 2)
+
+    def test_options_cache_is_bounded(self):
+        max_cached, widgets.MAX_CACHED_OPTIONS = widgets.MAX_CACHED_OPTIONS, 2
+        try:
+            for blank in (False, True):
+                EnumSelect(choices=LabelBeer.choices(blank=blank)).render("beer", 0)
+            with translation.override("sv"):
+                EnumSelect(choices=LabelBeer.choices()).render("beer", 0)
+            self.assertEqual(len(_options_cache), 2)
+        finally:
+            widgets.MAX_CACHED_OPTIONS = max_cached
+
+    def test_opt_in(self):
+        with override_settings(ENUMFIELD_FAST_SELECT=False):
+            EnumSelect(choices=LabelBeer.choices()).render("beer", 0)
+            self.assertEqual(len(_options_cache), 0)
+            EnumSelect(choices=LabelBeer.choices(), fast_render=True).render("beer", 0)
+            self.assertEqual(len(_options_cache), 1)
+
+    def test_custom_renderer(self):
+        class CustomRenderer(BaseRenderer):
+            def render(self, template_name, context, request=None):
+                return "custom"
+
+        widget = EnumSelect(choices=LabelBeer.choices())
+        self.assertEqual(widget.render("beer", 0, renderer=CustomRenderer()), "custom")
+        self.assertEqual(len(_options_cache), 0)
+
+    def test_fallback(self):
+        widget = EnumSelect(choices=[(1, "One"), (2, "Two")])
+        self.assertIsNone(widget.get_rendered_options())
+        self.assertIn('<option value="2" selected>Two</option>', widget.render("n", 2))
+
+    def test_model_form_widget(self):
+        class BeerForm(forms.ModelForm):
+            class Meta:
+                model = Beer
+                fields = ("label", "state")
+
+        form = BeerForm(instance=Beer(label=LabelBeer.TYSKIE))
+        self.assertIsInstance(form.fields["label"].widget, EnumSelect)
+        self.assertIn(
+            '<option value="2" selected>Browar Tyskie</option>', str(form["label"])
+        )
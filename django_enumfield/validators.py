@@ -5,10 +5,13 @@ from django.utils.translation import gettext as _
 from django_enumfield.exceptions import InvalidStatusOperationError
 
 
-def validate_valid_transition(enum, from_value, to_value):
+def validate_valid_transition(enum, from_value, to_value, field=None):
     """
     Validate that to_value is a valid choice and that to_value is
     a valid transition from from_value.
+
+    field is the attname of the validated field, instrumentation counts
+    validations per field.
     """
     validate_available_choice(enum, to_value)
     if not enum.is_valid_transition(from_value, to_value):
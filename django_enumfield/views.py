@@ -0,0 +1,24 @@
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.translation import get_language
+from django.views.decorators.http import require_safe
+
+from django_enumfield.registry import registry
+
+
+@require_safe
+def enums_view(request):
+    """Serve every registered enum as JSON in the active language, with a
+    strong ETag so that clients can revalidate with If-None-Match.
+
+    Usage:
+        path("enums.json", enums_view)
+    """
+    exported = registry.export(get_language())
+    response = get_conditional_response(request, etag=exported.etag)
+    if response is None:
+        response = HttpResponse(exported.content, content_type="application/json")
+    response["ETag"] = exported.etag
+    # Labels are in the language of the request.
+    patch_vary_headers(response, ("Accept-Language",))
+    return response
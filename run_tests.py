@@ -55,6 +55,7 @@ def main():
                 "django.contrib.sessions",
                 "django.contrib.messages",
                 "django_enumfield",
+                "django_enumfield.contrib.counters",
                 "django_enumfield.tests",
             ],
             TEMPLATES=[